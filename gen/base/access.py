@@ -31,4 +31,9 @@ def is_admin_user(user) -> bool:
         return False
     if getattr(user, "is_superuser", False):
         return True
-    return is_admin_email(getattr(user, "email", ""))
+    # Views, decorators and the context processor all ask within one request; look it up once per user object.
+    cached = getattr(user, "_is_admin_cache", None)
+    if cached is None:
+        cached = is_admin_email(getattr(user, "email", ""))
+        user._is_admin_cache = cached
+    return cached
@@ -1,11 +1,17 @@
+from django.conf import settings
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 
 from .models import (
     AdminEmailAccess,
     Article,
     ArticleImage,
     ArticleSubmission,
+    DailyMetrics,
     EmailAuthCode,
+    MediaBlob,
     OrderRequest,
     Product,
     ProductCategory,
@@ -16,6 +22,42 @@ from .models import (
 )
 
 
+class EstimatedCountPaginator(Paginator):
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, "query", None)
+        if query is not None and not query.where:
+            estimate = _estimated_rows(self.object_list.model, self.object_list.db)
+            if estimate >= int(getattr(settings, "ADMIN_ESTIMATED_COUNT_THRESHOLD", 10000)):
+                return estimate
+        return super().count
+
+
+def _estimated_rows(model, using: str) -> int:
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return 0
+    with connection.cursor() as cursor:
+        # Planner statistics: -1 until the table has been analyzed.
+        cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [model._meta.db_table])
+        row = cursor.fetchone()
+    return max(0, row[0]) if row else 0
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    date_hierarchy = "created_at"
+    list_per_page = 50
+
+    def get_search_results(self, request, queryset, search_term):
+        results, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        term = search_term.strip().lstrip("#")
+        if term.isdigit() and len(term) <= 18:
+            results |= queryset.filter(pk=int(term))
+        return results, may_have_duplicates
+
+
 class ArticleImageInline(admin.TabularInline):
     model = ArticleImage
     extra = 0
@@ -70,18 +112,22 @@ class ArticleAdmin(admin.ModelAdmin):
 
 
 @admin.register(ArticleSubmission)
-class ArticleSubmissionAdmin(admin.ModelAdmin):
+class ArticleSubmissionAdmin(LargeTableAdmin):
     list_display = ("id", "title", "user", "status", "created_at")
-    list_filter = ("status", "created_at")
-    search_fields = ("title", "summary", "content", "user__email")
+    list_filter = ("status",)
+    list_select_related = ("user",)
+    search_fields = ("^title", "=user__email")
+    raw_id_fields = ("user", "reviewer", "approved_article")
     inlines = [SubmissionImageInline]
 
 
 @admin.register(OrderRequest)
-class OrderRequestAdmin(admin.ModelAdmin):
-    list_display = ("id", "name", "phone", "contact_method", "status", "created_at")
-    list_filter = ("status", "contact_method", "created_at")
-    search_fields = ("name", "phone", "email", "message", "article__title")
+class OrderRequestAdmin(LargeTableAdmin):
+    list_display = ("id", "name", "phone", "contact_method", "status", "article", "created_at")
+    list_filter = ("status", "contact_method")
+    list_select_related = ("article",)
+    search_fields = ("^name", "=phone", "=email")
+    raw_id_fields = ("user", "article")
 
 
 @admin.register(ProductCategory)
@@ -100,7 +146,26 @@ class ProductAdmin(admin.ModelAdmin):
 
 
 @admin.register(ShopPreorder)
-class ShopPreorderAdmin(admin.ModelAdmin):
+class ShopPreorderAdmin(LargeTableAdmin):
     list_display = ("id", "user", "product", "desired_item", "status", "created_at")
-    list_filter = ("status", "created_at")
-    search_fields = ("desired_item", "phone", "email", "user__email")
+    list_filter = ("status",)
+    list_select_related = ("user", "product")
+    search_fields = ("^desired_item", "=phone", "=email", "=user__email")
+    raw_id_fields = ("user", "category", "product")
+
+
+@admin.register(MediaBlob)
+class MediaBlobAdmin(admin.ModelAdmin):
+    list_display = ("name", "size", "ref_count", "created_at")
+    list_filter = ("created_at",)
+    search_fields = ("name", "sha256")
+    readonly_fields = ("name", "sha256", "size", "ref_count", "created_at")
+
+
+@admin.register(DailyMetrics)
+class DailyMetricsAdmin(admin.ModelAdmin):
+    list_display = ("date", "metric", "dimension", "value")
+    list_filter = ("metric",)
+    search_fields = ("dimension",)
+    date_hierarchy = "date"
+    readonly_fields = ("date", "metric", "dimension", "value")
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.utils import timezone
+
+from .storage import add_blob_references
+
+
+@dataclass
+class ApprovalResult:
+    approved: list[int] = field(default_factory=list)
+    skipped: list[int] = field(default_factory=list)
+    missing: list[int] = field(default_factory=list)
+
+    def summary(self) -> str:
+        lines = [f"Заявки на статьи: одобрено {len(self.approved)}"]
+        if self.approved:
+            lines.append("Опубликованы: " + ", ".join(f"#{pk}" for pk in self.approved))
+        if self.skipped:
+            lines.append("Уже одобрены: " + ", ".join(f"#{pk}" for pk in self.skipped))
+        if self.missing:
+            lines.append("Не найдены: " + ", ".join(f"#{pk}" for pk in self.missing))
+        return "\n".join(lines)
+
+
+def approve_submissions(ids: list[int], reviewer, comment: str = "") -> ApprovalResult:
+    from .models import Article, ArticleImage, ArticleSubmission, SubmissionImage
+
+    # A repeated id would approve the same submission twice inside one transaction.
+    ids = list(dict.fromkeys(ids))
+    result = ApprovalResult()
+    with transaction.atomic():
+        # Row locks make a repeated click wait for the first approval and then see it as done.
+        locked = {
+            submission.pk: submission
+            for submission in ArticleSubmission.objects.select_for_update().filter(pk__in=ids)
+        }
+        pending = []
+        for pk in ids:
+            submission = locked.get(pk)
+            if submission is None:
+                result.missing.append(pk)
+            elif submission.status == ArticleSubmission.STATUS_APPROVED and submission.approved_article_id:
+                result.skipped.append(pk)
+            else:
+                pending.append(submission)
+        if not pending:
+            return result
+
+        images = defaultdict(list)
+        rows = (
+            SubmissionImage.objects.filter(submission__in=pending)
+            .order_by("submission_id", "sort_order", "pk")
+            .values_list("submission_id", "image")
+        )
+        for submission_id, name in rows:
+            images[submission_id].append(name)
+
+        now = timezone.now()
+        new_images = []
+        for submission in pending:
+            article = Article.objects.create(
+                template_key="custom",
+                title=submission.title,
+                summary=submission.summary,
+                content=submission.content,
+                is_published=True,
+                author=reviewer,
+            )
+            new_images += [
+                ArticleImage(article=article, image=name, sort_order=idx)
+                for idx, name in enumerate(images[submission.pk])
+            ]
+            submission.status = ArticleSubmission.STATUS_APPROVED
+            submission.reviewer = reviewer
+            submission.review_comment = comment
+            submission.approved_article = article
+            submission.updated_at = now
+            result.approved.append(submission.pk)
+
+        ArticleImage.objects.bulk_create(new_images, batch_size=500)
+        # bulk_create skips the post_save receiver that counts blob references.
+        add_blob_references(image.image.name for image in new_images)
+        ArticleSubmission.objects.bulk_update(
+            pending,
+            ["status", "reviewer", "review_comment", "approved_article", "updated_at"],
+            batch_size=500,
+        )
+    return result
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import posixpath
+import re
+from pathlib import Path
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.template.loader import get_template
+
+STRING_RE = re.compile(r"\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*'")
+COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+CLASS_ATTR_RE = re.compile(r"""class\s*=\s*["']([^"']*)["']""")
+ID_ATTR_RE = re.compile(r"""id\s*=\s*["']([^"']*)["']""")
+TEMPLATE_SYNTAX_RE = re.compile(r"\{[{%].*?[%}]\}", re.S)
+SELECTOR_TOKEN_RE = re.compile(r"([.#])(-?[_a-zA-Z][\w-]*)")
+CONTENT_BLOCK_RE = re.compile(r"\{%\s*block\s+content\s*%\}")
+
+
+def bundle_name(key: str) -> str:
+    return f"base/css/bundle-{key}.css"
+
+
+def critical_name(family: str) -> str:
+    return f"base/css/critical-{family}.css"
+
+
+def minify_css(css: str) -> str:
+    strings: list[str] = []
+
+    def _stash(match: re.Match) -> str:
+        strings.append(match.group(0))
+        return f"\x00{len(strings) - 1}\x00"
+
+    css = COMMENT_RE.sub("", css)
+    css = STRING_RE.sub(_stash, css)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    css = css.replace(";}", "}")
+    css = re.sub(r"\x00(\d+)\x00", lambda m: strings[int(m.group(1))], css)
+    return css.strip()
+
+
+def _split_rules(css: str) -> list[tuple[str, str]]:
+    rules: list[tuple[str, str]] = []
+    depth = 0
+    start = 0
+    prelude = ""
+    for idx, char in enumerate(css):
+        if char == "{":
+            if depth == 0:
+                prelude = css[start:idx].strip()
+                start = idx + 1
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                rules.append((prelude, css[start:idx]))
+                start = idx + 1
+    return rules
+
+
+def _selector_used(selector: str, tokens: set[str]) -> bool:
+    return all(f"{kind}{name}" in tokens for kind, name in SELECTOR_TOKEN_RE.findall(selector))
+
+
+def extract_critical(css: str, tokens: set[str]) -> str:
+    output: list[str] = []
+    for prelude, body in _split_rules(minify_css(css)):
+        if prelude.startswith("@media") or prelude.startswith("@supports"):
+            inner = extract_critical(body, tokens)
+            if inner:
+                output.append(f"{prelude}{{{inner}}}")
+        elif prelude.startswith("@"):
+            output.append(f"{prelude}{{{body}}}")
+        else:
+            selectors = [item for item in prelude.split(",") if _selector_used(item, tokens)]
+            if selectors:
+                output.append(f"{','.join(selectors)}{{{body}}}")
+    return "".join(output)
+
+
+def _template_tokens(template_name: str, fold_chars: int | None) -> set[str]:
+    source = Path(get_template(template_name).origin.name).read_text(encoding="utf-8")
+    match = CONTENT_BLOCK_RE.search(source)
+    if template_name == settings.CRITICAL_CSS_BASE_TEMPLATE:
+        # Only the layout chrome above the page content counts as above the fold.
+        source = source[: match.start()] if match else source
+    elif match and fold_chars:
+        source = source[match.end() : match.end() + fold_chars]
+    source = TEMPLATE_SYNTAX_RE.sub(" ", source)
+    tokens: set[str] = set()
+    for value in CLASS_ATTR_RE.findall(source):
+        tokens.update(f".{item}" for item in value.split())
+    for value in ID_ATTR_RE.findall(source):
+        tokens.update(f"#{item}" for item in value.split())
+    return tokens
+
+
+def _absolute_urls(css: str, name: str) -> str:
+    # Critical CSS is inlined into pages, so relative urls must become /static/ ones.
+    source_dir = posixpath.dirname(name)
+    return re.sub(
+        r"url\((['\"]?)(?!/|data:|https?:|#)([^'\")]+)\1\)",
+        lambda m: (
+            f"url({m.group(1)}{settings.STATIC_URL}"
+            f"{posixpath.normpath(posixpath.join(source_dir, m.group(2)))}{m.group(1)})"
+        ),
+        css,
+    )
+
+
+def build_css_bundles(storage) -> list[str]:
+    written: list[str] = []
+    sources: dict[str, str] = {}
+    for key, names in settings.CSS_BUNDLES.items():
+        parts = []
+        for name in names:
+            if name not in sources:
+                with storage.open(name) as fh:
+                    sources[name] = _absolute_urls(fh.read().decode("utf-8"), name)
+            parts.append(sources[name])
+        written.append(_save(storage, bundle_name(key), minify_css("\n".join(parts))))
+
+    fold_chars = settings.CRITICAL_CSS_FOLD_CHARS
+    base_tokens = _template_tokens(settings.CRITICAL_CSS_BASE_TEMPLATE, None)
+    for family, config in settings.CRITICAL_CSS_PAGES.items():
+        tokens = base_tokens | _template_tokens(config["template"], fold_chars)
+        css = "\n".join(sources[name] for name in settings.CSS_BUNDLES[config["bundle"]])
+        written.append(_save(storage, critical_name(family), extract_critical(css, tokens)))
+    return written
+
+
+def _save(storage, name: str, content: str) -> str:
+    if storage.exists(name):
+        storage.delete(name)
+    storage.save(name, ContentFile(content.encode("utf-8")))
+    return name
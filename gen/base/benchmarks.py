@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import json
+import os
+import platform
+import statistics
+import time
+from dataclasses import dataclass
+from itertools import count
+from pathlib import Path
+from typing import Callable
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+BASELINE_DIR = Path(settings.BASE_DIR) / "benchmarks"
+DEFAULT_TOLERANCE = 0.25
+# Sub-millisecond lookups jitter by more than 25% between runs; ignore smaller absolute changes.
+MIN_REGRESSION_MS = 0.5
+MAX_ITERATIONS = 2000
+BENCH_CHAT_ID = 777000
+
+
+class Rollback(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    # setup() runs untimed and returns the argument passed to run().
+    setup: Callable[[], object]
+    run: Callable[[object], object]
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    samples: list[float]
+
+    def as_dict(self) -> dict:
+        ordered = sorted(self.samples)
+        p95 = ordered[max(0, round(0.95 * len(ordered)) - 1)]
+        median = statistics.median(ordered)
+        return {
+            "iterations": len(ordered),
+            "min_ms": round(ordered[0] * 1000, 3),
+            "median_ms": round(median * 1000, 3),
+            "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+            "p95_ms": round(p95 * 1000, 3),
+            "stdev_ms": round(statistics.pstdev(ordered) * 1000, 3),
+            "ops_per_s": round(1 / median, 1) if median else 0.0,
+        }
+
+
+def machine_info() -> dict:
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "cpus": os.cpu_count(),
+        "hasher": settings.PASSWORD_HASHERS[0].rsplit(".", 1)[-1],
+    }
+
+
+def baseline_path(vendor: str | None = None) -> Path:
+    return BASELINE_DIR / f"auth-{vendor or connection.vendor}.json"
+
+
+def auth_benchmarks() -> list[Benchmark]:
+    from .models import EmailAuthCode, TelegramAuthCode
+    from .views import _get_or_create_user_by_email
+
+    serial = count()
+
+    def email() -> str:
+        return f"bench.{next(serial)}@example.com"
+
+    def issued_email_code(_=None):
+        return EmailAuthCode.issue_code(email=email(), requested_ip="127.0.0.1")
+
+    def issued_telegram_code(_=None):
+        return TelegramAuthCode.issue_code(email=email(), chat_id=BENCH_CHAT_ID)
+
+    existing = email()
+
+    def existing_user():
+        _get_or_create_user_by_email(existing)
+        return existing
+
+    return [
+        Benchmark("email_issue_code", email, lambda address: EmailAuthCode.issue_code(email=address)),
+        Benchmark("email_verify_success", issued_email_code, lambda issued: issued[0].verify_code(issued[1])),
+        Benchmark("email_verify_failure", issued_email_code, lambda issued: issued[0].verify_code("wrong!")),
+        Benchmark(
+            "telegram_issue_code",
+            email,
+            lambda address: TelegramAuthCode.issue_code(email=address, chat_id=BENCH_CHAT_ID),
+        ),
+        Benchmark("telegram_verify_success", issued_telegram_code, lambda issued: issued[0].verify_code(issued[1])),
+        Benchmark("telegram_verify_failure", issued_telegram_code, lambda issued: issued[0].verify_code("wrong!")),
+        Benchmark("get_or_create_user_existing", existing_user, _get_or_create_user_by_email),
+        Benchmark("get_or_create_user_new", email, _get_or_create_user_by_email),
+    ]
+
+
+def _seed_background_codes(rows: int) -> None:
+    # Realistic tables: the issue/verify queries filter by email among many old codes.
+    from .models import EmailAuthCode, TelegramAuthCode
+
+    stale = {"code_hash": "!", "expires_at": timezone.now(), "is_used": True}
+    EmailAuthCode.objects.bulk_create(
+        [EmailAuthCode(email=f"old.{idx}@example.com", **stale) for idx in range(rows)],
+        batch_size=1000,
+    )
+    TelegramAuthCode.objects.bulk_create(
+        [TelegramAuthCode(email=f"old.{idx}@example.com", chat_id=idx, **stale) for idx in range(rows)],
+        batch_size=1000,
+    )
+
+
+def run_benchmarks(
+    names: list[str] | None = None,
+    *,
+    iterations: int = 20,
+    min_time: float = 1.0,
+    warmup: int = 2,
+    background_rows: int = 2000,
+) -> dict[str, BenchmarkResult]:
+    results: dict[str, BenchmarkResult] = {}
+    # Everything runs in one transaction that is rolled back, so the database is left untouched.
+    try:
+        with transaction.atomic():
+            _seed_background_codes(background_rows)
+            for bench in auth_benchmarks():
+                if names and bench.name not in names:
+                    continue
+                for _ in range(warmup):
+                    bench.run(bench.setup())
+                # Fast benchmarks keep sampling until min_time so their median is stable.
+                samples: list[float] = []
+                while len(samples) < iterations or (sum(samples) < min_time and len(samples) < MAX_ITERATIONS):
+                    argument = bench.setup()
+                    started = time.perf_counter()
+                    bench.run(argument)
+                    samples.append(time.perf_counter() - started)
+                results[bench.name] = BenchmarkResult(bench.name, samples)
+            raise Rollback
+    except Rollback:
+        pass
+    return results
+
+
+def compare_to_baseline(
+    current: dict[str, dict], baseline: dict[str, dict], tolerance: float
+) -> list[tuple[str, str, bool]]:
+    rows = []
+    for name, stats in current.items():
+        reference = baseline.get(name)
+        if not reference:
+            rows.append((name, f"{stats['median_ms']} ms (no baseline)", False))
+            continue
+        old, new = reference["median_ms"], stats["median_ms"]
+        change = (new - old) / old if old else 0.0
+        regressed = change > tolerance and new - old >= MIN_REGRESSION_MS
+        rows.append((name, f"{new} ms vs {old} ms ({change * 100:+.1f}%)", regressed))
+    return rows
+
+
+def load_baseline(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_baseline(path: Path, results: dict[str, dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"vendor": connection.vendor, "machine": machine_info(), "benchmarks": results}
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.utils import timezone
+
+from .metrics import record_status_changes
+
+BULK_MAX_IDS = 200
+ID_SEPARATOR_RE = re.compile(r"[\s,;]+")
+
+
+@dataclass
+class BulkStatusResult:
+    status: str
+    updated: list[int] = field(default_factory=list)
+    missing: list[int] = field(default_factory=list)
+
+    def summary(self, label: str, status_label: str) -> str:
+        lines = [f"{label}: {len(self.updated)} -> {status_label}"]
+        if self.updated:
+            lines.append("Обновлены: " + ", ".join(f"#{pk}" for pk in self.updated))
+        if self.missing:
+            lines.append("Не найдены: " + ", ".join(f"#{pk}" for pk in self.missing))
+        return "\n".join(lines)
+
+
+def parse_id_list(values) -> list[int]:
+    if isinstance(values, str):
+        values = [values]
+    ids: list[int] = []
+    for value in values or []:
+        for chunk in ID_SEPARATOR_RE.split(str(value).strip()):
+            if not chunk:
+                continue
+            pk = int(chunk)
+            if pk <= 0:
+                raise ValueError(chunk)
+            if pk not in ids:
+                ids.append(pk)
+    return ids
+
+
+def bulk_set_status(model, ids: list[int], status: str) -> BulkStatusResult:
+    result = BulkStatusResult(status=status)
+    if not ids:
+        return result
+    with transaction.atomic():
+        rows = list(
+            model.objects.select_for_update().filter(pk__in=ids).values_list("pk", "created_at", "status")
+        )
+        found = {pk for pk, _created_at, _status in rows}
+        # queryset.update() skips auto_now and signals, so both are handled here.
+        model.objects.filter(pk__in=found).update(status=status, updated_at=timezone.now())
+        record_status_changes(model, [(created_at, old) for _pk, created_at, old in rows], status)
+    result.updated = [pk for pk in ids if pk in found]
+    result.missing = [pk for pk in ids if pk not in found]
+    return result
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, F, Q
+from django.utils.http import urlencode
+
+CATALOG_VERSION_KEY = "shop:catalog:version"
+ORDERINGS = {
+    "name": ("Название", ("name", "pk")),
+    "price": ("Сначала дешевле", (F("price").asc(nulls_last=True), "name", "pk")),
+    "-price": ("Сначала дороже", (F("price").desc(nulls_last=True), "name", "pk")),
+}
+NO_PRICE = "none"
+
+
+@dataclass(frozen=True)
+class PriceBucket:
+    key: str
+    label: str
+    low: Decimal | None
+    high: Decimal | None
+
+    def q(self) -> Q:
+        if self.key == NO_PRICE:
+            return Q(price__isnull=True)
+        query = Q(price__isnull=False)
+        if self.low is not None:
+            query &= Q(price__gte=self.low)
+        if self.high is not None:
+            query &= Q(price__lt=self.high)
+        return query
+
+
+def price_buckets() -> list[PriceBucket]:
+    bounds = [Decimal(str(item)) for item in getattr(settings, "SHOP_PRICE_BUCKETS", [100, 500, 2000])]
+    buckets = []
+    low = None
+    for high in [*bounds, None]:
+        if low is None:
+            key, label = f"0-{high}", f"до {high}"
+        elif high is None:
+            key, label = f"{low}-", f"от {low}"
+        else:
+            key, label = f"{low}-{high}", f"{low}–{high}"
+        buckets.append(PriceBucket(key, f"{label} BYN", low, high))
+        low = high
+    buckets.append(PriceBucket(NO_PRICE, "Цена по запросу", None, None))
+    return buckets
+
+
+def catalog_version() -> str:
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        cache.add(CATALOG_VERSION_KEY, str(time.time_ns()), None)
+        version = cache.get(CATALOG_VERSION_KEY)
+    return version
+
+
+def bump_catalog_version() -> None:
+    cache.set(CATALOG_VERSION_KEY, str(time.time_ns()), None)
+
+
+def _cache_timeout() -> int:
+    return int(getattr(settings, "SHOP_CACHE_TIMEOUT", 60 * 60))
+
+
+def facet_matrix() -> dict:
+    from .models import Product, ProductCategory
+
+    key = f"shop:facets:{catalog_version()}"
+    data = cache.get(key)
+    if data is not None:
+        return data
+
+    buckets = price_buckets()
+    # One aggregate over active products: a row per category with a count per price bucket.
+    rows = (
+        Product.objects.filter(is_active=True, category__is_active=True)
+        .values("category_id")
+        .annotate(
+            total=Count("pk"),
+            **{f"b{idx}": Count("pk", filter=bucket.q()) for idx, bucket in enumerate(buckets)},
+        )
+        .order_by()
+    )
+    counts = {
+        row["category_id"]: {
+            "total": row["total"],
+            **{bucket.key: row[f"b{idx}"] for idx, bucket in enumerate(buckets)},
+        }
+        for row in rows
+    }
+    categories = list(
+        ProductCategory.objects.filter(is_active=True).order_by("name").values("id", "name", "slug")
+    )
+    data = {"categories": categories, "counts": counts}
+    cache.set(key, data, _cache_timeout())
+    return data
+
+
+@dataclass
+class CatalogQuery:
+    category: dict | None
+    bucket: PriceBucket | None
+    ordering: str
+    page: int
+
+    @classmethod
+    def from_params(cls, params, categories: list[dict]) -> "CatalogQuery":
+        slug = (params.get("category") or "").strip()
+        category = next((item for item in categories if item["slug"] == slug), None)
+        bucket_key = (params.get("price") or "").strip()
+        bucket = next((item for item in price_buckets() if item.key == bucket_key), None)
+        ordering = params.get("order") or "name"
+        if ordering not in ORDERINGS:
+            ordering = "name"
+        try:
+            page = max(1, int(params.get("page") or 1))
+        except ValueError:
+            page = 1
+        return cls(category, bucket, ordering, page)
+
+    def url(self, **overrides) -> str:
+        values = {
+            "category": self.category["slug"] if self.category else "",
+            "price": self.bucket.key if self.bucket else "",
+            "order": self.ordering if self.ordering != "name" else "",
+            "page": "",
+        }
+        values.update({key: value or "" for key, value in overrides.items()})
+        query = urlencode({key: value for key, value in values.items() if value})
+        return f"?{query}" if query else "?"
+
+
+def catalog_page(params) -> dict:
+    from .models import Product
+
+    facets = facet_matrix()
+    query = CatalogQuery.from_params(params, facets["categories"])
+    counts = facets["counts"]
+    bucket_key = query.bucket.key if query.bucket else "total"
+
+    category_facets = [
+        {
+            **item,
+            "count": counts.get(item["id"], {}).get(bucket_key, 0),
+            "url": query.url(category=item["slug"]),
+            "selected": query.category is not None and query.category["id"] == item["id"],
+        }
+        for item in facets["categories"]
+    ]
+    scope = [counts[query.category["id"]]] if query.category and query.category["id"] in counts else []
+    if not query.category:
+        scope = list(counts.values())
+    price_facets = [
+        {
+            "key": bucket.key,
+            "label": bucket.label,
+            "count": sum(row[bucket.key] for row in scope),
+            "url": query.url(price=bucket.key),
+            "selected": query.bucket is not None and query.bucket.key == bucket.key,
+        }
+        for bucket in price_buckets()
+    ]
+    # The facet matrix already knows how many rows match, so no COUNT(*) is needed for paging.
+    total = sum(row[bucket_key] for row in scope)
+    page_size = int(getattr(settings, "SHOP_PAGE_SIZE", 24))
+    num_pages = max(1, -(-total // page_size))
+    page = min(query.page, num_pages)
+    offset = (page - 1) * page_size
+
+    key = (
+        f"shop:page:{catalog_version()}:{query.category['id'] if query.category else '-'}:"
+        f"{bucket_key}:{query.ordering}:{page}:{page_size}"
+    )
+    products = cache.get(key)
+    if products is None:
+        queryset = Product.objects.filter(is_active=True, category__is_active=True).select_related("category")
+        if query.category:
+            queryset = queryset.filter(category_id=query.category["id"])
+        if query.bucket:
+            queryset = queryset.filter(query.bucket.q())
+        products = list(queryset.order_by(*ORDERINGS[query.ordering][1])[offset : offset + page_size])
+        cache.set(key, products, _cache_timeout())
+
+    return {
+        "products": products,
+        "total": total,
+        "all_count": sum(row["total"] for row in counts.values()),
+        "all_url": query.url(category=""),
+        "any_price_url": query.url(price=""),
+        "selected_category": query.category,
+        "selected_bucket": query.bucket,
+        "category_facets": category_facets,
+        "price_facets": price_facets,
+        "orderings": [
+            {"key": key, "label": label, "url": query.url(order=key), "selected": key == query.ordering}
+            for key, (label, _fields) in ORDERINGS.items()
+        ],
+        "page": page,
+        "num_pages": num_pages,
+        "prev_url": query.url(page=str(page - 1)) if page > 1 else "",
+        "next_url": query.url(page=str(page + 1)) if page < num_pages else "",
+        "query": query,
+    }
+
+
+def search_products(term: str, category_id: int | None = None, limit: int | None = None) -> list[dict]:
+    from .models import Product
+
+    term = Product.normalize_search(term)
+    if len(term) < int(getattr(settings, "SHOP_AUTOCOMPLETE_MIN_CHARS", 2)):
+        return []
+    limit = limit or int(getattr(settings, "SHOP_AUTOCOMPLETE_LIMIT", 10))
+    # Prefix match on the indexed search_name column (LIKE 'term%' can use the index).
+    queryset = Product.objects.filter(
+        is_active=True, category__is_active=True, search_name__startswith=term
+    )
+    if category_id:
+        queryset = queryset.filter(category_id=category_id)
+    rows = queryset.order_by("search_name", "pk").values(
+        "pk", "name", "price", "category_id", "category__name"
+    )[:limit]
+    return [
+        {
+            "id": row["pk"],
+            "name": row["name"],
+            "price": str(row["price"]) if row["price"] is not None else None,
+            "category_id": row["category_id"],
+            "category": row["category__name"],
+        }
+        for row in rows
+    ]
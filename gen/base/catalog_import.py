@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import csv
+import io
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from pathlib import PurePath
+from typing import IO, Iterator
+
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+from django.utils.text import slugify
+
+from .catalog import bump_catalog_version
+
+IMPORT_BATCH_SIZE = 500
+PRODUCT_FIELDS = ("category_id", "name", "description", "price", "is_active")
+COLUMN_ALIASES = {
+    "category": {"category", "категория", "раздел"},
+    "category_slug": {"category_slug", "slug категории"},
+    "name": {"name", "название", "наименование", "товар"},
+    "slug": {"slug", "sku", "артикул"},
+    "description": {"description", "описание"},
+    "price": {"price", "цена", "стоимость"},
+    "is_active": {"is_active", "active", "активен", "в наличии"},
+}
+TRUE_VALUES = {"1", "true", "yes", "да", "+", "y"}
+# Product.price is DecimalField(max_digits=12, decimal_places=2).
+MAX_PRICE = Decimal("9999999999.99")
+# Excel on Russian-locale Windows saves CSV as cp1251; most suppliers send that.
+CSV_ENCODINGS = ("utf-8-sig", "cp1251")
+
+TRANSLIT = str.maketrans(
+    {
+        "а": "a", "б": "b", "в": "v", "г": "g", "д": "d", "е": "e", "ё": "e", "ж": "zh",
+        "з": "z", "и": "i", "й": "y", "к": "k", "л": "l", "м": "m", "н": "n", "о": "o",
+        "п": "p", "р": "r", "с": "s", "т": "t", "у": "u", "ф": "f", "х": "h", "ц": "c",
+        "ч": "ch", "ш": "sh", "щ": "sch", "ъ": "", "ы": "y", "ь": "", "э": "e", "ю": "yu",
+        "я": "ya",
+    }
+)
+
+
+class CatalogImportError(Exception):
+    pass
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deactivated: int = 0
+    categories_created: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    def summary(self) -> str:
+        return (
+            f"создано {self.created}, обновлено {self.updated}, без изменений {self.unchanged}, "
+            f"скрыто {self.deactivated}, новых категорий {self.categories_created}, ошибок {len(self.errors)}"
+        )
+
+
+def catalog_slug(value: str, max_length: int) -> str:
+    return slugify((value or "").lower().translate(TRANSLIT))[:max_length].strip("-")
+
+
+def _parse_price(raw) -> Decimal | None:
+    if raw is None or raw == "":
+        return None
+    if isinstance(raw, (int, float, Decimal)):
+        cleaned = str(raw)
+    else:
+        cleaned = str(raw).replace("\xa0", "").replace(" ", "").replace("₽", "").replace("руб.", "")
+    try:
+        price = Decimal(cleaned.replace(",", ".")).quantize(Decimal("0.01"))
+    except InvalidOperation as exc:
+        raise ValueError(f"некорректная цена {raw!r}") from exc
+    if not price.is_finite() or not Decimal(0) <= price <= MAX_PRICE:
+        raise ValueError(f"цена {raw!r} вне допустимого диапазона 0–{MAX_PRICE}")
+    return price
+
+
+def _decode_csv(data: bytes) -> str:
+    for encoding in CSV_ENCODINGS:
+        try:
+            return data.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    raise CatalogImportError("Не удалось прочитать CSV: сохраните файл в кодировке UTF-8 или Windows-1251")
+
+
+def _header_map(header: list) -> dict[str, int]:
+    mapping: dict[str, int] = {}
+    for idx, raw in enumerate(header):
+        title = str(raw or "").strip().lower()
+        for key, aliases in COLUMN_ALIASES.items():
+            if title in aliases and key not in mapping:
+                mapping[key] = idx
+    missing = {"category", "name"} - mapping.keys()
+    if missing:
+        raise CatalogImportError(f"В прайс-листе нет колонок: {', '.join(sorted(missing))}")
+    return mapping
+
+
+def _raw_rows(fh: IO, filename: str) -> Iterator[list]:
+    suffix = PurePath(filename).suffix.lower()
+    if suffix == ".xlsx":
+        try:
+            from openpyxl import load_workbook
+        except ImportError as exc:
+            raise CatalogImportError("Для XLSX нужен пакет openpyxl") from exc
+        workbook = load_workbook(fh, read_only=True, data_only=True)
+        try:
+            for row in workbook.active.iter_rows(values_only=True):
+                yield list(row)
+        finally:
+            workbook.close()
+    elif suffix == ".csv":
+        # Decoded up front so a wrong encoding is reported before any row is applied.
+        text = fh if isinstance(fh, io.TextIOBase) else io.StringIO(_decode_csv(fh.read()), newline="")
+        sample = text.read(4096)
+        text.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        yield from csv.reader(text, dialect)
+    else:
+        raise CatalogImportError("Поддерживаются только файлы .csv и .xlsx")
+
+
+def read_price_list(fh: IO, filename: str) -> Iterator[tuple[int, dict]]:
+    rows = _raw_rows(fh, filename)
+    header = next(rows, None)
+    if header is None:
+        raise CatalogImportError("Файл пустой")
+    mapping = _header_map(header)
+    for line, row in enumerate(rows, start=2):
+        values = {key: row[idx] if idx < len(row) else None for key, idx in mapping.items()}
+        if not any(value not in (None, "") for value in values.values()):
+            continue
+        yield line, values
+
+
+class CatalogImporter:
+    def __init__(self, deactivate_missing: bool = False, batch_size: int = IMPORT_BATCH_SIZE):
+        from .models import Product, ProductCategory
+
+        self.Product = Product
+        self.ProductCategory = ProductCategory
+        self.deactivate_missing = deactivate_missing
+        self.batch_size = batch_size
+        self.result = ImportResult()
+        self.categories: dict[str, int] = {}
+        self.existing: dict[str, tuple] = {}
+        self.seen: set[str] = set()
+        self.to_create: list = []
+        self.to_update: list = []
+        self.touched_categories: set[int] = set()
+
+    def run(self, fh: IO, filename: str, dry_run: bool = False) -> ImportResult:
+        try:
+            return self._run(fh, filename, dry_run)
+        except DatabaseError as exc:
+            # The whole import is one transaction, so nothing was saved.
+            raise CatalogImportError(f"Прайс-лист не загружен, база данных отклонила данные: {exc}") from exc
+
+    def _run(self, fh: IO, filename: str, dry_run: bool) -> ImportResult:
+        with transaction.atomic():
+            self._load_existing()
+            for line, values in read_price_list(fh, filename):
+                try:
+                    self._apply_row(values)
+                except ValueError as exc:
+                    self.result.errors.append(f"строка {line}: {exc}")
+            self._flush(force=True)
+            if self.deactivate_missing:
+                missing = [slug for slug, row in self.existing.items() if slug not in self.seen and row[-1]]
+                for start in range(0, len(missing), self.batch_size):
+                    chunk = missing[start : start + self.batch_size]
+                    self.touched_categories.update(self.existing[slug][1] for slug in chunk)
+                    self.result.deactivated += self.Product.objects.filter(slug__in=chunk).update(is_active=False)
+            if self.touched_categories:
+                # Sitemap lastmod of the category pages follows their products.
+                self.ProductCategory.objects.filter(pk__in=self.touched_categories).update(
+                    updated_at=timezone.now()
+                )
+            if dry_run:
+                transaction.set_rollback(True)
+            else:
+                # bulk_create/bulk_update bypass the model signals that invalidate the shop cache.
+                transaction.on_commit(bump_catalog_version)
+        return self.result
+
+    def _load_existing(self) -> None:
+        for pk, name, slug in self.ProductCategory.objects.values_list("pk", "name", "slug"):
+            self.categories[name.strip().lower()] = pk
+            self.categories[slug] = pk
+        rows = self.Product.objects.values_list("slug", "pk", *PRODUCT_FIELDS)
+        for slug, *values in rows.iterator(chunk_size=2000):
+            self.existing[slug] = tuple(values)
+
+    def _category_id(self, name: str, slug: str) -> int:
+        key = name.strip().lower()
+        if key in self.categories:
+            return self.categories[key]
+        slug = slug or catalog_slug(name, 100)
+        if not slug:
+            raise ValueError(f"не удалось построить slug категории {name!r}")
+        if slug in self.categories:
+            return self.categories[slug]
+        category = self.ProductCategory.objects.create(name=name.strip()[:80], slug=slug)
+        self.result.categories_created += 1
+        self.categories[key] = self.categories[slug] = category.pk
+        return category.pk
+
+    def _apply_row(self, values: dict) -> None:
+        name = str(values.get("name") or "").strip()
+        category_name = str(values.get("category") or "").strip()
+        if not name or not category_name:
+            raise ValueError("пустое название товара или категории")
+        slug = catalog_slug(str(values.get("slug") or "") or name, 180)
+        if not slug:
+            raise ValueError(f"не удалось построить slug для {name!r}")
+        if slug in self.seen:
+            raise ValueError(f"slug {slug} повторяется в файле")
+        self.seen.add(slug)
+
+        current = self.existing.get(slug)
+        fields = {"name": name[:140]}
+        if "description" in values:
+            fields["description"] = str(values["description"] or "").strip()
+        if "price" in values:
+            fields["price"] = _parse_price(values["price"])
+        if "is_active" in values and values["is_active"] not in (None, ""):
+            fields["is_active"] = str(values["is_active"]).strip().lower() in TRUE_VALUES
+        elif current is None or self.deactivate_missing:
+            fields["is_active"] = True
+        category_slug = catalog_slug(str(values.get("category_slug") or ""), 100)
+        fields["category_id"] = self._category_id(category_name, category_slug)
+
+        if current is None:
+            self.touched_categories.add(fields["category_id"])
+            self.to_create.append(
+                self.Product(slug=slug, search_name=self.Product.normalize_search(fields["name"]), **fields)
+            )
+        else:
+            pk, *old_values = current
+            old = dict(zip(PRODUCT_FIELDS, old_values))
+            changed = {key: value for key, value in fields.items() if old[key] != value}
+            if not changed:
+                self.result.unchanged += 1
+                return
+            self.touched_categories.update((old["category_id"], fields["category_id"]))
+            values = {**old, **changed}
+            values["search_name"] = self.Product.normalize_search(values["name"])
+            self.to_update.append(self.Product(pk=pk, slug=slug, **values))
+        self._flush()
+
+    def _flush(self, force: bool = False) -> None:
+        if self.to_create and (force or len(self.to_create) >= self.batch_size):
+            self.Product.objects.bulk_create(self.to_create, batch_size=self.batch_size)
+            self.result.created += len(self.to_create)
+            self.to_create = []
+        if self.to_update and (force or len(self.to_update) >= self.batch_size):
+            self.Product.objects.bulk_update(
+                self.to_update, (*PRODUCT_FIELDS, "search_name"), batch_size=self.batch_size
+            )
+            self.result.updated += len(self.to_update)
+            self.to_update = []
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import Count, Q, QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.http import urlencode
+
+from .forms import DashboardFilterForm
+from .metrics import METRIC_LOGINS, METRIC_ORDERS, METRIC_PREORDERS, METRIC_USERS, series
+from .models import ArticleSubmission, OrderRequest, ShopPreorder
+
+User = get_user_model()
+
+
+@dataclass(frozen=True)
+class Panel:
+    key: str
+    title: str
+    template: str
+    rows_template: str
+    date_field: str
+    status_choices: list[tuple[str, str]] | None
+    exportable: bool = False
+
+    def queryset(self) -> QuerySet:
+        if self.key == "orders":
+            return OrderRequest.objects.select_related("user", "article")
+        if self.key == "preorders":
+            return ShopPreorder.objects.select_related("user", "category", "product")
+        if self.key == "submissions":
+            return ArticleSubmission.objects.select_related("user", "approved_article").annotate(
+                images_total=Count("images")
+            )
+        return User.objects.all()
+
+
+PANELS = {
+    "submissions": Panel(
+        "submissions",
+        "Заявки на статьи",
+        "base/partials/owner_submissions.html",
+        "base/partials/owner_submissions_rows.html",
+        "created_at",
+        ArticleSubmission.STATUS_CHOICES,
+    ),
+    "users": Panel(
+        "users",
+        "Пользователи",
+        "base/partials/owner_users.html",
+        "base/partials/owner_users_rows.html",
+        "date_joined",
+        None,
+        exportable=True,
+    ),
+    "orders": Panel(
+        "orders",
+        "Заявки на услуги",
+        "base/partials/owner_orders.html",
+        "base/partials/owner_orders_rows.html",
+        "created_at",
+        OrderRequest.STATUS_CHOICES,
+        exportable=True,
+    ),
+    "preorders": Panel(
+        "preorders",
+        "Предзаказы магазина",
+        "base/partials/owner_preorders.html",
+        "base/partials/owner_preorders_rows.html",
+        "created_at",
+        ShopPreorder.STATUS_CHOICES,
+        exportable=True,
+    ),
+}
+
+
+CHART_METRICS = (
+    (METRIC_ORDERS, "Заявки"),
+    (METRIC_PREORDERS, "Предзаказы"),
+    (METRIC_USERS, "Новые пользователи"),
+    (METRIC_LOGINS, "Входы"),
+)
+
+
+def page_size() -> int:
+    return int(getattr(settings, "OWNER_DASHBOARD_PAGE_SIZE", 25))
+
+
+def encode_cursor(obj, date_field: str) -> str:
+    return f"{getattr(obj, date_field).isoformat()}|{obj.pk}"
+
+
+def decode_cursor(raw: str | None) -> tuple[datetime, int] | None:
+    if not raw or "|" not in raw:
+        return None
+    raw_date, raw_id = raw.rsplit("|", 1)
+    value = parse_datetime(raw_date)
+    try:
+        pk = int(raw_id)
+    except ValueError:
+        return None
+    if value is None:
+        return None
+    return value, pk
+
+
+def apply_filters(
+    panel: Panel, queryset: QuerySet, form: DashboardFilterForm
+) -> tuple[QuerySet, dict[str, str]]:
+    filters: dict[str, str] = {}
+    if not form.is_valid():
+        return queryset, filters
+    data = form.cleaned_data
+    tz = timezone.get_current_timezone()
+    if data.get("status"):
+        queryset = queryset.filter(status=data["status"])
+        filters["status"] = data["status"]
+    if data.get("date_from"):
+        start = timezone.make_aware(datetime.combine(data["date_from"], time.min), tz)
+        queryset = queryset.filter(**{f"{panel.date_field}__gte": start})
+        filters["date_from"] = data["date_from"].isoformat()
+    if data.get("date_to"):
+        end = timezone.make_aware(datetime.combine(data["date_to"], time.max), tz)
+        queryset = queryset.filter(**{f"{panel.date_field}__lte": end})
+        filters["date_to"] = data["date_to"].isoformat()
+    return queryset, filters
+
+
+def panel_page(panel: Panel, params) -> dict:
+    form = DashboardFilterForm(params or None, status_choices=panel.status_choices)
+    queryset, filters = apply_filters(panel, panel.queryset(), form)
+
+    cursor = decode_cursor(params.get("after") if params else None)
+    if cursor:
+        value, pk = cursor
+        queryset = queryset.filter(
+            Q(**{f"{panel.date_field}__lt": value}) | Q(**{panel.date_field: value, "pk__lt": pk})
+        )
+
+    size = page_size()
+    rows = list(queryset.order_by(f"-{panel.date_field}", "-pk")[: size + 1])
+    next_query = ""
+    if len(rows) > size:
+        rows = rows[:size]
+        next_query = urlencode({**filters, "after": encode_cursor(rows[-1], panel.date_field)})
+    return {
+        "panel": panel,
+        "rows": rows,
+        "filter_form": form,
+        "next_query": next_query,
+        "filter_query": urlencode(filters),
+        "is_first_page": cursor is None,
+        "status_choices": panel.status_choices or [],
+    }
+
+
+def metrics_charts() -> list[dict]:
+    days = series(int(getattr(settings, "OWNER_METRICS_DAYS", 30)))
+    charts = []
+    for metric, title in CHART_METRICS:
+        peak = max((day[metric] for day in days), default=0) or 1
+        charts.append(
+            {
+                "title": title,
+                "total": sum(day[metric] for day in days),
+                "bars": [
+                    {"date": day["date"], "value": day[metric], "height": round(day[metric] * 100 / peak)}
+                    for day in days
+                ],
+            }
+        )
+    return charts
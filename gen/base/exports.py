@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import csv
+import re
+from typing import Callable, Iterable, Iterator
+
+from django.conf import settings
+from django.utils import timezone
+
+from .dashboard import PANELS, apply_filters
+from .forms import DashboardFilterForm
+
+EXPORT_FORMATS = ("csv", "xlsx")
+CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+# Excel and LibreOffice evaluate a cell that starts with one of these as a formula.
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+PHONE_RE = re.compile(r"\+?[\d\s()-]+")
+
+
+def _datetime(value) -> str:
+    if not value:
+        return ""
+    return timezone.localtime(value).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _email(user) -> str:
+    return user.email if user else ""
+
+
+def _cell(value):
+    # Names, comments and items are typed by visitors; a leading quote keeps them as text.
+    # Phone numbers like "+375 29 ..." cannot call a function, so they are left readable.
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES) and not PHONE_RE.fullmatch(value):
+        return f"'{value}"
+    return value
+
+
+COLUMNS: dict[str, list[tuple[str, Callable]]] = {
+    "orders": [
+        ("ID", lambda obj: obj.pk),
+        ("Дата", lambda obj: _datetime(obj.created_at)),
+        ("Статус", lambda obj: obj.get_status_display()),
+        ("Имя", lambda obj: obj.name),
+        ("Телефон", lambda obj: obj.phone),
+        ("Email", lambda obj: obj.email),
+        ("Как связаться", lambda obj: obj.get_contact_method_display()),
+        ("Статья", lambda obj: obj.article.title if obj.article else ""),
+        ("Пользователь", lambda obj: _email(obj.user)),
+        ("Комментарий", lambda obj: obj.message),
+    ],
+    "preorders": [
+        ("ID", lambda obj: obj.pk),
+        ("Дата", lambda obj: _datetime(obj.created_at)),
+        ("Статус", lambda obj: obj.get_status_display()),
+        ("Категория", lambda obj: obj.category.name if obj.category else ""),
+        ("Товар", lambda obj: obj.product.name if obj.product else obj.desired_item),
+        ("Количество", lambda obj: obj.quantity),
+        ("Телефон", lambda obj: obj.phone),
+        ("Email", lambda obj: obj.email),
+        ("Пользователь", lambda obj: _email(obj.user)),
+        ("Комментарий", lambda obj: obj.comment),
+    ],
+    "users": [
+        ("ID", lambda obj: obj.pk),
+        ("Email", lambda obj: obj.email),
+        ("Логин", lambda obj: obj.username),
+        ("Имя", lambda obj: obj.get_full_name()),
+        ("Дата регистрации", lambda obj: _datetime(obj.date_joined)),
+        ("Последний вход", lambda obj: _datetime(obj.last_login)),
+    ],
+}
+
+
+class _Echo:
+    def write(self, value: str) -> str:
+        return value
+
+
+def chunk_size() -> int:
+    return int(getattr(settings, "EXPORT_CHUNK_SIZE", 2000))
+
+
+def export_rows(key: str, params) -> Iterator[list]:
+    panel = PANELS[key]
+    form = DashboardFilterForm(params or None, status_choices=panel.status_choices)
+    queryset, _filters = apply_filters(panel, panel.queryset(), form)
+    columns = COLUMNS[key]
+    yield [header for header, _getter in columns]
+    for obj in queryset.order_by(panel.date_field, "pk").iterator(chunk_size=chunk_size()):
+        yield [_cell(getter(obj)) for _header, getter in columns]
+
+
+def iter_csv(rows: Iterable[list]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    # BOM so Excel opens the cyrillic text as UTF-8.
+    yield "\ufeff"
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def write_xlsx(rows: Iterable[list], fh, title: str) -> None:
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=title)
+    for row in rows:
+        sheet.append(row)
+    workbook.save(fh)
+
+
+def export_filename(key: str, fmt: str) -> str:
+    return f"{key}-{timezone.localdate():%Y%m%d}.{fmt}"
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import io
+import random
+from dataclasses import dataclass, field
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.utils import timezone
+
+from .catalog import bump_catalog_version
+from .sitemap_cache import bump_sitemap_version
+from .storage import add_blob_references
+
+FAKE_BATCH_SIZE = 500
+
+FIRST_NAMES = ("Алексей", "Ирина", "Сергей", "Наталья", "Дмитрий", "Ольга", "Андрей", "Елена", "Павел", "Марина")
+LAST_NAMES = ("Иванов", "Ковалёв", "Новик", "Шевчук", "Лукашевич", "Мельник", "Кравченко", "Бондарь", "Ткачук")
+CITIES = ("Минск", "Гомель", "Брест", "Гродно", "Витебск", "Могилёв", "Борисов", "Пинск")
+JOBS = (
+    "Замена газового котла",
+    "Монтаж тёплого пола",
+    "Сварка трубопровода отопления",
+    "Установка бойлера",
+    "Ремонт системы отопления",
+    "Устройство ленточного фундамента",
+    "Перенос радиаторов",
+    "Обвязка котельной",
+)
+CATEGORIES = (
+    "Газовые котлы",
+    "Электрокотлы",
+    "Радиаторы",
+    "Бойлеры",
+    "Насосы",
+    "Трубы и фитинги",
+    "Запорная арматура",
+    "Дымоходы",
+    "Расширительные баки",
+    "Автоматика",
+    "Тёплый пол",
+    "Инструмент",
+)
+BRANDS = ("Protherm", "Baxi", "Buderus", "Viessmann", "Grundfos", "Wilo", "Ariston", "Valtec", "Oventrop")
+PARAGRAPH = (
+    "Перед началом работ мастер проверяет давление в системе, состояние запорной арматуры и дымохода. "
+    "Все соединения опрессовываются, после запуска котла выполняется балансировка контуров. "
+)
+
+
+@dataclass
+class FakeDataResult:
+    counts: dict[str, int] = field(default_factory=dict)
+
+    def add(self, key: str, value: int) -> None:
+        self.counts[key] = self.counts.get(key, 0) + value
+
+    def summary(self) -> str:
+        return ", ".join(f"{key}: {value}" for key, value in self.counts.items()) or "nothing created"
+
+
+def _placeholder_images(rng: random.Random, count: int) -> list[str]:
+    from PIL import Image, ImageDraw
+
+    from .models import ArticleImage
+
+    storage = ArticleImage._meta.get_field("image").storage
+    names = []
+    for idx in range(count):
+        image = Image.new("RGB", (1200, 800), tuple(rng.randrange(40, 220) for _ in range(3)))
+        draw = ImageDraw.Draw(image)
+        # Noise keeps the JPEG close to a real photo's size.
+        for _ in range(60):
+            x, y = rng.randrange(1200), rng.randrange(800)
+            colour = tuple(rng.randrange(256) for _ in range(3))
+            draw.rectangle((x, y, x + rng.randrange(20, 200), y + rng.randrange(20, 120)), fill=colour)
+        buffer = io.BytesIO()
+        image.save(buffer, "JPEG", quality=82)
+        names.append(storage.save(f"articles/fake/{idx}.jpg", ContentFile(buffer.getvalue())))
+    return names
+
+
+def _spread_dates(model, rows: list, days: int, rng: random.Random, batch_size: int) -> None:
+    # auto_now_add ignores explicit values, so backdate after the insert.
+    now = timezone.now()
+    span = max(1, days) * 24 * 3600
+    for row in rows:
+        row.created_at = now - timedelta(seconds=rng.randrange(span))
+    model.objects.bulk_update(rows, ["created_at"], batch_size=batch_size)
+
+
+def _phone(rng: random.Random) -> str:
+    return f"+37529{rng.randrange(1000000, 9999999)}"
+
+
+@transaction.atomic
+def generate_fake_data(
+    *,
+    tag: str,
+    users: int = 500,
+    orders: int = 5000,
+    preorders: int = 2000,
+    articles: int = 300,
+    images_per_article: int = 3,
+    submissions: int = 200,
+    products: int = 2000,
+    days: int = 365,
+    image_pool: int = 12,
+    seed: int = 0,
+    batch_size: int = FAKE_BATCH_SIZE,
+) -> FakeDataResult:
+    from .models import (
+        Article,
+        ArticleImage,
+        ArticleSubmission,
+        OrderRequest,
+        Product,
+        ProductCategory,
+        Profile,
+        ShopPreorder,
+        SubmissionImage,
+    )
+
+    User = get_user_model()
+    rng = random.Random(seed)
+    result = FakeDataResult()
+
+    people = User.objects.bulk_create(
+        [
+            User(
+                username=f"fake_{tag}_{idx}",
+                email=f"fake.{tag}.{idx}@example.com",
+                first_name=rng.choice(FIRST_NAMES),
+                last_name=rng.choice(LAST_NAMES),
+            )
+            for idx in range(users)
+        ],
+        batch_size=batch_size,
+    )
+    for person in people:
+        person.set_unusable_password()
+    User.objects.bulk_update(people, ["password"], batch_size=batch_size)
+    Profile.objects.bulk_create(
+        [Profile(user=person, phone=_phone(rng)) for person in people if rng.random() < 0.6],
+        batch_size=batch_size,
+    )
+    result.add("users", len(people))
+
+    categories = list(ProductCategory.objects.filter(is_active=True))
+    existing = {category.name for category in categories}
+    categories += ProductCategory.objects.bulk_create(
+        [
+            ProductCategory(name=name, slug=f"fake-{tag}-category-{idx}")
+            for idx, name in enumerate(CATEGORIES)
+            if name not in existing
+        ]
+    )
+    catalog = []
+    for idx in range(products):
+        name = f"{rng.choice(BRANDS)} {rng.choice(CATEGORIES).split()[0].lower()} {rng.randrange(10, 99)}-{idx}"
+        catalog.append(
+            Product(
+                category=rng.choice(categories),
+                name=name,
+                search_name=Product.normalize_search(name),
+                slug=f"fake-{tag}-product-{idx}",
+                price=Decimal(rng.randrange(15, 9000)) if rng.random() < 0.85 else None,
+                is_active=rng.random() < 0.95,
+            )
+        )
+    catalog = Product.objects.bulk_create(catalog, batch_size=batch_size)
+    result.add("products", len(catalog))
+
+    authors = people[:20]
+    published = Article.objects.bulk_create(
+        [
+            Article(
+                title=f"{rng.choice(JOBS)} в г. {rng.choice(CITIES)}",
+                slug=f"fake-{tag}-article-{idx}",
+                summary=f"{rng.choice(JOBS)}: сроки, материалы и цена.",
+                content=PARAGRAPH * rng.randrange(4, 30),
+                is_published=rng.random() < 0.9,
+                author=rng.choice(authors) if authors else None,
+            )
+            for idx in range(articles)
+        ],
+        batch_size=batch_size,
+    )
+    _spread_dates(Article, published, days, rng, batch_size)
+    result.add("articles", len(published))
+
+    pool = _placeholder_images(rng, image_pool) if image_pool and (images_per_article or submissions) else []
+    if pool:
+        article_images = ArticleImage.objects.bulk_create(
+            [
+                ArticleImage(article=article, image=rng.choice(pool), sort_order=position)
+                for article in published
+                for position in range(images_per_article)
+            ],
+            batch_size=batch_size,
+        )
+        add_blob_references(image.image.name for image in article_images)
+        result.add("images", len(article_images))
+
+    drafts = ArticleSubmission.objects.bulk_create(
+        [
+            ArticleSubmission(
+                title=f"{rng.choice(JOBS)} — отзыв клиента",
+                content=PARAGRAPH * rng.randrange(2, 10),
+                user=rng.choice(people) if people else None,
+                status=rng.choices(
+                    (ArticleSubmission.STATUS_PENDING, ArticleSubmission.STATUS_REJECTED), weights=(2, 1)
+                )[0],
+            )
+            for _ in range(submissions if people else 0)
+        ],
+        batch_size=batch_size,
+    )
+    if pool and drafts:
+        submission_images = SubmissionImage.objects.bulk_create(
+            [SubmissionImage(submission=draft, image=rng.choice(pool)) for draft in drafts],
+            batch_size=batch_size,
+        )
+        add_blob_references(image.image.name for image in submission_images)
+        result.add("images", len(submission_images))
+    _spread_dates(ArticleSubmission, drafts, days, rng, batch_size)
+    result.add("submissions", len(drafts))
+
+    statuses = [code for code, _ in OrderRequest.STATUS_CHOICES]
+    methods = [code for code, _ in OrderRequest.CONTACT_CHOICES]
+    order_rows = OrderRequest.objects.bulk_create(
+        [
+            OrderRequest(
+                name=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                phone=_phone(rng),
+                email=f"client{idx}@example.com" if rng.random() < 0.4 else "",
+                message=f"{rng.choice(JOBS)}, {rng.choice(CITIES)}",
+                contact_method=rng.choice(methods),
+                user=rng.choice(people) if people and rng.random() < 0.3 else None,
+                article=rng.choice(published) if published and rng.random() < 0.25 else None,
+                status=rng.choices(statuses, weights=(1, 1, 6))[0],
+            )
+            for idx in range(orders)
+        ],
+        batch_size=batch_size,
+    )
+    _spread_dates(OrderRequest, order_rows, days, rng, batch_size)
+    result.add("orders", len(order_rows))
+
+    active_catalog = [product for product in catalog if product.is_active]
+    preorder_rows = []
+    for _ in range(preorders):
+        product = rng.choice(active_catalog) if active_catalog and rng.random() < 0.7 else None
+        preorder_rows.append(
+            ShopPreorder(
+                phone=_phone(rng),
+                user=rng.choice(people) if people and rng.random() < 0.3 else None,
+                category=product.category if product else rng.choice(categories),
+                product=product,
+                desired_item="" if product else f"{rng.choice(BRANDS)} под заказ",
+                quantity=rng.randrange(1, 5),
+                status=rng.choices(statuses, weights=(1, 1, 6))[0],
+            )
+        )
+    preorder_rows = ShopPreorder.objects.bulk_create(preorder_rows, batch_size=batch_size)
+    _spread_dates(ShopPreorder, preorder_rows, days, rng, batch_size)
+    result.add("preorders", len(preorder_rows))
+
+    # bulk_create skips the save signals that normally invalidate these caches.
+    transaction.on_commit(bump_catalog_version)
+    transaction.on_commit(bump_sitemap_version)
+    return result
@@ -2,7 +2,9 @@ from django import forms
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
+from django.urls import reverse
 
+from .bulk import BULK_MAX_IDS, parse_id_list
 from .models import (
     AdminEmailAccess,
     Article,
@@ -20,6 +22,50 @@ class MultiFileInput(forms.ClearableFileInput):
     allow_multiple_selected = True
 
 
+class ProductAutocompleteWidget(forms.Widget):
+    template_name = "base/widgets/product_autocomplete.html"
+
+    def get_context(self, name, value, attrs):
+        context = super().get_context(name, value, attrs)
+        label = ""
+        if isinstance(value, Product):
+            label = value.name
+        elif value not in (None, ""):
+            try:
+                label = Product.objects.filter(pk=int(value)).values_list("name", flat=True).first() or ""
+            except (TypeError, ValueError):
+                label = ""
+        context["widget"].update(
+            {
+                "label": label,
+                "url": reverse("shop_product_autocomplete"),
+                "min_chars": int(getattr(settings, "SHOP_AUTOCOMPLETE_MIN_CHARS", 2)),
+            }
+        )
+        return context
+
+
+class ProductPkField(forms.Field):
+    # Validates a single product id instead of materialising every active product as a choice.
+    widget = ProductAutocompleteWidget
+    default_error_messages = {"invalid_choice": "Выберите товар из списка подсказок."}
+
+    def prepare_value(self, value):
+        return value.pk if isinstance(value, Product) else value
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        try:
+            pk = int(str(value).strip())
+        except (TypeError, ValueError):
+            raise ValidationError(self.error_messages["invalid_choice"], code="invalid_choice")
+        product = Product.objects.filter(pk=pk, is_active=True, category__is_active=True).first()
+        if product is None:
+            raise ValidationError(self.error_messages["invalid_choice"], code="invalid_choice")
+        return product
+
+
 def _article_limits() -> tuple[int, int]:
     max_symbols = int(getattr(settings, "ARTICLE_MAX_CONTENT_LENGTH", 20000))
     max_images = int(getattr(settings, "ARTICLE_MAX_IMAGES", 7))
@@ -381,11 +427,11 @@ class ShopPreorderForm(forms.ModelForm):
         widget=forms.Select(attrs={"class": "inputf1"}),
         label="Категория",
     )
-    product = forms.ModelChoiceField(
-        queryset=Product.objects.filter(is_active=True),
+    product = ProductPkField(
         required=False,
-        empty_label="Выберите товар (необязательно)",
-        widget=forms.Select(attrs={"class": "inputf1"}),
+        widget=ProductAutocompleteWidget(
+            attrs={"class": "inputf1", "placeholder": "Начните вводить название товара"}
+        ),
         label="Товар",
     )
 
@@ -484,3 +530,80 @@ class PreorderStatusUpdateForm(forms.Form):
         widget=forms.Select(attrs={"class": "inputf1"}),
         label="Статус",
     )
+
+
+class BulkIdsForm(forms.Form):
+    ids = forms.Field(widget=forms.MultipleHiddenInput, label="ID")
+
+    def clean_ids(self):
+        try:
+            ids = parse_id_list(self.cleaned_data.get("ids"))
+        except ValueError as exc:
+            raise ValidationError("Некорректный список ID.") from exc
+        if not ids:
+            raise ValidationError("Не выбрано ни одной записи.")
+        if len(ids) > BULK_MAX_IDS:
+            raise ValidationError(f"За раз можно обновить не больше {BULK_MAX_IDS} записей.")
+        return ids
+
+
+class BulkStatusUpdateForm(BulkIdsForm):
+    status = forms.ChoiceField(
+        widget=forms.Select(attrs={"class": "inputf1"}),
+        label="Статус",
+    )
+
+    def __init__(self, *args, status_choices=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["status"].choices = status_choices or []
+
+
+class BulkSubmissionApproveForm(BulkIdsForm):
+    review_comment = forms.CharField(
+        required=False,
+        widget=forms.TextInput(attrs={"class": "inputf1", "placeholder": "Комментарий для всех отмеченных"}),
+        label="Комментарий",
+    )
+
+
+class CatalogImportForm(forms.Form):
+    price_list = forms.FileField(
+        label="Прайс-лист",
+        help_text="CSV или XLSX с колонками: категория, название, slug, описание, цена, активен.",
+        widget=forms.ClearableFileInput(attrs={"class": "inputf1", "accept": ".csv,.xlsx"}),
+    )
+    deactivate_missing = forms.BooleanField(
+        required=False,
+        widget=forms.CheckboxInput(attrs={"class": "checkf1"}),
+        label="Скрыть товары, которых нет в файле",
+    )
+    dry_run = forms.BooleanField(
+        required=False,
+        widget=forms.CheckboxInput(attrs={"class": "checkf1"}),
+        label="Только проверить, ничего не сохранять",
+    )
+
+
+class DashboardFilterForm(forms.Form):
+    status = forms.ChoiceField(
+        required=False,
+        widget=forms.Select(attrs={"class": "inputf1"}),
+        label="Статус",
+    )
+    date_from = forms.DateField(
+        required=False,
+        widget=forms.DateInput(attrs={"class": "inputf1", "type": "date"}),
+        label="С даты",
+    )
+    date_to = forms.DateField(
+        required=False,
+        widget=forms.DateInput(attrs={"class": "inputf1", "type": "date"}),
+        label="По дату",
+    )
+
+    def __init__(self, *args, status_choices=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if status_choices:
+            self.fields["status"].choices = [("", "Все статусы"), *status_choices]
+        else:
+            del self.fields["status"]
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+from typing import Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+# The pages that take traffic right after a deploy; each extends base/base.html.
+WARM_TEMPLATES = (
+    "base/index.html",
+    "base/shop_catalog.html",
+    "base/articles.html",
+    "base/article_detail.html",
+    "prices/price_list.html",
+)
+
+
+def check_database() -> None:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+
+
+def check_cache() -> None:
+    # Round-trips a unique value: a read-only or full file cache fails here, not on the next page.
+    key = f"health:{os.getpid()}"
+    value = uuid.uuid4().hex
+    cache.set(key, value, 30)
+    if cache.get(key) != value:
+        raise RuntimeError("cache did not return the value just written")
+
+
+def check_media() -> None:
+    root = Path(settings.MEDIA_ROOT)
+    if not root.is_dir():
+        raise RuntimeError(f"{root} is missing")
+    if not os.access(root, os.W_OK):
+        raise RuntimeError(f"{root} is not writable")
+    free_mb = shutil.disk_usage(root).free // (1024 * 1024)
+    if free_mb < settings.HEALTH_MEDIA_MIN_FREE_MB:
+        raise RuntimeError(f"{free_mb} MB free on the media volume")
+
+
+def check_static_manifest() -> None:
+    from django.contrib.staticfiles.storage import staticfiles_storage
+
+    manifest_name = getattr(staticfiles_storage, "manifest_name", None)
+    if manifest_name is None:
+        return
+    # hashed_files is what this worker loaded at start; an empty map means every {% static %} raises.
+    if not staticfiles_storage.hashed_files or not staticfiles_storage.exists(manifest_name):
+        raise RuntimeError(f"{manifest_name} is missing; run collectstatic")
+
+
+READINESS_CHECKS: dict[str, Callable[[], None]] = {
+    "database": check_database,
+    "cache": check_cache,
+    "media": check_media,
+    "static_manifest": check_static_manifest,
+}
+
+
+def run_checks(checks: dict[str, Callable[[], None]] | None = None) -> tuple[bool, dict[str, dict]]:
+    results = {}
+    for name, check in (checks or READINESS_CHECKS).items():
+        started = time.perf_counter()
+        try:
+            check()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Readiness check %s failed: %s", name, exc, extra={"event": "readiness", "check": name})
+            ok = False
+        else:
+            ok = True
+        results[name] = {"ok": ok, "ms": round((time.perf_counter() - started) * 1000, 2)}
+    return all(item["ok"] for item in results.values()), results
+
+
+def warm_up() -> None:
+    # Called from gunicorn's post_worker_init so the first real request does not pay for imports,
+    # template compilation and the database connection.
+    from django.template.loader import get_template
+    from django.urls import get_resolver
+
+    get_resolver().url_patterns
+    for name in WARM_TEMPLATES:
+        get_template(name)
+    ok, results = run_checks({"database": check_database, "cache": check_cache})
+    if not ok:
+        logger.warning("Worker warm-up incomplete", extra={"event": "warm_up", "checks": results})
+
+
+def heartbeat_path() -> Path:
+    return Path(settings.TELEGRAM_BOT_HEARTBEAT_FILE)
+
+
+def write_heartbeat(**fields) -> None:
+    # Atomic replace: the watchdog never reads a half-written file. Its mtime is the heartbeat.
+    path = heartbeat_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps({"ts": time.time(), "pid": os.getpid(), **fields}), encoding="utf-8")
+    os.replace(tmp_path, path)
+
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path, PurePosixPath
+
+from django.conf import settings
+from PIL import Image, ImageOps
+
+OPTIMIZED_PREFIX = "base/img/opt"
+MANIFEST_NAME = f"{OPTIMIZED_PREFIX}/manifest.json"
+SOURCE_EXTENSIONS = {".jpg", ".jpeg", ".png"}
+
+_manifest_cache: dict[str, object] = {"mtime": None, "data": {}}
+
+
+def image_widths() -> list[int]:
+    widths = getattr(settings, "STATIC_IMAGE_WIDTHS", [480, 960, 1600])
+    return sorted({int(item) for item in widths if int(item) > 0})
+
+
+def manifest_path() -> Path:
+    return Path(settings.STATIC_ROOT) / MANIFEST_NAME
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _has_alpha(img: Image.Image) -> bool:
+    if img.mode in ("RGBA", "LA"):
+        return img.getchannel("A").getextrema()[0] < 255
+    return img.mode == "P" and "transparency" in img.info
+
+
+def _target_widths(original_width: int) -> list[int]:
+    widths = image_widths()
+    cap = min(original_width, widths[-1]) if widths else original_width
+    return sorted({width for width in widths if width < cap} | {cap})
+
+
+def build_variants(source_name: str, source_path: str, previous: dict | None = None) -> dict:
+    source_hash = _file_digest(source_path)
+    if previous and previous.get("hash") == source_hash[:12]:
+        files = [
+            item[key]
+            for item in previous.get("variants", [])
+            for key in ("fallback", "webp")
+        ]
+        if all((Path(settings.STATIC_ROOT) / name).exists() for name in files):
+            return previous
+
+    stem = PurePosixPath(source_name).stem
+    root = Path(settings.STATIC_ROOT)
+    (root / OPTIMIZED_PREFIX).mkdir(parents=True, exist_ok=True)
+
+    with Image.open(source_path) as raw:
+        img = ImageOps.exif_transpose(raw)
+        alpha = _has_alpha(img)
+        img = img.convert("RGBA" if alpha else "RGB")
+        fallback_ext = "png" if alpha else "jpg"
+
+        variants = []
+        for width in _target_widths(img.width):
+            height = max(1, round(img.height * width / img.width))
+            resized = img if width == img.width else img.resize((width, height), Image.LANCZOS)
+            base_name = f"{OPTIMIZED_PREFIX}/{stem}.{source_hash[:12]}.{width}"
+            fallback_name = f"{base_name}.{fallback_ext}"
+            webp_name = f"{base_name}.webp"
+            if alpha:
+                resized.save(root / fallback_name, "PNG", optimize=True)
+            else:
+                resized.save(
+                    root / fallback_name,
+                    "JPEG",
+                    quality=82,
+                    optimize=True,
+                    progressive=True,
+                )
+            resized.save(root / webp_name, "WEBP", quality=80, method=4)
+            variants.append({"width": width, "fallback": fallback_name, "webp": webp_name})
+
+    return {
+        "hash": source_hash[:12],
+        "width": img.width,
+        "height": img.height,
+        "variants": variants,
+    }
+
+
+def write_manifest(data: dict) -> None:
+    path = manifest_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=1, sort_keys=True))
+    os.replace(tmp_path, path)
+
+
+def load_manifest() -> dict:
+    path = manifest_path()
+    try:
+        mtime = path.stat().st_mtime
+    except FileNotFoundError:
+        return {}
+    if _manifest_cache["mtime"] != mtime:
+        try:
+            _manifest_cache["data"] = json.loads(path.read_text())
+        except (OSError, ValueError):
+            _manifest_cache["data"] = {}
+        _manifest_cache["mtime"] = mtime
+    return _manifest_cache["data"]  # type: ignore[return-value]
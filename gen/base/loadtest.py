@@ -0,0 +1,405 @@
+from __future__ import annotations
+
+import json
+import math
+import random
+import re
+import socketserver
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from email import message_from_bytes
+from email.utils import parseaddr
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+from urllib.parse import urlencode, urljoin, urlsplit
+
+import requests
+
+CODE_PATTERN = re.compile(r"код подтверждения:\s*(\d+)", re.IGNORECASE)
+CSRF_FIELD = "csrfmiddlewaretoken"
+MAX_REDIRECTS = 5
+
+
+def percentile(ordered: list[float], pct: float) -> float:
+    # Nearest-rank on an already sorted sample.
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def latency_summary(samples: list[float]) -> dict:
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "p50_ms": round(percentile(ordered, 50) * 1000, 2),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 2),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 2),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 2) if ordered else 0.0,
+        "max_ms": round(ordered[-1] * 1000, 2) if ordered else 0.0,
+    }
+
+
+class LoadTestError(Exception):
+    pass
+
+
+@dataclass
+class ScenarioStats:
+    name: str
+    samples: list[float] = field(default_factory=list)
+    steps: dict[str, list[float]] = field(default_factory=dict)
+    errors: dict[str, int] = field(default_factory=dict)
+    iterations: int = 0
+    elapsed: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, step: str, seconds: float) -> None:
+        with self.lock:
+            self.samples.append(seconds)
+            self.steps.setdefault(step, []).append(seconds)
+
+    def fail(self, reason: str) -> None:
+        with self.lock:
+            self.errors[reason] = self.errors.get(reason, 0) + 1
+
+    def finish_iteration(self) -> None:
+        with self.lock:
+            self.iterations += 1
+
+    def as_dict(self) -> dict:
+        elapsed = self.elapsed or 1.0
+        error_count = sum(self.errors.values())
+        return {
+            **latency_summary(self.samples),
+            "requests": len(self.samples),
+            "iterations": self.iterations,
+            "errors": error_count,
+            "error_reasons": dict(sorted(self.errors.items())),
+            "rps": round(len(self.samples) / elapsed, 2),
+            "iterations_per_s": round(self.iterations / elapsed, 2),
+            "elapsed_s": round(self.elapsed, 2),
+            "steps": {step: latency_summary(samples) for step, samples in sorted(self.steps.items())},
+        }
+
+
+class LoadClient:
+    # Cookies are kept by hand: production sets Secure cookies, and requests would not send them back
+    # over the plain-HTTP hop to gunicorn.
+    def __init__(self, base_url: str, host: str = "", forwarded_proto: str = "https", timeout: float = 30):
+        self.base_url = base_url.rstrip("/") + "/"
+        parts = urlsplit(self.base_url)
+        self.host = host or parts.netloc
+        self.scheme = forwarded_proto or parts.scheme
+        self.forwarded_proto = forwarded_proto
+        self.timeout = timeout
+        self.http = requests.Session()
+        self.cookies: dict[str, str] = {}
+
+    def _headers(self) -> dict[str, str]:
+        origin = f"{self.scheme}://{self.host}"
+        headers = {"Host": self.host, "Origin": origin, "Referer": f"{origin}/", "User-Agent": "mastersvarki-loadtest"}
+        if self.forwarded_proto:
+            headers["X-Forwarded-Proto"] = self.forwarded_proto
+        return headers
+
+    def _local_url(self, location: str) -> str:
+        # Redirects may point at the public https URL; keep talking to the local server.
+        parts = urlsplit(location)
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+        return urljoin(self.base_url, path.lstrip("/"))
+
+    def request(self, method: str, path: str, data: dict | None = None) -> requests.Response:
+        url = self._local_url(path)
+        for _ in range(MAX_REDIRECTS + 1):
+            response = self.http.request(
+                method,
+                url,
+                data=data,
+                headers=self._headers(),
+                cookies=self.cookies,
+                allow_redirects=False,
+                timeout=self.timeout,
+            )
+            for cookie in response.cookies:
+                self.cookies[cookie.name] = cookie.value
+            self.http.cookies.clear()
+            if not response.is_redirect:
+                return response
+            url = self._local_url(response.headers["Location"])
+            method, data = "GET", None
+        raise LoadTestError("too many redirects")
+
+    def csrf_token(self) -> str:
+        return self.cookies.get("csrftoken", "")
+
+
+@dataclass
+class ScenarioContext:
+    category_slugs: list[str]
+    article_slugs: list[str]
+    search_terms: list[str]
+    price_keys: list[str]
+    mailbox: "Mailbox | None" = None
+    code_timeout: float = 10.0
+
+
+Step = Callable[[str, str, dict | None], requests.Response]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    description: str
+    run: Callable[[Step, LoadClient, ScenarioContext, random.Random], None]
+    needs_mailbox: bool = False
+
+
+def _home(step, client, ctx, rng):
+    step("home", "/", None)
+
+
+def _shop(step, client, ctx, rng):
+    step("shop", "/shop/", None)
+    if not ctx.category_slugs:
+        return
+    category = rng.choice(ctx.category_slugs)
+    step("category", f"/shop/?{urlencode({'category': category})}", None)
+    params = {"category": category, "order": rng.choice(("price", "-price")), "page": rng.choice((1, 2))}
+    if ctx.price_keys:
+        params["price"] = rng.choice(ctx.price_keys)
+    step("filtered", f"/shop/?{urlencode(params)}", None)
+    if ctx.search_terms:
+        step("autocomplete", f"/shop/products/autocomplete/?{urlencode({'q': rng.choice(ctx.search_terms)})}", None)
+
+
+def _articles(step, client, ctx, rng):
+    step("list", "/articles/", None)
+    if ctx.article_slugs:
+        step("detail", f"/articles/{rng.choice(ctx.article_slugs)}/", None)
+
+
+def _order(step, client, ctx, rng):
+    step("form", "/orders/", None)
+    step(
+        "submit",
+        "/orders/",
+        {
+            CSRF_FIELD: client.csrf_token(),
+            "name": "Нагрузочный тест",
+            "phone": f"+37529{rng.randrange(1000000, 9999999)}",
+            "email": "",
+            "contact_method": "phone",
+            "message": "Заявка создана нагрузочным тестом",
+        },
+    )
+
+
+def _login(step, client, ctx, rng):
+    email = f"loadtest.{time.time_ns()}.{rng.randrange(10**6)}@example.com"
+    step("form", "/auth/login/", None)
+    step("request_code", "/auth/login/", {CSRF_FIELD: client.csrf_token(), "email": email})
+    code = ctx.mailbox.wait_for_code(email, ctx.code_timeout)
+    if not code:
+        raise LoadTestError("no code delivered")
+    response = step("verify", "/auth/verify/", {CSRF_FIELD: client.csrf_token(), "email": email, "code": code})
+    if "/profile/" not in response.url:
+        raise LoadTestError("login did not reach the profile")
+    step("logout", "/auth/logout/", None)
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario("home", "Landing page", _home),
+        Scenario("shop", "Catalog, category filters and autocomplete", _shop),
+        Scenario("articles", "Article list and a random article", _articles),
+        Scenario("order", "Order form and submission (email + Telegram notifications)", _order),
+        Scenario("login", "Email code login through the SMTP stub", _login, needs_mailbox=True),
+    )
+}
+
+
+def _iteration(scenario: Scenario, client: LoadClient, ctx: ScenarioContext, rng: random.Random, stats) -> None:
+    def step(name: str, path: str, data: dict | None) -> requests.Response:
+        started = time.perf_counter()
+        response = client.request("POST" if data is not None else "GET", path, data)
+        stats.record(name, time.perf_counter() - started)
+        if response.status_code >= 400:
+            raise LoadTestError(f"{name}: HTTP {response.status_code}")
+        return response
+
+    try:
+        scenario.run(step, client, ctx, rng)
+    except LoadTestError as exc:
+        stats.fail(str(exc))
+    except requests.RequestException as exc:
+        stats.fail(type(exc).__name__)
+    else:
+        stats.finish_iteration()
+
+
+def _run_phase(scenario, ctx, client_factory, stats: ScenarioStats, concurrency: int, seconds: float, seed: int):
+    deadline = time.perf_counter() + seconds
+
+    def worker(index: int) -> None:
+        rng = random.Random(seed * 1000 + index)
+        client = client_factory()
+        while time.perf_counter() < deadline:
+            _iteration(scenario, client, ctx, rng, stats)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(worker, range(concurrency)))
+    stats.elapsed = time.perf_counter() - started
+
+
+def run_scenario(
+    scenario: Scenario,
+    ctx: ScenarioContext,
+    client_factory: Callable[[], LoadClient],
+    *,
+    concurrency: int,
+    duration: float,
+    warmup: float = 0,
+    seed: int = 0,
+) -> ScenarioStats:
+    if warmup > 0:
+        _run_phase(scenario, ctx, client_factory, ScenarioStats(scenario.name), concurrency, warmup, seed)
+    stats = ScenarioStats(scenario.name)
+    _run_phase(scenario, ctx, client_factory, stats, concurrency, duration, seed + 1)
+    return stats
+
+
+def compare_reports(previous: dict, current: dict) -> list[str]:
+    lines = []
+    for name, now in current.get("scenarios", {}).items():
+        before = previous.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        parts = []
+        for key in ("p50_ms", "p95_ms", "p99_ms", "rps"):
+            old, new = before.get(key) or 0, now.get(key) or 0
+            change = f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+            parts.append(f"{key} {old} -> {new} ({change})")
+        lines.append(f"{name}: " + ", ".join(parts))
+    return lines
+
+
+def load_report(path) -> dict:
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+class Mailbox:
+    def __init__(self):
+        self._messages: dict[str, list[str]] = {}
+        self._changed = threading.Condition()
+        self.received = 0
+
+    def deliver(self, recipients: list[str], raw: bytes) -> None:
+        message = message_from_bytes(raw)
+        part = next((item for item in message.walk() if item.get_content_type() == "text/plain"), message)
+        payload = part.get_payload(decode=True) or b""
+        body = payload.decode(part.get_content_charset() or "utf-8", errors="replace")
+        with self._changed:
+            self.received += 1
+            for recipient in recipients:
+                self._messages.setdefault(recipient.lower(), []).append(body)
+            self._changed.notify_all()
+
+    def wait_for_code(self, email: str, timeout: float) -> str | None:
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            while True:
+                for body in reversed(self._messages.get(email.lower(), [])):
+                    match = CODE_PATTERN.search(body)
+                    if match:
+                        self._messages.pop(email.lower(), None)
+                        return match.group(1)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._changed.wait(remaining)
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+    def _reply(self, *lines: str) -> None:
+        self.wfile.write("".join(f"{line}\r\n" for line in lines).encode())
+
+    def handle(self):
+        self._reply("220 loadtest ESMTP")
+        recipients: list[str] = []
+        lines: list[bytes] = []
+        in_data = False
+        for raw in self.rfile:
+            line = raw.rstrip(b"\r\n")
+            if in_data:
+                if line == b".":
+                    self.server.mailbox.deliver(recipients, b"\r\n".join(lines))
+                    recipients, lines, in_data = [], [], False
+                    self._reply("250 OK")
+                else:
+                    lines.append(line[1:] if line.startswith(b"..") else line)
+                continue
+            command = line[:4].upper()
+            if command == b"EHLO":
+                self._reply("250-loadtest", "250-8BITMIME", "250 SMTPUTF8")
+            elif command == b"RCPT":
+                recipients.append(parseaddr(line.split(b":", 1)[-1].decode(errors="replace"))[1])
+                self._reply("250 OK")
+            elif command == b"DATA":
+                in_data = True
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+            elif command == b"QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("250 OK")
+
+
+class SmtpStub(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address: tuple[str, int], mailbox: Mailbox):
+        self.mailbox = mailbox
+        super().__init__(address, _SmtpHandler)
+
+
+class _TelegramHandler(BaseHTTPRequestHandler):
+    def _respond(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        with self.server.lock:
+            self.server.calls += 1
+            message_id = self.server.calls
+        method = self.path.rsplit("/", 1)[-1].split("?", 1)[0]
+        result = [] if method == "getUpdates" else {"message_id": message_id}
+        body = json.dumps({"ok": True, "result": result}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TelegramStub(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int]):
+        self.calls = 0
+        self.lock = threading.Lock()
+        super().__init__(address, _TelegramHandler)
+
+
+def start_in_thread(server: socketserver.BaseServer) -> threading.Thread:
+    thread = threading.Thread(target=server.serve_forever, name=type(server).__name__, daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+NO_REQUEST = "-"
+# LogRecord attributes that are not user-supplied `extra` fields.
+RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime", "request_id", "taskName"}
+
+_request_id: ContextVar[str] = ContextVar("request_id", default=NO_REQUEST)
+_fields: ContextVar[dict | None] = ContextVar("log_fields", default=None)
+
+
+def get_request_id() -> str:
+    return _request_id.get()
+
+
+@contextmanager
+def request_context(request_id: str):
+    # Everything logged inside, including by threads started with a copied context, carries this id.
+    id_token = _request_id.set(request_id)
+    fields: dict = {}
+    fields_token = _fields.set(fields)
+    try:
+        yield fields
+    finally:
+        _fields.reset(fields_token)
+        _request_id.reset(id_token)
+
+
+def annotate(**values) -> None:
+    fields = _fields.get()
+    if fields is not None:
+        fields.update(values)
+
+
+class RequestIdFilter(logging.Filter):
+    def filter(self, record):
+        record.request_id = _request_id.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            "request_id": getattr(record, "request_id", NO_REQUEST),
+        }
+        for key, value in record.__dict__.items():
+            if key not in RECORD_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            payload["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    # Records are formatted in the calling thread and written by a listener thread.
+    # A full queue drops records instead of stalling a gunicorn worker on a slow stdout/journald.
+    def __init__(self, stream=None, maxsize: int = 10000):
+        self.maxsize = maxsize
+        self.target = logging.StreamHandler(stream or sys.stderr)
+        self.target.setFormatter(logging.Formatter("%(message)s"))
+        self.dropped = 0
+        self.listener: QueueListener | None = None
+        self._pid = 0
+        self._start_lock = threading.Lock()
+        super().__init__(queue.Queue(maxsize))
+        self._start()
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            # After a fork the parent's listener thread does not exist here; start a fresh one.
+            self.queue = queue.Queue(self.maxsize)
+            self.listener = QueueListener(self.queue, self.target)
+            self.listener.start()
+            self._pid = os.getpid()
+
+    def enqueue(self, record):
+        if self._pid != os.getpid():
+            self._start()
+        try:
+            if self.dropped:
+                self.queue.put_nowait(
+                    logging.makeLogRecord(
+                        {
+                            "name": __name__,
+                            "levelno": logging.WARNING,
+                            "levelname": "WARNING",
+                            "msg": json.dumps({"level": "WARNING", "logger": __name__, "dropped": self.dropped}),
+                        }
+                    )
+                )
+                self.dropped = 0
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self):
+        listener, self.listener = self.listener, None
+        if listener is not None and self._pid == os.getpid():
+            listener.stop()
+        self.target.close()
+        super().close()
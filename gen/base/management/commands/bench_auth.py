@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from base.benchmarks import (
+    DEFAULT_TOLERANCE,
+    auth_benchmarks,
+    baseline_path,
+    compare_to_baseline,
+    load_baseline,
+    machine_info,
+    run_benchmarks,
+    save_baseline,
+)
+
+
+class Command(BaseCommand):
+    help = "Benchmark auth code issue/verify and user lookup on the configured database and compare to a baseline"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--bench", action="append", help="Run only this benchmark (repeatable)")
+        parser.add_argument("--iterations", type=int, default=20, help="Minimum timed runs per benchmark")
+        parser.add_argument("--min-time", type=float, default=1.0, help="Keep sampling until this many seconds")
+        parser.add_argument("--warmup", type=int, default=2)
+        parser.add_argument(
+            "--background-rows",
+            type=int,
+            default=2000,
+            help="Old auth codes inserted first so lookups run against a populated table",
+        )
+        parser.add_argument("--baseline", default="", help="Baseline JSON (default: benchmarks/auth-<vendor>.json)")
+        parser.add_argument("--save-baseline", action="store_true", help="Overwrite the baseline with this run")
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=DEFAULT_TOLERANCE,
+            help="Allowed median slowdown before failing, as a fraction (0.25 = 25%%)",
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options["baseline"]) if options["baseline"] else baseline_path()
+        names = options["bench"]
+        unknown = sorted(set(names or ()) - {bench.name for bench in auth_benchmarks()})
+        if unknown:
+            raise CommandError(f"Unknown benchmark: {', '.join(unknown)}")
+
+        self.stdout.write(f"Benchmarking on {connection.vendor} ({connection.settings_dict['NAME']})...")
+        results = run_benchmarks(
+            names,
+            iterations=max(1, options["iterations"]),
+            min_time=max(0.0, options["min_time"]),
+            warmup=max(0, options["warmup"]),
+            background_rows=max(0, options["background_rows"]),
+        )
+        current = {name: result.as_dict() for name, result in results.items()}
+        for name, stats in current.items():
+            self.stdout.write(
+                f"  {name:30} median {stats['median_ms']:>9} ms  p95 {stats['p95_ms']:>9} ms  "
+                f"{stats['ops_per_s']:>8} ops/s"
+            )
+
+        if options["save_baseline"]:
+            save_baseline(path, {**load_baseline(path).get("benchmarks", {}), **current})
+            self.stdout.write(self.style.SUCCESS(f"Baseline saved to {path}."))
+            return
+
+        baseline = load_baseline(path)
+        if not baseline:
+            self.stdout.write(self.style.WARNING(f"No baseline at {path}; run with --save-baseline to record one."))
+            return
+        if baseline.get("machine") != machine_info():
+            self.stdout.write(
+                self.style.WARNING(f"Baseline was recorded on {baseline.get('machine')}; timings may not be comparable.")
+            )
+
+        rows = compare_to_baseline(current, baseline.get("benchmarks", {}), options["tolerance"])
+        regressions = [name for name, _, regressed in rows if regressed]
+        for name, line, regressed in rows:
+            style = self.style.ERROR if regressed else self.style.SUCCESS
+            self.stdout.write(style(f"  {name:30} {line}"))
+        if regressions:
+            raise CommandError(f"Slower than baseline by more than {options['tolerance']:.0%}: {', '.join(regressions)}")
+        self.stdout.write(self.style.SUCCESS(f"Auth benchmarks within {options['tolerance']:.0%} of the baseline."))
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import re
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from base.catalog import ORDERINGS
+from base.dashboard import PANELS
+from base.models import Article, ArticleSubmission, OrderRequest, Product, ShopPreorder
+
+SEQ_SCAN_PATTERNS = {
+    "postgresql": re.compile(r"Seq Scan on (\w+)"),
+    # "SCAN t USING INDEX ..." walks an index; a bare "SCAN t" reads the whole table.
+    "sqlite": re.compile(r"\bSCAN (\w+)(?! USING)(?:\s|$)"),
+}
+
+
+def key_querysets() -> list[tuple[str, object]]:
+    product = Product.objects.only("pk").first()
+    category_id = product.category_id if product else 0
+    checks = []
+    for key in ("orders", "preorders", "submissions"):
+        panel = PANELS[key]
+        ordered = panel.queryset().order_by(f"-{panel.date_field}", "-pk")
+        new_status = panel.status_choices[0][0]
+        checks.append((f"dashboard {key}", ordered[:50]))
+        checks.append((f"dashboard {key} status={new_status}", ordered.filter(status=new_status)[:50]))
+    checks += [
+        ("new orders count", OrderRequest.objects.filter(status="new").values("pk")),
+        ("new preorders count", ShopPreorder.objects.filter(status="new").values("pk")),
+        ("pending submissions count", ArticleSubmission.objects.filter(status="pending").values("pk")),
+        ("latest published articles", Article.objects.filter(is_published=True).order_by("-created_at")[:20]),
+        (
+            "shop category page",
+            Product.objects.filter(is_active=True, category_id=category_id).order_by(*ORDERINGS["name"][1])[:24],
+        ),
+        (
+            "shop autocomplete",
+            Product.objects.filter(is_active=True, search_name__startswith="ко").order_by("search_name", "pk")[:10],
+        ),
+    ]
+    return checks
+
+
+class Command(BaseCommand):
+    help = "EXPLAIN the project's hot querysets and fail if any of them scans a large table"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--min-rows",
+            type=int,
+            default=1000,
+            help="Ignore sequential scans on tables with fewer rows (planners prefer them there)",
+        )
+        parser.add_argument("--verbose-plans", action="store_true", help="Print every plan")
+
+    def handle(self, *args, **options):
+        pattern = SEQ_SCAN_PATTERNS.get(connection.vendor)
+        if pattern is None:
+            raise CommandError(f"Query plan checks are not supported on {connection.vendor}")
+        if connection.vendor == "sqlite":
+            # Without statistics SQLite guesses table sizes and may skip useful indexes.
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE")
+
+        models_by_table = {model._meta.db_table: model for model in apps.get_models()}
+        row_counts: dict[str, int] = {}
+        failures = []
+        checks = key_querysets()
+        for name, queryset in checks:
+            plan = queryset.explain()
+            if options["verbose_plans"]:
+                self.stdout.write(f"-- {name}\n{plan}\n")
+            for table in sorted(set(pattern.findall(plan))):
+                model = models_by_table.get(table)
+                if model is None:
+                    continue
+                if table not in row_counts:
+                    row_counts[table] = model._default_manager.count()
+                if row_counts[table] >= options["min_rows"]:
+                    failures.append(f"{name}: sequential scan on {table} ({row_counts[table]} rows)")
+
+        if failures:
+            raise CommandError("Query plans fall back to sequential scans:\n" + "\n".join(failures))
+        self.stdout.write(self.style.SUCCESS(f"Query plans OK: {len(checks)} querysets checked."))
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from base.dashboard import PANELS
+from base.exports import EXPORT_FORMATS, export_filename, export_rows, iter_csv, write_xlsx
+from base.forms import DashboardFilterForm
+
+
+class Command(BaseCommand):
+    help = "Export orders, preorders or users to CSV/XLSX in the dashboard export format"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            choices=[key for key, panel in PANELS.items() if panel.exportable],
+            default="orders",
+            help="What to export",
+        )
+        parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv")
+        parser.add_argument("--status", default="", help="Only rows with this status")
+        parser.add_argument("--date-from", default="", help="YYYY-MM-DD, inclusive")
+        parser.add_argument("--date-to", default="", help="YYYY-MM-DD, inclusive")
+        parser.add_argument(
+            "--output",
+            default="",
+            help="Target file (default: <model>-<date>.<format> in the current directory)",
+        )
+
+    def handle(self, *args, **options):
+        key = options["model"]
+        fmt = options["format"]
+        params = {
+            "status": options["status"],
+            "date_from": options["date_from"],
+            "date_to": options["date_to"],
+        }
+        params = {name: value for name, value in params.items() if value}
+        output = Path(options["output"] or export_filename(key, fmt))
+
+        # Invalid filters are ignored by the export, which would silently dump everything.
+        form = DashboardFilterForm(params or None, status_choices=PANELS[key].status_choices)
+        if params and not form.is_valid():
+            raise CommandError(form.errors.as_text())
+
+        rows = export_rows(key, params)
+        count = -1  # header row
+
+        def counted():
+            nonlocal count
+            for row in rows:
+                count += 1
+                yield row
+
+        if fmt == "csv":
+            with output.open("w", encoding="utf-8", newline="") as fh:
+                for chunk in iter_csv(counted()):
+                    fh.write(chunk)
+        else:
+            try:
+                with output.open("wb") as fh:
+                    write_xlsx(counted(), fh, PANELS[key].title)
+            except ImportError as exc:
+                raise CommandError("openpyxl is required for XLSX: pip install openpyxl") from exc
+
+        self.stdout.write(self.style.SUCCESS(f"Exported {count} rows to {output}."))
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from base.fake_data import FAKE_BATCH_SIZE, generate_fake_data
+
+# Defaults approximate a few years of traffic for a regional contractor with a shop.
+VOLUME_OPTIONS = {
+    "users": (500, "Users (60%% get a profile with a phone)"),
+    "orders": (5000, "Order requests"),
+    "preorders": (2000, "Shop preorders"),
+    "articles": (300, "Articles"),
+    "images_per_article": (3, "Images attached to each article"),
+    "submissions": (200, "Article submissions with one image each"),
+    "products": (2000, "Products spread over the shop categories"),
+}
+
+
+class Command(BaseCommand):
+    help = "Fill the database with synthetic users, orders, preorders, articles, images and products for load tests"
+
+    def add_arguments(self, parser):
+        for name, (default, help_text) in VOLUME_OPTIONS.items():
+            parser.add_argument(f"--{name.replace('_', '-')}", dest=name, type=int, default=default, help=help_text)
+        parser.add_argument("--scale", type=float, default=1.0, help="Multiply every volume, e.g. 0.1 or 10")
+        parser.add_argument("--days", type=int, default=365, help="Spread creation dates over the last N days")
+        parser.add_argument("--image-pool", type=int, default=12, help="Distinct placeholder images to store")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--tag", default="", help="Suffix for slugs and usernames (default: current time)")
+        parser.add_argument("--batch-size", type=int, default=FAKE_BATCH_SIZE)
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Allow running with DEBUG off (the data cannot be told apart from real records by the site)",
+        )
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG and not options["force"]:
+            raise CommandError("Refusing to generate fake data with DEBUG off; pass --force for a staging copy.")
+        scale = options["scale"]
+        if scale <= 0:
+            raise CommandError("--scale must be positive")
+
+        volumes = {name: max(0, round(options[name] * scale)) for name in VOLUME_OPTIONS}
+        volumes["images_per_article"] = max(0, options["images_per_article"])
+        tag = options["tag"] or timezone.now().strftime("%Y%m%d%H%M%S")
+        result = generate_fake_data(
+            tag=tag,
+            days=max(1, options["days"]),
+            image_pool=max(0, options["image_pool"]),
+            seed=options["seed"],
+            batch_size=max(1, options["batch_size"]),
+            **volumes,
+        )
+        # Bulk inserts bypass the signals that keep the dashboard rollup current.
+        call_command("rebuild_metrics", stdout=self.stdout)
+        self.stdout.write(self.style.SUCCESS(f"Fake data ({tag}): {result.summary()}."))
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from base.catalog_import import IMPORT_BATCH_SIZE, CatalogImporter, CatalogImportError
+
+
+class Command(BaseCommand):
+    help = "Import products and categories from a CSV/XLSX supplier price list"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Price list (.csv or .xlsx)")
+        parser.add_argument(
+            "--deactivate-missing",
+            action="store_true",
+            help="Hide active products that are not in the price list",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report changes and roll them back",
+        )
+        parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        if not path.is_file():
+            raise CommandError(f"File not found: {path}")
+
+        importer = CatalogImporter(
+            deactivate_missing=bool(options["deactivate_missing"]),
+            batch_size=max(1, int(options["batch_size"])),
+        )
+        try:
+            with path.open("rb") as fh:
+                result = importer.run(fh, path.name, dry_run=bool(options["dry_run"]))
+        except CatalogImportError as exc:
+            raise CommandError(str(exc)) from exc
+
+        for error in result.errors:
+            self.stderr.write(self.style.WARNING(error))
+        prefix = "Dry run: " if options["dry_run"] else ""
+        self.stdout.write(self.style.SUCCESS(f"{prefix}Catalog import: {result.summary()}."))
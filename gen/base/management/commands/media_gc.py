@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import os
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from base.models import ArticleImage, MediaBlob, SubmissionImage
+
+
+class Command(BaseCommand):
+    help = "Reconcile media reference counts and remove orphaned media files"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report what would be removed",
+        )
+        parser.add_argument(
+            "--min-age-hours",
+            type=float,
+            default=24,
+            help="Skip files younger than this (uploads still in flight)",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = bool(options["dry_run"])
+        min_age_seconds = max(0.0, float(options["min_age_hours"])) * 3600
+        media_root = str(settings.MEDIA_ROOT)
+
+        references: Counter[str] = Counter()
+        for model in (ArticleImage, SubmissionImage):
+            for name in model.objects.values_list("image", flat=True).iterator(chunk_size=2000):
+                if name:
+                    references[name] += 1
+
+        updated = 0
+        stale_blobs: list[int] = []
+        for blob in MediaBlob.objects.all().iterator(chunk_size=2000):
+            actual = references.get(blob.name, 0)
+            if actual != blob.ref_count:
+                updated += 1
+                if not dry_run:
+                    MediaBlob.objects.filter(pk=blob.pk).update(ref_count=actual)
+            if actual == 0:
+                stale_blobs.append(blob.pk)
+
+        # Loaded once: blobs referenced again since the reconcile above must survive the walk.
+        live_blobs = set(MediaBlob.objects.filter(ref_count__gt=0).values_list("name", flat=True))
+        now = time.time()
+        removed_files = 0
+        removed_bytes = 0
+        for dirpath, _dirnames, filenames in os.walk(media_root):
+            for filename in filenames:
+                full_path = os.path.join(dirpath, filename)
+                name = os.path.relpath(full_path, media_root).replace(os.sep, "/")
+                if name in references:
+                    continue
+                try:
+                    stat = os.stat(full_path)
+                except FileNotFoundError:
+                    continue
+                if now - stat.st_mtime < min_age_seconds:
+                    continue
+                if name in live_blobs:
+                    continue
+                removed_files += 1
+                removed_bytes += stat.st_size
+                if dry_run:
+                    self.stdout.write(f"orphan: {name}")
+                else:
+                    os.remove(full_path)
+
+        if not dry_run and stale_blobs:
+            # Blobs re-referenced after the scan are kept by the ref_count guard.
+            MediaBlob.objects.filter(pk__in=stale_blobs, ref_count=0).delete()
+
+        prefix = "[dry-run] " if dry_run else ""
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefix}ref counts fixed: {updated}, "
+                f"orphan files: {removed_files} ({removed_bytes / 1024 / 1024:.1f} MB), "
+                f"stale blobs: {len(stale_blobs)}"
+            )
+        )
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from pathlib import Path, PurePosixPath
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.management.base import BaseCommand
+
+from base.imaging import (
+    MANIFEST_NAME,
+    OPTIMIZED_PREFIX,
+    SOURCE_EXTENSIONS,
+    build_variants,
+    load_manifest,
+    write_manifest,
+)
+
+
+class Command(BaseCommand):
+    help = "Build resized JPEG/PNG + WebP variants of static images into STATIC_ROOT"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--prefix",
+            default="base/img/",
+            help="Only process static files under this path",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Rebuild variants even if the source did not change",
+        )
+
+    def handle(self, *args, **options):
+        prefix = options["prefix"]
+        existing = load_manifest()
+        previous = {} if options["force"] else existing
+        manifest = {name: entry for name, entry in existing.items() if not name.startswith(prefix)}
+        seen: set[str] = set()
+
+        for finder in finders.get_finders():
+            for path, storage in finder.list([]):
+                name = path.replace("\\", "/")
+                if getattr(storage, "prefix", None):
+                    name = f"{storage.prefix}/{name}"
+                if name in seen or not name.startswith(prefix):
+                    continue
+                if PurePosixPath(name).suffix.lower() not in SOURCE_EXTENSIONS:
+                    continue
+                seen.add(name)
+                try:
+                    entry = build_variants(name, storage.path(path), previous.get(name))
+                except OSError as exc:
+                    self.stderr.write(self.style.WARNING(f"Skipped {name}: {exc}"))
+                    continue
+                manifest[name] = entry
+                if entry is not previous.get(name):
+                    widths = ", ".join(str(item["width"]) for item in entry["variants"])
+                    self.stdout.write(f"{name}: {widths}")
+
+        write_manifest(manifest)
+        self._remove_stale(manifest)
+        self.stdout.write(self.style.SUCCESS(f"Static image manifest written: {len(manifest)} images."))
+
+    def _remove_stale(self, manifest: dict[str, dict]) -> None:
+        keep = {MANIFEST_NAME}
+        for entry in manifest.values():
+            for item in entry["variants"]:
+                keep.update((item["fallback"], item["webp"]))
+        out_dir = Path(settings.STATIC_ROOT) / OPTIMIZED_PREFIX
+        for path in out_dir.iterdir():
+            if path.is_file() and f"{OPTIMIZED_PREFIX}/{path.name}" not in keep:
+                path.unlink()
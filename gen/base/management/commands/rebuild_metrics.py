@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from collections import Counter
+from datetime import datetime, time, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from base.metrics import METRIC_LOGINS, METRIC_ORDERS, METRIC_PREORDERS, METRIC_USERS, TOTAL
+from base.models import DailyMetrics, OrderRequest, ShopPreorder
+
+
+class Command(BaseCommand):
+    help = "Recompute the DailyMetrics rollup from orders, preorders and users"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=0,
+            help="Only rebuild the last N days (0 = full history)",
+        )
+
+    def handle(self, *args, **options):
+        days = max(0, int(options["days"]))
+        start = timezone.localdate() - timedelta(days=days - 1) if days else None
+        tz = timezone.get_current_timezone()
+
+        counts: Counter[tuple] = Counter()
+        sources = (
+            (METRIC_ORDERS, OrderRequest.objects.all(), "created_at", "article_id", "article"),
+            (METRIC_PREORDERS, ShopPreorder.objects.all(), "created_at", "category_id", "category"),
+        )
+        for metric, queryset, date_field, source_field, source_label in sources:
+            queryset = self._since(queryset, date_field, start, tz)
+            rows = (
+                queryset.annotate(day=TruncDate(date_field, tzinfo=tz))
+                .values("day", "status", source_field)
+                .annotate(total=Count("pk"))
+                .order_by()
+            )
+            for row in rows.iterator():
+                day, total = row["day"], row["total"]
+                counts[(day, metric, TOTAL)] += total
+                counts[(day, metric, f"status:{row['status']}")] += total
+                counts[(day, metric, f"{source_label}:{row[source_field] or 'none'}")] += total
+
+        users = self._since(get_user_model().objects.all(), "date_joined", start, tz)
+        rows = (
+            users.annotate(day=TruncDate("date_joined", tzinfo=tz))
+            .values("day")
+            .annotate(total=Count("pk"))
+            .order_by()
+        )
+        for row in rows.iterator():
+            counts[(row["day"], METRIC_USERS, TOTAL)] += row["total"]
+
+        stale = DailyMetrics.objects.exclude(metric=METRIC_LOGINS)
+        if start:
+            stale = stale.filter(date__gte=start)
+        objects = [
+            DailyMetrics(date=day, metric=metric, dimension=dimension, value=value)
+            for (day, metric, dimension), value in counts.items()
+            if value
+        ]
+        with transaction.atomic():
+            # Logins are only known at the time they happen, so they are never rebuilt.
+            deleted, _ = stale.delete()
+            DailyMetrics.objects.bulk_create(objects, batch_size=500)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Metrics rebuilt: {len(objects)} rows written, {deleted} replaced.")
+        )
+
+    def _since(self, queryset, date_field, start, tz):
+        if not start:
+            return queryset
+        since = timezone.make_aware(datetime.combine(start, time.min), tz)
+        return queryset.filter(**{f"{date_field}__gte": since})
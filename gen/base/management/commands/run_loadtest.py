@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+import platform
+import subprocess
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from base.catalog import price_buckets
+from base.loadtest import (
+    SCENARIOS,
+    LoadClient,
+    Mailbox,
+    ScenarioContext,
+    SmtpStub,
+    TelegramStub,
+    compare_reports,
+    load_report,
+    run_scenario,
+    start_in_thread,
+)
+from base.models import Article, Product, ProductCategory
+
+
+def _git_commit() -> str:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    return result.stdout.strip()
+
+
+def _search_terms(limit: int = 40) -> list[str]:
+    names = Product.objects.filter(is_active=True).order_by("?").values_list("search_name", flat=True)[:limit]
+    return sorted({name[:3] for name in names if len(name) >= 3})
+
+
+class Command(BaseCommand):
+    help = "Run the load-test scenarios against a running server and write p50/p95/p99 and throughput to JSON"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="Server under test (gunicorn bind)")
+        parser.add_argument("--host", default="", help="Host header to send (must be in DJANGO_ALLOWED_HOSTS)")
+        parser.add_argument(
+            "--forwarded-proto",
+            default="https",
+            help="X-Forwarded-Proto to send, as nginx does; pass an empty value for a DEBUG runserver",
+        )
+        parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="Repeatable; default all")
+        parser.add_argument("--concurrency", type=int, default=8, help="Parallel virtual users per scenario")
+        parser.add_argument("--duration", type=float, default=30, help="Measured seconds per scenario")
+        parser.add_argument("--warmup", type=float, default=3, help="Unmeasured seconds before each scenario")
+        parser.add_argument("--timeout", type=float, default=30, help="Per-request timeout in seconds")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--smtp-port", type=int, default=2525, help="Port for the fake SMTP server (0 = off)")
+        parser.add_argument("--telegram-port", type=int, default=8089, help="Port for the fake Telegram API (0 = off)")
+        parser.add_argument("--output", default="", help="JSON report path (default: loadtest-<commit>-<time>.json)")
+        parser.add_argument("--compare", default="", help="Earlier JSON report to print the difference against")
+
+    def handle(self, *args, **options):
+        names = options["scenario"] or list(SCENARIOS)
+        concurrency = max(1, options["concurrency"])
+        previous = load_report(options["compare"]) if options["compare"] else None
+
+        mailbox = Mailbox() if options["smtp_port"] else None
+        servers = []
+        if mailbox:
+            servers.append(SmtpStub(("127.0.0.1", options["smtp_port"]), mailbox))
+        if options["telegram_port"]:
+            servers.append(TelegramStub(("127.0.0.1", options["telegram_port"])))
+        for server in servers:
+            start_in_thread(server)
+
+        skipped = [name for name in names if SCENARIOS[name].needs_mailbox and not mailbox]
+        if skipped:
+            self.stderr.write(self.style.WARNING(f"Skipping {', '.join(skipped)}: the SMTP stub is off."))
+        names = [name for name in names if name not in skipped]
+        if not names:
+            raise CommandError("No scenarios to run")
+
+        ctx = ScenarioContext(
+            category_slugs=list(ProductCategory.objects.filter(is_active=True).values_list("slug", flat=True)),
+            article_slugs=list(
+                Article.objects.filter(is_published=True).order_by("-created_at").values_list("slug", flat=True)[:200]
+            ),
+            search_terms=_search_terms(),
+            price_keys=[bucket.key for bucket in price_buckets()],
+            mailbox=mailbox,
+        )
+
+        def client_factory() -> LoadClient:
+            return LoadClient(
+                options["base_url"],
+                host=options["host"],
+                forwarded_proto=options["forwarded_proto"],
+                timeout=options["timeout"],
+            )
+
+        commit = _git_commit()
+        report = {
+            "commit": commit,
+            "started_at": timezone.now().isoformat(),
+            "base_url": options["base_url"],
+            "concurrency": concurrency,
+            "duration_s": options["duration"],
+            "python": platform.python_version(),
+            "scenarios": {},
+        }
+        try:
+            for name in names:
+                self.stdout.write(f"Running {name} ({SCENARIOS[name].description})...")
+                stats = run_scenario(
+                    SCENARIOS[name],
+                    ctx,
+                    client_factory,
+                    concurrency=concurrency,
+                    duration=max(1.0, options["duration"]),
+                    warmup=max(0.0, options["warmup"]),
+                    seed=options["seed"],
+                )
+                result = stats.as_dict()
+                report["scenarios"][name] = result
+                self.stdout.write(
+                    f"  {result['requests']} requests, {result['rps']} req/s, p50 {result['p50_ms']} ms, "
+                    f"p95 {result['p95_ms']} ms, p99 {result['p99_ms']} ms, {result['errors']} errors"
+                )
+                for reason, count in result["error_reasons"].items():
+                    self.stderr.write(self.style.WARNING(f"    {count} x {reason}"))
+        finally:
+            for server in servers:
+                server.shutdown()
+                server.server_close()
+
+        output = Path(
+            options["output"] or f"loadtest-{commit or 'nogit'}-{timezone.now().strftime('%Y%m%d-%H%M%S')}.json"
+        )
+        output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        if previous:
+            for line in compare_reports(previous, report):
+                self.stdout.write(line)
+        self.stdout.write(self.style.SUCCESS(f"Load test report written to {output}."))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import time
 from typing import Any
 
@@ -9,6 +10,9 @@ from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand, CommandError
 
 from base.access import normalize_email
+from base.bulk import BULK_MAX_IDS, bulk_set_status, parse_id_list
+from base.health import write_heartbeat
+from base.logs import request_context
 from base.models import AdminEmailAccess, OrderRequest, ShopPreorder, TelegramAuthCode
 from base.telegram import get_admin_chat_ids, send_telegram_message
 
@@ -21,9 +25,11 @@ HELP_TEXT = (
     "/orders [N] - последние заявки\n"
     "/order <id> - детали заявки\n"
     "/set_order <id> <new|in_progress|done>\n"
+    "/set_orders <id,id,...> <new|in_progress|done>\n"
     "/preorders [N] - последние предзаказы\n"
     "/preorder <id> - детали предзаказа\n"
     "/set_preorder <id> <new|in_progress|done>\n"
+    "/set_preorders <id,id,...> <new|in_progress|done>\n"
     "/admins - активные админы\n"
     "/grant <email> - выдать админ-доступ\n"
     "/revoke <email> - отключить админ-доступ"
@@ -32,6 +38,7 @@ HELP_TEXT = (
 ORDER_STATUS_KEYS = {item[0] for item in OrderRequest.STATUS_CHOICES}
 PREORDER_STATUS_KEYS = {item[0] for item in ShopPreorder.STATUS_CHOICES}
 User = get_user_model()
+logger = logging.getLogger("base.telegram_bot")
 
 
 class Command(BaseCommand):
@@ -65,6 +72,7 @@ class Command(BaseCommand):
         self.poll_timeout = max(1, int(options["poll_timeout"]))
         self.sleep = max(0.2, float(options["sleep"]))
         self.offset = self._get_start_offset()
+        self._heartbeat()
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -79,7 +87,10 @@ class Command(BaseCommand):
                     update_id = int(update.get("update_id", 0))
                     if update_id:
                         self.offset = max(self.offset, update_id + 1)
-                    self._handle_update(update)
+                    with request_context(f"tg-{update_id}"):
+                        self._handle_update(update)
+                # Only a completed getUpdates cycle counts; a loop that keeps failing goes stale.
+                self._heartbeat()
                 if self.once:
                     break
                 time.sleep(self.sleep)
@@ -87,6 +98,7 @@ class Command(BaseCommand):
                 self.stdout.write(self.style.WARNING("Telegram bot polling interrupted by user."))
                 break
             except Exception as exc:  # noqa: BLE001
+                logger.exception("Telegram bot loop error", extra={"event": "telegram_bot_error"})
                 self.stderr.write(self.style.ERROR(f"Telegram bot loop error: {exc}"))
                 if self.once:
                     raise
@@ -94,9 +106,15 @@ class Command(BaseCommand):
 
         self.stdout.write(self.style.SUCCESS("Telegram bot polling stopped."))
 
+    def _heartbeat(self) -> None:
+        try:
+            write_heartbeat(offset=self.offset)
+        except OSError as exc:
+            logger.warning("Telegram bot heartbeat not written: %s", exc, extra={"event": "telegram_bot_heartbeat"})
+
     def _api_url(self, method: str) -> str:
         token = settings.TELEGRAM_BOT_TOKEN.strip()
-        return f"https://api.telegram.org/bot{token}/{method}"
+        return f"{settings.TELEGRAM_API_URL}/bot{token}/{method}"
 
     def _get_start_offset(self) -> int:
         updates = self._get_updates(offset=None, timeout=1)
@@ -134,7 +152,17 @@ class Command(BaseCommand):
             return
 
         if text.startswith("/"):
+            started = time.perf_counter()
             self._handle_command(chat_id, text)
+            logger.info(
+                "Telegram command handled",
+                extra={
+                    "event": "telegram_command",
+                    "chat_id": chat_id,
+                    "command": text.split(maxsplit=1)[0].split("@", 1)[0],
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                },
+            )
 
     def _is_admin_chat(self, chat_id: str) -> bool:
         configured = {str(item).strip() for item in get_admin_chat_ids() if str(item).strip()}
@@ -254,6 +282,10 @@ class Command(BaseCommand):
             self._send(chat_id, f"Заявка #{order_id} обновлена: {new_status}")
             return
 
+        if command == "/set_orders":
+            self._bulk_set_status(chat_id, command, args, OrderRequest, "Заявки")
+            return
+
         if command == "/preorders":
             limit = self._parse_limit(args)
             rows = ShopPreorder.objects.select_related("category", "product", "user").order_by("-created_at")[:limit]
@@ -312,6 +344,10 @@ class Command(BaseCommand):
             self._send(chat_id, f"Предзаказ #{preorder_id} обновлен: {new_status}")
             return
 
+        if command == "/set_preorders":
+            self._bulk_set_status(chat_id, command, args, ShopPreorder, "Предзаказы")
+            return
+
         if command == "/admins":
             rows = AdminEmailAccess.objects.filter(is_active=True).order_by("email")
             payload = [f"OWNER_EMAIL: {normalize_email(settings.OWNER_EMAIL) or '-'}", "Активные админы:"]
@@ -354,6 +390,25 @@ class Command(BaseCommand):
 
         self._send(chat_id, "Неизвестная команда. /help")
 
+    def _bulk_set_status(self, chat_id: str, command: str, args: list[str], model, label: str) -> None:
+        if len(args) < 2:
+            self._send(chat_id, f"Использование: {command} <id,id,...> <new|in_progress|done>")
+            return
+        new_status = args[-1].strip().lower()
+        statuses = dict(model.STATUS_CHOICES)
+        try:
+            ids = parse_id_list(args[:-1])
+        except ValueError:
+            ids = []
+        if not ids or new_status not in statuses:
+            self._send(chat_id, "Некорректные параметры. Допустимо: new, in_progress, done.")
+            return
+        if len(ids) > BULK_MAX_IDS:
+            self._send(chat_id, f"За раз можно обновить не больше {BULK_MAX_IDS} записей.")
+            return
+        result = bulk_set_status(model, ids, new_status)
+        self._send(chat_id, result.summary(label, statuses[new_status]))
+
     def _parse_limit(self, args: list[str]) -> int:
         default = 10
         if not args:
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+FAMILY = "Montserrat"
+FACE_WEIGHTS = {
+    "Thin": 100,
+    "ExtraLight": 200,
+    "Light": 300,
+    "Regular": 400,
+    "Medium": 500,
+    "SemiBold": 600,
+    "Bold": 700,
+    "ExtraBold": 800,
+    "Black": 900,
+}
+# Same ranges Google Fonts uses for its latin + cyrillic slices.
+UNICODE_RANGE = (
+    "U+0000-00FF, U+0131, U+0152-0153, U+02BB-02BC, U+02C6, U+02DA, U+02DC, "
+    "U+0304, U+0308, U+0329, U+2000-206F, U+20AC, U+2116, U+2122, U+2191, U+2193, "
+    "U+2212, U+2215, U+FEFF, U+FFFD, U+0400-045F, U+0490-0491, U+04B0-04B1"
+)
+GENERATED_CSS = "fonts.css"
+
+WEIGHT_RE = re.compile(r"font-weight\s*:\s*(\d{3}|bold|normal|bolder|lighter)", re.I)
+ITALIC_RE = re.compile(r"font-style\s*:\s*(italic|oblique)", re.I)
+FONT_SHORTHAND_RE = re.compile(r"\bfont\s*:\s*([^;]+);", re.I)
+FONT_FACE_RE = re.compile(r"@font-face\s*\{[^}]*\}", re.I)
+
+
+def _parse_unicode_range(value: str) -> list[int]:
+    codepoints: list[int] = []
+    for part in value.split(","):
+        part = part.strip().upper().removeprefix("U+")
+        if "-" in part:
+            start, end = part.split("-")
+            codepoints.extend(range(int(start, 16), int(end, 16) + 1))
+        elif part:
+            codepoints.append(int(part, 16))
+    return codepoints
+
+
+def _matching_weight(desired: int, available: list[int]) -> int:
+    # CSS Fonts Level 4 font-weight matching.
+    below = sorted((w for w in available if w < desired), reverse=True)
+    above = sorted(w for w in available if w > desired)
+    if desired in available:
+        return desired
+    if 400 <= desired <= 500:
+        up_to_500 = [w for w in above if w <= 500]
+        order = up_to_500 + below + [w for w in above if w > 500]
+    elif desired < 400:
+        order = below + above
+    else:
+        order = above + below
+    return order[0]
+
+
+class Command(BaseCommand):
+    help = "Subset used Montserrat faces to latin+cyrillic WOFF2 and regenerate fonts.css"
+
+    def handle(self, *args, **options):
+        try:
+            from fontTools import subset
+            from fontTools.ttLib import TTFont
+        except ImportError as exc:
+            raise CommandError("fonttools is required: pip install fonttools brotli") from exc
+
+        static_dir = Path(apps.get_app_config("base").path) / "static" / "base"
+        fonts_dir = static_dir / "fonts"
+        css_dir = static_dir / "css"
+        templates_dir = Path(apps.get_app_config("base").path) / "templates"
+
+        faces: dict[tuple[int, str], Path] = {}
+        for path in fonts_dir.glob(f"{FAMILY}-*.ttf"):
+            style_name = path.stem.removeprefix(f"{FAMILY}-")
+            italic = style_name.endswith("Italic")
+            weight_name = style_name.removesuffix("Italic") or "Regular"
+            if weight_name in FACE_WEIGHTS:
+                faces[(FACE_WEIGHTS[weight_name], "italic" if italic else "normal")] = path
+        if not faces:
+            raise CommandError(f"No {FAMILY} TTF files found in {fonts_dir}")
+
+        used = self._used_styles(
+            [p for p in css_dir.glob("*.css") if p.name != GENERATED_CSS]
+            + list(templates_dir.rglob("*.html"))
+        )
+        needed: set[tuple[int, str]] = set()
+        for weight, style in used:
+            candidates = [w for (w, s) in faces if s == style] or [w for (w, _s) in faces]
+            match_style = style if any(s == style for (_w, s) in faces) else "normal"
+            needed.add((_matching_weight(weight, candidates), match_style))
+
+        unicodes = _parse_unicode_range(UNICODE_RANGE)
+        rules = []
+        for weight, style in sorted(needed, key=lambda item: (item[1], item[0])):
+            source = faces[(weight, style)]
+            target = source.with_suffix(".subset.woff2")
+            font = TTFont(source)
+            subsetter = subset.Subsetter(
+                options=subset.Options(layout_features=["*"], name_IDs=["*"], flavor="woff2")
+            )
+            subsetter.populate(unicodes=unicodes)
+            subsetter.subset(font)
+            font.flavor = "woff2"
+            font.save(target)
+            self.stdout.write(
+                f"{source.name} -> {target.name} "
+                f"({source.stat().st_size // 1024} KB -> {target.stat().st_size // 1024} KB)"
+            )
+            rules.append(
+                "@font-face {\n"
+                f'    font-family: "{FAMILY}";\n'
+                f'    src: url("../fonts/{target.name}") format("woff2"),\n'
+                f'        url("../fonts/{source.name}") format("truetype");\n'
+                f"    font-weight: {weight};\n"
+                f"    font-style: {style};\n"
+                "    font-display: swap;\n"
+                f"    unicode-range: {UNICODE_RANGE};\n"
+                "}\n"
+            )
+
+        header = "/* Generated by `manage.py subset_fonts`; do not edit by hand. */\n\n"
+        (css_dir / GENERATED_CSS).write_text(header + "\n".join(rules))
+        self.stdout.write(self.style.SUCCESS(f"{GENERATED_CSS} written with {len(rules)} faces."))
+
+    def _used_styles(self, paths: list[Path]) -> set[tuple[int, str]]:
+        used = {(400, "normal")}
+        for path in paths:
+            text = path.read_text(encoding="utf-8", errors="ignore")
+            text = FONT_FACE_RE.sub("", text)
+            for block in re.split(r"[{}]", text):
+                style = "italic" if ITALIC_RE.search(block) else "normal"
+                weights = [self._weight_value(raw) for raw in WEIGHT_RE.findall(block)]
+                for shorthand in FONT_SHORTHAND_RE.findall(block):
+                    if "italic" in shorthand.lower():
+                        style = "italic"
+                    weights.extend(
+                        self._weight_value(raw)
+                        for raw in re.findall(r"\b([1-9]00|bold)\b", shorthand, re.I)
+                    )
+                if not weights and style == "italic":
+                    weights.append(400)
+                used.update((weight, style) for weight in weights)
+            if re.search(r"<(b|strong|h[1-6])[\s>]", text):
+                used.add((700, "normal"))
+            if re.search(r"<(em|i)[\s>]", text):
+                used.add((400, "italic"))
+        return used
+
+    def _weight_value(self, raw: str) -> int:
+        raw = raw.lower()
+        if raw in {"bold", "bolder"}:
+            return 700
+        if raw in {"normal", "lighter"}:
+            return 400
+        return int(raw)
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from collections import Counter
+from datetime import date, timedelta
+
+from django.db import transaction
+from django.db.models import F
+from django.db.utils import OperationalError, ProgrammingError
+from django.utils import timezone
+
+METRIC_ORDERS = "orders"
+METRIC_PREORDERS = "preorders"
+METRIC_USERS = "users_new"
+METRIC_LOGINS = "logins"
+TOTAL = "total"
+
+
+def metric_for(model) -> str | None:
+    return {"OrderRequest": METRIC_ORDERS, "ShopPreorder": METRIC_PREORDERS}.get(model.__name__)
+
+
+def metric_day(value) -> date:
+    return timezone.localdate(value) if value else timezone.localdate()
+
+
+def dimensions(metric: str, instance) -> list[str]:
+    result = [TOTAL, f"status:{instance.status}"]
+    if metric == METRIC_ORDERS:
+        result.append(f"article:{instance.article_id or 'none'}")
+    elif metric == METRIC_PREORDERS:
+        result.append(f"category:{instance.category_id or 'none'}")
+    return result
+
+
+def bump_many(changes: Counter[tuple[date, str, str]]) -> None:
+    from .models import DailyMetrics
+
+    keys = {key: delta for key, delta in changes.items() if delta}
+    if not keys:
+        return
+    try:
+        with transaction.atomic():
+            # One INSERT for every missing row (existing ones and concurrent inserts are skipped),
+            # then one UPDATE per key.
+            DailyMetrics.objects.bulk_create(
+                [DailyMetrics(date=day, metric=metric, dimension=dimension, value=0) for day, metric, dimension in keys],
+                ignore_conflicts=True,
+            )
+            for (day, metric, dimension), delta in keys.items():
+                DailyMetrics.objects.filter(date=day, metric=metric, dimension=dimension).update(
+                    value=F("value") + delta
+                )
+    except (OperationalError, ProgrammingError):
+        # Migrations may not be applied yet.
+        return
+
+
+def bump(day: date, metric: str, dimension: str = TOTAL, delta: int = 1) -> None:
+    bump_many(Counter({(day, metric, dimension): delta}))
+
+
+def record_created(metric: str, instance) -> None:
+    day = metric_day(instance.created_at)
+    bump_many(Counter({(day, metric, dimension): 1 for dimension in dimensions(metric, instance)}))
+
+
+def record_deleted(metric: str, instance) -> None:
+    day = metric_day(instance.created_at)
+    bump_many(Counter({(day, metric, dimension): -1 for dimension in dimensions(metric, instance)}))
+
+
+def record_status_changes(model, rows, new_status: str) -> None:
+    # rows: (created_at, old_status) pairs of objects moved to new_status.
+    metric = metric_for(model)
+    if metric is None:
+        return
+    changes: Counter[tuple[date, str, str]] = Counter()
+    for created_at, old_status in rows:
+        if old_status == new_status:
+            continue
+        day = metric_day(created_at)
+        changes[(day, metric, f"status:{old_status}")] -= 1
+        changes[(day, metric, f"status:{new_status}")] += 1
+    bump_many(changes)
+
+
+def series(days: int) -> list[dict]:
+    from .models import DailyMetrics
+
+    today = timezone.localdate()
+    start = today - timedelta(days=days - 1)
+    values: dict[tuple[date, str], int] = {}
+    rows = DailyMetrics.objects.filter(date__gte=start, dimension=TOTAL).values_list("date", "metric", "value")
+    for day, metric, value in rows:
+        values[(day, metric)] = value
+    result = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        result.append(
+            {
+                "date": day,
+                METRIC_ORDERS: values.get((day, METRIC_ORDERS), 0),
+                METRIC_PREORDERS: values.get((day, METRIC_PREORDERS), 0),
+                METRIC_USERS: values.get((day, METRIC_USERS), 0),
+                METRIC_LOGINS: values.get((day, METRIC_LOGINS), 0),
+            }
+        )
+    return result
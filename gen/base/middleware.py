@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import logging
+import re
+import time
+import uuid
+from collections import Counter
+
+from django.conf import settings
+from django.db import connection
+
+from . import monitoring
+from .logs import request_context
+
+logger = logging.getLogger(__name__)
+access_logger = logging.getLogger("base.access")
+
+REQUEST_ID_HEADER = "X-Request-ID"
+REQUEST_ID_RE = re.compile(r"^[A-Za-z0-9._-]{8,128}$")
+
+IN_LIST_RE = re.compile(r"\(\s*%s(?:\s*,\s*%s)*\s*\)")
+LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+SPACE_RE = re.compile(r"\s+")
+
+
+def sql_fingerprint(sql: str) -> str:
+    # Same statement shape regardless of IN-list length or inlined literals.
+    sql = IN_LIST_RE.sub("(...)", sql)
+    sql = LITERAL_RE.sub("?", sql)
+    return SPACE_RE.sub(" ", sql).strip()
+
+
+class QueryTimer:
+    def __init__(self, fingerprints: bool = False):
+        self.count = 0
+        self.seconds = 0.0
+        self.fingerprints: Counter[str] | None = Counter() if fingerprints else None
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - started
+            if self.fingerprints is not None:
+                self.fingerprints[sql_fingerprint(sql)] += 1
+
+    def duplicates(self, threshold: int) -> list[tuple[str, int]]:
+        if not self.fingerprints:
+            return []
+        return [(sql, count) for sql, count in self.fingerprints.most_common() if count >= threshold]
+
+
+def user_type(request) -> str:
+    # Only look at a user that the view already loaded; resolving it here would cost a session query.
+    user = getattr(request, "_cached_user", None)
+    if user is None:
+        return "session" if settings.SESSION_COOKIE_NAME in request.COOKIES else "anonymous"
+    if not user.is_authenticated:
+        return "anonymous"
+    if (user.email or "").lower() == settings.OWNER_EMAIL:
+        return "owner"
+    if user.is_superuser or getattr(user, "_is_admin_cache", False):
+        return "admin"
+    return "user"
+
+
+class RequestLogMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        incoming = request.headers.get(REQUEST_ID_HEADER, "")
+        request.id = incoming if REQUEST_ID_RE.match(incoming) else uuid.uuid4().hex
+        # Shared with MetricsMiddleware so every query is timed once.
+        request.query_timer = timer = QueryTimer()
+        started = time.perf_counter()
+        with request_context(request.id) as fields:
+            with connection.execute_wrapper(timer):
+                response = self.get_response(request)
+            response[REQUEST_ID_HEADER] = request.id
+            if getattr(settings, "ACCESS_LOG_ENABLED", True):
+                access_logger.info(
+                    "%s %s %s",
+                    request.method,
+                    request.path,
+                    response.status_code,
+                    extra={
+                        "event": "request",
+                        "method": request.method,
+                        "path": request.path,
+                        "view": monitoring.view_name(request),
+                        "status": response.status_code,
+                        "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                        "db_ms": round(timer.seconds * 1000, 2),
+                        "db_queries": timer.count,
+                        "user_type": user_type(request),
+                        "remote_addr": request.headers.get("X-Real-IP") or request.META.get("REMOTE_ADDR", ""),
+                        "bytes": None if response.streaming else len(response.content),
+                        **fields,
+                    },
+                )
+        return response
+
+
+class MetricsMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not monitoring.metrics_enabled():
+            return self.get_response(request)
+        timer = getattr(request, "query_timer", None)
+        started = time.perf_counter()
+        if timer is None:
+            timer = QueryTimer()
+            with connection.execute_wrapper(timer):
+                response = self.get_response(request)
+        else:
+            response = self.get_response(request)
+        monitoring.observe_request(
+            request,
+            response.status_code,
+            time.perf_counter() - started,
+            timer.count,
+            timer.seconds,
+        )
+        return response
+
+
+class QueryProfilingMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, "QUERY_PROFILING_ENABLED", settings.DEBUG)
+        self.budget_queries = int(getattr(settings, "QUERY_BUDGET_COUNT", 30))
+        self.budget_ms = float(getattr(settings, "QUERY_BUDGET_MS", 200))
+        self.duplicate_threshold = int(getattr(settings, "QUERY_DUPLICATE_THRESHOLD", 3))
+
+    def __call__(self, request):
+        if not self.enabled:
+            return self.get_response(request)
+        timer = QueryTimer(fingerprints=True)
+        started = time.perf_counter()
+        with connection.execute_wrapper(timer):
+            response = self.get_response(request)
+        total_ms = (time.perf_counter() - started) * 1000
+        db_ms = timer.seconds * 1000
+        duplicates = timer.duplicates(self.duplicate_threshold)
+
+        timings = [
+            f'db;dur={db_ms:.1f};desc="{timer.count} queries"',
+            f"app;dur={max(0.0, total_ms - db_ms):.1f}",
+        ]
+        if duplicates:
+            repeated = sum(count for _sql, count in duplicates)
+            timings.append(f'dup;desc="{len(duplicates)} repeated statements, {repeated} runs"')
+        response["Server-Timing"] = ", ".join(filter(None, [response.get("Server-Timing"), *timings]))
+
+        if timer.count > self.budget_queries or db_ms > self.budget_ms or duplicates:
+            logger.warning(
+                "Query budget exceeded: %s %s view=%s queries=%d db=%.1fms total=%.1fms%s",
+                request.method,
+                request.path,
+                monitoring.view_name(request),
+                timer.count,
+                db_ms,
+                total_ms,
+                "".join(f"\n  {count}x {sql[:300]}" for sql, count in duplicates[:5]),
+            )
+        return response
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.3 on 2026-10-19 06:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0008_mediablob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyMetrics',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='День')),
+                ('metric', models.CharField(max_length=32, verbose_name='Метрика')),
+                ('dimension', models.CharField(default='total', max_length=64, verbose_name='Срез')),
+                ('value', models.IntegerField(default=0, verbose_name='Значение')),
+            ],
+            options={
+                'verbose_name': 'Дневная метрика',
+                'verbose_name_plural': 'Дневные метрики',
+                'ordering': ('-date', 'metric', 'dimension'),
+                'constraints': [models.UniqueConstraint(fields=('date', 'metric', 'dimension'), name='daily_metrics_unique')],
+            },
+        ),
+    ]
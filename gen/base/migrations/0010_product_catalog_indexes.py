@@ -0,0 +1,21 @@
+# Generated by Django 5.1.3 on 2026-10-19 06:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0009_dailymetrics'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['is_active', 'category', 'name'], name='product_active_cat_name'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['is_active', 'category', 'price'], name='product_active_cat_price'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.3 on 2026-10-19 06:34
+
+from django.db import migrations, models
+
+
+def fill_search_name(apps, schema_editor):
+    Product = apps.get_model("base", "Product")
+    products = list(Product.objects.only("pk", "name"))
+    for product in products:
+        product.search_name = " ".join((product.name or "").split()).lower()
+    Product.objects.bulk_update(products, ["search_name"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0010_product_catalog_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='search_name',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=140),
+        ),
+        migrations.RunPython(fill_search_name, migrations.RunPython.noop),
+    ]
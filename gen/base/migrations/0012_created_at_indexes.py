@@ -0,0 +1,27 @@
+# Generated by Django 5.1.3 on 2026-10-19 06:35
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0011_product_search_name'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='articlesubmission',
+            index=models.Index(fields=['-created_at'], name='submission_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='orderrequest',
+            index=models.Index(fields=['-created_at'], name='order_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='shoppreorder',
+            index=models.Index(fields=['-created_at'], name='preorder_created_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.1.3 on 2026-10-19 06:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0012_created_at_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-created_at'], name='article_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='articlesubmission',
+            index=models.Index(fields=['status', '-created_at'], name='submission_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='articlesubmission',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['-created_at'], name='submission_pending_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='orderrequest',
+            index=models.Index(fields=['status', '-created_at'], name='order_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='orderrequest',
+            index=models.Index(condition=models.Q(('status', 'new')), fields=['-created_at'], name='order_new_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='shoppreorder',
+            index=models.Index(fields=['status', '-created_at'], name='preorder_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='shoppreorder',
+            index=models.Index(condition=models.Q(('status', 'new')), fields=['-created_at'], name='preorder_new_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.3 on 2026-10-19 06:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0013_status_created_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productcategory',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -5,14 +5,31 @@ import secrets
 from django.conf import settings
 from django.contrib.auth.hashers import check_password, make_password
 from django.contrib.auth.models import User
+from django.contrib.auth.signals import user_logged_in
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, RegexValidator
 from django.db import models
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
 from django.dispatch import receiver
 from django.utils import timezone
 from django.utils.text import slugify
 
+from .catalog import bump_catalog_version
+from .metrics import (
+    METRIC_LOGINS,
+    METRIC_USERS,
+    TOTAL,
+    bump,
+    metric_day,
+    metric_for,
+    record_created,
+    record_deleted,
+    record_status_changes,
+)
+from .sitemap_cache import bump_sitemap_version
+from .slugs import save_unique, unique_value
+from .storage import add_blob_reference, release_blob_reference
+
 
 phone_validator = RegexValidator(
     regex=r"^[0-9+\-\s()]{7,20}$",
@@ -229,22 +246,32 @@ class Article(models.Model):
         verbose_name = "Статья"
         verbose_name_plural = "Статьи"
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(
+                fields=("-created_at",),
+                name="article_published_idx",
+                condition=models.Q(is_published=True),
+            )
+        ]
 
     def __str__(self) -> str:
         return self.title
 
     def save(self, *args, **kwargs):
-        if not self.slug:
-            base_slug = slugify(self.title)[:180]
-            if not base_slug:
-                base_slug = f"article-{uuid4().hex[:8]}"
-            slug = base_slug
-            n = 1
-            while Article.objects.filter(slug=slug).exclude(pk=self.pk).exists():
-                slug = f"{base_slug}-{n}"
-                n += 1
+        if self.slug:
+            super().save(*args, **kwargs)
+            return
+        base_slug = slugify(self.title)[:180] or f"article-{uuid4().hex[:8]}"
+
+        def write(slug: str) -> None:
             self.slug = slug
-        super().save(*args, **kwargs)
+            try:
+                super(Article, self).save(*args, **kwargs)
+            except Exception:
+                self.slug = ""
+                raise
+
+        save_unique(lambda: unique_value(Article.objects.exclude(pk=self.pk), "slug", base_slug), write)
 
 
 class ArticleImage(models.Model):
@@ -311,6 +338,15 @@ class ArticleSubmission(models.Model):
         verbose_name = "Заявка на статью"
         verbose_name_plural = "Заявки на статьи"
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=("-created_at",), name="submission_created_idx"),
+            models.Index(fields=("status", "-created_at"), name="submission_status_created_idx"),
+            models.Index(
+                fields=("-created_at",),
+                name="submission_pending_idx",
+                condition=models.Q(status="pending"),
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"Заявка статьи #{self.pk}: {self.title}"
@@ -344,6 +380,7 @@ class ProductCategory(models.Model):
     slug = models.SlugField("Slug", max_length=100, unique=True)
     description = models.TextField("Описание", blank=True)
     is_active = models.BooleanField(default=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "Категория товара"
@@ -361,6 +398,7 @@ class Product(models.Model):
         related_name="products",
     )
     name = models.CharField("Название", max_length=140)
+    search_name = models.CharField(max_length=140, blank=True, db_index=True, editable=False)
     slug = models.SlugField("Slug", max_length=180, unique=True)
     description = models.TextField("Описание", blank=True)
     price = models.DecimalField(
@@ -376,10 +414,26 @@ class Product(models.Model):
         verbose_name = "Товар"
         verbose_name_plural = "Товары"
         ordering = ("name",)
+        indexes = [
+            models.Index(fields=("is_active", "category", "name"), name="product_active_cat_name"),
+            models.Index(fields=("is_active", "category", "price"), name="product_active_cat_price"),
+        ]
 
     def __str__(self) -> str:
         return self.name
 
+    @staticmethod
+    def normalize_search(value: str) -> str:
+        # Lowercased in Python: SQLite's LOWER()/LIKE only fold ASCII, so Cyrillic needs a stored copy.
+        return " ".join((value or "").split()).lower()
+
+    def save(self, *args, **kwargs):
+        self.search_name = self.normalize_search(self.name)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "name" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "search_name"}
+        super().save(*args, **kwargs)
+
 
 class ShopPreorder(models.Model):
     STATUS_CHOICES = [
@@ -426,6 +480,11 @@ class ShopPreorder(models.Model):
         verbose_name = "Предзаказ магазина"
         verbose_name_plural = "Предзаказы магазина"
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=("-created_at",), name="preorder_created_idx"),
+            models.Index(fields=("status", "-created_at"), name="preorder_status_created_idx"),
+            models.Index(fields=("-created_at",), name="preorder_new_idx", condition=models.Q(status="new")),
+        ]
 
     def __str__(self) -> str:
         return f"Предзаказ #{self.pk}"
@@ -479,14 +538,140 @@ class OrderRequest(models.Model):
         verbose_name = "Заявка"
         verbose_name_plural = "Заявки"
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=("-created_at",), name="order_created_idx"),
+            models.Index(fields=("status", "-created_at"), name="order_status_created_idx"),
+            models.Index(fields=("-created_at",), name="order_new_idx", condition=models.Q(status="new")),
+        ]
 
     def __str__(self) -> str:
         return f"Заявка #{self.pk} - {self.name}"
 
 
+class MediaBlob(models.Model):
+    name = models.CharField("Путь", max_length=255, unique=True)
+    sha256 = models.CharField("SHA-256", max_length=64, db_index=True)
+    size = models.PositiveBigIntegerField("Размер", default=0)
+    ref_count = models.PositiveIntegerField("Ссылок", default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Медиафайл"
+        verbose_name_plural = "Медиафайлы"
+        ordering = ("-created_at",)
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.ref_count})"
+
+
+class DailyMetrics(models.Model):
+    date = models.DateField("День")
+    metric = models.CharField("Метрика", max_length=32)
+    dimension = models.CharField("Срез", max_length=64, default=TOTAL)
+    value = models.IntegerField("Значение", default=0)
+
+    class Meta:
+        verbose_name = "Дневная метрика"
+        verbose_name_plural = "Дневные метрики"
+        ordering = ("-date", "metric", "dimension")
+        constraints = [
+            models.UniqueConstraint(fields=("date", "metric", "dimension"), name="daily_metrics_unique"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.date} {self.metric}/{self.dimension}: {self.value}"
+
+
+@receiver(post_save, sender=ArticleImage)
+@receiver(post_save, sender=SubmissionImage)
+def add_media_reference(sender, instance, created, **kwargs):
+    if created:
+        add_blob_reference(instance.image.name)
+
+
+@receiver(post_delete, sender=ArticleImage)
+@receiver(post_delete, sender=SubmissionImage)
+def release_media_reference(sender, instance, **kwargs):
+    release_blob_reference(instance.image.name)
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=ProductCategory)
+@receiver(post_delete, sender=ProductCategory)
+def invalidate_catalog_cache(sender, **kwargs):
+    bump_catalog_version()
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def touch_product_category(sender, instance, **kwargs):
+    # The category page lists its products, so its sitemap lastmod moves with them.
+    ProductCategory.objects.filter(pk=instance.category_id).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+def invalidate_article_sitemap(sender, **kwargs):
+    bump_sitemap_version()
+
+
 @receiver(post_save, sender=User)
 def create_or_update_user_profile(sender, instance, created, **kwargs):
     if created:
         Profile.objects.create(user=instance)
     else:
         Profile.objects.get_or_create(user=instance)
+
+
+@receiver(post_save, sender=User)
+def record_new_user_metric(sender, instance, created, **kwargs):
+    if created:
+        bump(metric_day(instance.date_joined), METRIC_USERS)
+
+
+@receiver(user_logged_in)
+def record_login_metric(sender, request, user, **kwargs):
+    bump(timezone.localdate(), METRIC_LOGINS)
+
+
+@receiver(post_init, sender=OrderRequest)
+@receiver(post_init, sender=ShopPreorder)
+def remember_loaded_status(sender, instance, **kwargs):
+    # __dict__ rather than the attribute: a deferred status must not cost a query per row.
+    instance._metrics_loaded_status = instance.__dict__.get("status")
+
+
+@receiver(pre_save, sender=OrderRequest)
+@receiver(pre_save, sender=ShopPreorder)
+def remember_previous_status(sender, instance, update_fields=None, **kwargs):
+    instance._metrics_previous_status = None
+    if not instance.pk:
+        return
+    if update_fields is not None:
+        if "status" not in update_fields:
+            return
+    elif instance.status == instance._metrics_loaded_status:
+        return
+    instance._metrics_previous_status = (
+        sender.objects.filter(pk=instance.pk).values_list("status", flat=True).first()
+    )
+
+
+@receiver(post_save, sender=OrderRequest)
+@receiver(post_save, sender=ShopPreorder)
+def record_request_metrics(sender, instance, created, **kwargs):
+    metric = metric_for(sender)
+    previous = getattr(instance, "_metrics_previous_status", None)
+    instance._metrics_loaded_status = instance.status
+    if created:
+        record_created(metric, instance)
+        return
+    if previous and previous != instance.status:
+        record_status_changes(sender, [(instance.created_at, previous)], instance.status)
+
+
+@receiver(post_delete, sender=OrderRequest)
+@receiver(post_delete, sender=ShopPreorder)
+def release_request_metrics(sender, instance, **kwargs):
+    record_deleted(metric_for(sender), instance)
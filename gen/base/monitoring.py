@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import os
+import time
+from contextlib import contextmanager
+
+from django.template.backends.django import DjangoTemplates, Template
+
+try:
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        REGISTRY,
+        CollectorRegistry,
+        Counter,
+        Histogram,
+        generate_latest,
+        multiprocess,
+    )
+except ImportError:  # pragma: no cover - optional dependency
+    Counter = Histogram = None
+
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+UNRESOLVED = "<unresolved>"
+KNOWN_METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+
+
+def metrics_enabled() -> bool:
+    return Histogram is not None
+
+
+if metrics_enabled():
+    REQUEST_LATENCY = Histogram(
+        "django_request_duration_seconds",
+        "Request latency by URL name",
+        ("view", "method", "status"),
+        buckets=LATENCY_BUCKETS,
+    )
+    REQUEST_QUERIES = Histogram(
+        "django_request_db_queries",
+        "Database queries per request",
+        ("view",),
+        buckets=QUERY_COUNT_BUCKETS,
+    )
+    REQUEST_DB_TIME = Histogram(
+        "django_request_db_duration_seconds",
+        "Database time per request",
+        ("view",),
+        buckets=LATENCY_BUCKETS,
+    )
+    TEMPLATE_RENDER = Histogram(
+        "django_template_render_seconds",
+        "Template render time",
+        ("template",),
+        buckets=LATENCY_BUCKETS,
+    )
+    NOTIFICATIONS = Counter(
+        "site_notifications_total",
+        "Owner notifications by channel and outcome",
+        ("channel", "result"),
+    )
+
+
+def view_name(request) -> str:
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return UNRESOLVED
+    return match.view_name or UNRESOLVED
+
+
+def observe_request(request, status: int, seconds: float, queries: int, db_seconds: float) -> None:
+    if not metrics_enabled():
+        return
+    name = view_name(request)
+    method = request.method if request.method in KNOWN_METHODS else "OTHER"
+    REQUEST_LATENCY.labels(name, method, f"{status // 100}xx").observe(seconds)
+    REQUEST_QUERIES.labels(name).observe(queries)
+    REQUEST_DB_TIME.labels(name).observe(db_seconds)
+
+
+def record_notification(channel: str, ok: bool, count: int = 1) -> None:
+    if metrics_enabled() and count:
+        NOTIFICATIONS.labels(channel, "success" if ok else "failure").inc(count)
+
+
+@contextmanager
+def timed_template(name: str):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if metrics_enabled():
+            TEMPLATE_RENDER.labels(name or "<string>").observe(time.perf_counter() - started)
+
+
+class TimedTemplate(Template):
+    def render(self, context=None, request=None):
+        with timed_template(self.template.origin.template_name):
+            return super().render(context, request)
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    def from_string(self, template_code):
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        template = super().get_template(template_name)
+        return TimedTemplate(template.template, self)
+
+
+def render_latest() -> tuple[bytes, str]:
+    # With PROMETHEUS_MULTIPROC_DIR set every gunicorn worker writes its own files; merge them here.
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+
+from .catalog import catalog_version
+
+SITEMAP_VERSION_KEY = "sitemap:version"
+
+
+def sitemap_version() -> str:
+    version = cache.get(SITEMAP_VERSION_KEY)
+    if version is None:
+        cache.add(SITEMAP_VERSION_KEY, str(time.time_ns()), None)
+        version = cache.get(SITEMAP_VERSION_KEY)
+    return version
+
+
+def bump_sitemap_version() -> None:
+    cache.set(SITEMAP_VERSION_KEY, str(time.time_ns()), None)
+
+
+def cached_sitemap(view):
+    # Product changes already bump the shop catalog version, so it is part of the key too.
+    def wrapper(request, *args, **kwargs):
+        key = (
+            f"sitemap:page:{sitemap_version()}:{catalog_version()}:{request.scheme}:"
+            f"{request.get_host()}:{request.path}:{request.GET.get('p', '')}"
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            # Headers are stored with the body: a warm hit must match the cold response,
+            # including the X-Robots-Tag Django's sitemap views set.
+            content, headers = cached
+            return HttpResponse(content, headers=headers)
+        response = view(request, *args, **kwargs)
+        if hasattr(response, "render"):
+            response.render()
+        if response.status_code == 200:
+            timeout = int(getattr(settings, "SITEMAP_CACHE_TIMEOUT", 24 * 60 * 60))
+            cache.set(key, (response.content, dict(response.items())), timeout)
+        return response
+
+    return wrapper
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import Callable, TypeVar
+
+from django.db import IntegrityError, transaction
+from django.db.models import Q, QuerySet
+
+T = TypeVar("T")
+
+ALLOCATE_ATTEMPTS = 5
+
+
+def unique_value(
+    queryset: QuerySet,
+    field: str,
+    base: str,
+    separator: str = "-",
+    first_suffix: int = 1,
+) -> str:
+    # One query for every taken value that could collide, then pick the free suffix in memory.
+    taken = set(
+        queryset.filter(Q(**{field: base}) | Q(**{f"{field}__startswith": f"{base}{separator}"}))
+        .order_by()
+        .values_list(field, flat=True)
+    )
+    if base not in taken:
+        return base
+    suffix = first_suffix
+    while f"{base}{separator}{suffix}" in taken:
+        suffix += 1
+    return f"{base}{separator}{suffix}"
+
+
+def save_unique(allocate: Callable[[], str], write: Callable[[str], T], attempts: int = ALLOCATE_ATTEMPTS) -> T:
+    # The unique constraint is the real guard: a concurrent writer can take the value after allocation.
+    for attempt in range(attempts):
+        value = allocate()
+        try:
+            with transaction.atomic():
+                return write(value)
+        except IntegrityError:
+            if attempt + 1 >= attempts:
+                raise
+    raise IntegrityError("Could not allocate a unique value")
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import tempfile
+from collections import Counter
+from pathlib import PurePosixPath
+from typing import Iterable
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.storage import FileSystemStorage
+from django.db.models import F
+from django.db.utils import OperationalError, ProgrammingError
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+CAS_PREFIX = "cas"
+COMPRESSIBLE_EXTENSIONS = {
+    ".css",
+    ".js",
+    ".mjs",
+    ".json",
+    ".map",
+    ".svg",
+    ".txt",
+    ".xml",
+    ".html",
+    ".ico",
+    ".ttf",
+    ".otf",
+    ".eot",
+}
+COMPRESS_MIN_BYTES = 256
+
+
+def content_name(digest: str, original_name: str) -> str:
+    ext = PurePosixPath(original_name).suffix.lower()[:10]
+    return f"{CAS_PREFIX}/{digest[:2]}/{digest[2:4]}/{digest}{ext}"
+
+
+def is_content_name(name: str | None) -> bool:
+    return bool(name) and str(name).startswith(f"{CAS_PREFIX}/")
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    def get_available_name(self, name, max_length=None):
+        # The final name is only known after hashing in _save().
+        return name
+
+    def _save(self, name, content):
+        tmp_dir = self.path(f"{CAS_PREFIX}/tmp")
+        os.makedirs(tmp_dir, exist_ok=True)
+
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=tmp_dir)
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                if hasattr(content, "seek"):
+                    content.seek(0)
+                for chunk in content.chunks():
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode()
+                    digest.update(chunk)
+                    size += len(chunk)
+                    tmp_file.write(chunk)
+
+            final_name = content_name(digest.hexdigest(), name)
+            full_path = self.path(final_name)
+            if os.path.exists(full_path):
+                os.remove(tmp_path)
+                # Refresh mtime so media_gc's age guard protects the reused blob.
+                os.utime(full_path)
+            else:
+                os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                os.replace(tmp_path, full_path)
+                if self.file_permissions_mode is not None:
+                    os.chmod(full_path, self.file_permissions_mode)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        _register_blob(final_name, digest.hexdigest(), size)
+        return final_name
+
+
+def _register_blob(name: str, sha256: str, size: int) -> None:
+    try:
+        from .models import MediaBlob
+
+        MediaBlob.objects.get_or_create(name=name, defaults={"sha256": sha256, "size": size})
+    except (OperationalError, ProgrammingError):
+        # Migrations may not be applied yet; media_gc reconciles later.
+        pass
+
+
+def add_blob_reference(name: str | None) -> None:
+    add_blob_references([name])
+
+
+def add_blob_references(names: Iterable[str | None]) -> None:
+    counts = Counter(name for name in names if is_content_name(name))
+    if not counts:
+        return
+    from .models import MediaBlob
+
+    for name, count in counts.items():
+        MediaBlob.objects.filter(name=name).update(ref_count=F("ref_count") + count)
+
+
+def release_blob_reference(name: str | None) -> None:
+    if not is_content_name(name):
+        return
+    from .models import MediaBlob
+
+    MediaBlob.objects.filter(name=name, ref_count__gt=0).update(ref_count=F("ref_count") - 1)
+
+
+class PrecompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    def post_process(self, paths, dry_run=False, **options):
+        if not dry_run:
+            from .assets import build_css_bundles
+
+            paths = dict(paths)
+            for name in build_css_bundles(self):
+                paths[name] = (self, name)
+
+        names: set[str] = set()
+        for name, hashed_name, processed in super().post_process(paths, dry_run, **options):
+            if not isinstance(processed, Exception):
+                names.add(name)
+                if hashed_name:
+                    names.add(hashed_name)
+            yield name, hashed_name, processed
+
+        if dry_run:
+            return
+        for name in sorted(names):
+            if PurePosixPath(name).suffix.lower() in COMPRESSIBLE_EXTENSIONS:
+                self._write_compressed(name)
+
+    def _write_compressed(self, name: str) -> None:
+        path = self.path(name)
+        try:
+            with open(path, "rb") as fh:
+                data = fh.read()
+        except FileNotFoundError:
+            return
+        if len(data) < COMPRESS_MIN_BYTES:
+            return
+
+        variants = [(".gz", gzip.compress(data, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            variants.append((".br", brotli.compress(data, quality=11)))
+        for suffix, payload in variants:
+            target = f"{path}{suffix}"
+            if len(payload) >= len(data):
+                if os.path.exists(target):
+                    os.remove(target)
+                continue
+            with open(target, "wb") as fh:
+                fh.write(payload)
+            stat = os.stat(path)
+            os.utime(target, (stat.st_atime, stat.st_mtime))
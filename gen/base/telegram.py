@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import logging
+import time
 from typing import Iterable
 
 import requests
 from django.conf import settings
 
+logger = logging.getLogger(__name__)
+
 
 def bot_enabled() -> bool:
     return bool(getattr(settings, "TELEGRAM_BOT_TOKEN", "").strip())
@@ -12,7 +16,7 @@ def bot_enabled() -> bool:
 
 def _api_url(method: str) -> str:
     token = settings.TELEGRAM_BOT_TOKEN.strip()
-    return f"https://api.telegram.org/bot{token}/{method}"
+    return f"{settings.TELEGRAM_API_URL}/bot{token}/{method}"
 
 
 def _normalize_chat_ids(raw_ids: Iterable[str]) -> list[str]:
@@ -33,6 +37,22 @@ def send_telegram_message(chat_id: str | int, text: str) -> tuple[bool, str | No
     if not bot_enabled():
         return False, "Telegram bot disabled"
 
+    started = time.perf_counter()
+    ok, error = _post_message(chat_id, text)
+    extra = {
+        "event": "telegram_send",
+        "chat_id": str(chat_id).strip(),
+        "ok": ok,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
+    if ok:
+        logger.info("Telegram message sent", extra=extra)
+    else:
+        logger.warning("Telegram message failed: %s", error, extra={**extra, "error": error})
+    return ok, error
+
+
+def _post_message(chat_id: str | int, text: str) -> tuple[bool, str | None]:
     try:
         payload = {
             "chat_id": str(chat_id).strip(),
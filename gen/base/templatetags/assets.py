@@ -0,0 +1,54 @@
+from django import template
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import mark_safe
+
+from base.assets import bundle_name, critical_name
+
+register = template.Library()
+
+_critical_cache: dict[str, str] = {}
+
+
+def _page_family(context) -> str | None:
+    request = context.get("request")
+    match = getattr(request, "resolver_match", None)
+    url_name = getattr(match, "url_name", None)
+    for family, config in settings.CRITICAL_CSS_PAGES.items():
+        if url_name in config.get("url_names", []):
+            return family
+    return None
+
+
+def _critical_css(family: str) -> str:
+    name = staticfiles_storage.stored_name(critical_name(family))
+    if name not in _critical_cache:
+        with staticfiles_storage.open(name) as fh:
+            _critical_cache[name] = fh.read().decode("utf-8").replace("</", "<\\/")
+    return _critical_cache[name]
+
+
+@register.simple_tag(takes_context=True)
+def site_css(context, bundle="site"):
+    if not settings.CSS_BUNDLES_ENABLED:
+        return format_html_join(
+            "\n",
+            '<link rel="stylesheet" href="{}">',
+            ((static(name),) for name in settings.CSS_BUNDLES[bundle]),
+        )
+
+    href = static(bundle_name(bundle))
+    family = _page_family(context)
+    if not family:
+        return format_html('<link rel="stylesheet" href="{}">', href)
+
+    return format_html(
+        "<style>{}</style>\n"
+        '<link rel="preload" href="{}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+        '<noscript><link rel="stylesheet" href="{}"></noscript>',
+        mark_safe(_critical_css(family)),
+        href,
+        href,
+    )
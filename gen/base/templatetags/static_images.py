@@ -0,0 +1,48 @@
+from django import template
+from django.conf import settings
+from django.templatetags.static import static
+from django.utils.html import format_html
+
+from base.imaging import load_manifest
+
+register = template.Library()
+
+
+def _variant_url(name: str) -> str:
+    # Variant names already carry a content hash and live outside the staticfiles manifest.
+    return f"{settings.STATIC_URL}{name}"
+
+
+def _srcset(variants: list[dict], key: str) -> str:
+    return ", ".join(f"{_variant_url(item[key])} {item['width']}w" for item in variants)
+
+
+@register.simple_tag
+def static_picture(path, alt="", sizes="100vw", css_class="", loading="lazy"):
+    entry = load_manifest().get(path)
+    if not entry or not entry.get("variants"):
+        return format_html(
+            '<img src="{}" alt="{}" class="{}" loading="{}" decoding="async">',
+            static(path),
+            alt,
+            css_class,
+            loading,
+        )
+
+    variants = entry["variants"]
+    largest = variants[-1]
+    return format_html(
+        '<picture><source type="image/webp" srcset="{}" sizes="{}">'
+        '<img src="{}" srcset="{}" sizes="{}" alt="{}" class="{}" loading="{}" decoding="async"'
+        ' width="{}" height="{}"></picture>',
+        _srcset(variants, "webp"),
+        sizes,
+        _variant_url(largest["fallback"]),
+        _srcset(variants, "fallback"),
+        sizes,
+        alt,
+        css_class,
+        loading,
+        entry["width"],
+        entry["height"],
+    )
@@ -1,3 +1,827 @@
-from django.test import TestCase
+import copy
+import io
+import json
+import logging
+import logging.config
+import os
+import re
+import tempfile
+import time
+from collections import Counter
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+from datetime import timedelta
+from decimal import Decimal
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.mail import EmailMessage
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.template.loader import get_template
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from prices.models import PriceItem, PriceList
+
+from . import urls as base_urls
+from .approval import approve_submissions
+from .benchmarks import compare_to_baseline, run_benchmarks
+from .catalog_import import CatalogImporter, CatalogImportError
+from .exports import export_rows, iter_csv, write_xlsx
+from .health import WARM_TEMPLATES, warm_up, write_heartbeat
+from .loadtest import Mailbox, SmtpStub, percentile, start_in_thread
+from .logs import JsonFormatter, NonBlockingQueueHandler, RequestIdFilter, annotate, request_context
+from .metrics import bump_many
+from .models import (
+    AdminEmailAccess,
+    Article,
+    ArticleImage,
+    ArticleSubmission,
+    DailyMetrics,
+    EmailAuthCode,
+    MediaBlob,
+    OrderRequest,
+    Product,
+    ProductCategory,
+    Profile,
+    ShopPreorder,
+    SubmissionImage,
+)
+
+ANON = "anonymous"
+USER = "user"
+OWNER = "owner"
+ROLES = (ANON, USER, OWNER)
+
+TEST_SETTINGS = {
+    "STORAGES": {
+        "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+        "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    },
+    "CACHES": {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    "CSS_BUNDLES_ENABLED": False,
+    "QUERY_PROFILING_ENABLED": False,
+    "TELEGRAM_NOTIFICATIONS_ENABLED": False,
+    "EMAIL_BACKEND": "django.core.mail.backends.locmem.EmailBackend",
+    "ACCESS_LOG_ENABLED": False,
+    # Nothing is written here; /readyz only checks that the directory exists and is writable.
+    "MEDIA_ROOT": tempfile.gettempdir(),
+}
+
+
+def build_fixture(orders: int = 3000, preorders: int = 1500, articles: int = 300, products: int = 1200) -> dict:
+    now = timezone.now()
+    users = User.objects.bulk_create(
+        [User(username=f"client{idx}", email=f"client{idx}@example.by") for idx in range(200)]
+    )
+    owner = User.objects.create(username="owner", email=settings.OWNER_EMAIL)
+    member = users[0]
+    Profile.objects.get_or_create(user=member, defaults={"phone": "+375291112233"})
+    AdminEmailAccess.objects.create(email="helper@example.by", granted_by=owner)
+
+    authored = Article.objects.bulk_create(
+        [
+            Article(
+                title=f"Статья {idx}",
+                slug=f"fixture-article-{idx}",
+                summary="Кратко о работах",
+                content="Текст статьи. " * 40,
+                is_published=idx % 10 != 0,
+                author=owner,
+            )
+            for idx in range(articles)
+        ]
+    )
+    ArticleImage.objects.bulk_create(
+        [
+            ArticleImage(article=article, image=f"articles/fixture/{article.pk}-{idx}.jpg", sort_order=idx)
+            for article in authored
+            for idx in range(3)
+        ]
+    )
+    submissions = ArticleSubmission.objects.bulk_create(
+        [
+            ArticleSubmission(
+                title=f"Заявка {idx}",
+                content="Черновик",
+                user=users[idx % len(users)],
+                status=ArticleSubmission.STATUS_PENDING if idx % 3 else ArticleSubmission.STATUS_REJECTED,
+            )
+            for idx in range(150)
+        ]
+    )
+    SubmissionImage.objects.bulk_create(
+        [
+            SubmissionImage(submission=submission, image=f"article_submissions/fixture/{submission.pk}.jpg")
+            for submission in submissions
+        ]
+    )
+
+    categories = ProductCategory.objects.bulk_create(
+        [ProductCategory(name=f"Категория {idx}", slug=f"fixture-category-{idx}") for idx in range(12)]
+    )
+    catalog = Product.objects.bulk_create(
+        [
+            Product(
+                category=categories[idx % len(categories)],
+                name=f"Котёл модель {idx}",
+                search_name=f"котёл модель {idx}",
+                slug=f"fixture-product-{idx}",
+                price=Decimal(idx % 50 * 75) if idx % 7 else None,
+                is_active=idx % 20 != 0,
+            )
+            for idx in range(products)
+        ]
+    )
+
+    statuses = ("new", "in_progress", "done")
+    order_rows = OrderRequest.objects.bulk_create(
+        [
+            OrderRequest(
+                name=f"Клиент {idx}",
+                phone="+375291234567",
+                user=users[idx % len(users)] if idx % 2 else None,
+                article=authored[idx % len(authored)] if idx % 4 == 0 else None,
+                status=statuses[idx % 3],
+            )
+            for idx in range(orders)
+        ]
+    )
+    preorder_rows = ShopPreorder.objects.bulk_create(
+        [
+            ShopPreorder(
+                phone="+375291234567",
+                user=users[idx % len(users)] if idx % 2 else None,
+                category=categories[idx % len(categories)],
+                product=catalog[idx % len(catalog)] if idx % 3 else None,
+                desired_item="" if idx % 3 else "Редкая деталь",
+                status=statuses[idx % 3],
+            )
+            for idx in range(preorders)
+        ]
+    )
+    # auto_now_add ignores explicit values, so spread the dates afterwards for realistic filters.
+    for model, rows in ((OrderRequest, order_rows), (ShopPreorder, preorder_rows)):
+        for offset in range(0, len(rows), 500):
+            chunk = rows[offset : offset + 500]
+            for idx, row in enumerate(chunk, start=offset):
+                row.created_at = now - timedelta(hours=idx)
+            model.objects.bulk_update(chunk, ["created_at"])
+
+    return {
+        "owner": owner,
+        "member": member,
+        "article": authored[1],
+        "submission": submissions[1],
+        "access": AdminEmailAccess.objects.get(email="helper@example.by"),
+        "order": order_rows[0],
+        "preorder": preorder_rows[0],
+        "order_rows": order_rows,
+        "preorder_rows": preorder_rows,
+    }
+
+
+@dataclass(frozen=True)
+class Route:
+    name: str
+    budgets: dict[str, tuple[int, int]]
+    args: tuple = ()
+    query: str = ""
+    method: str = "get"
+    data: dict = field(default_factory=dict)
+    partial: bool = False
+
+
+# (max queries, max response bytes) per role, measured on build_fixture() with a little headroom.
+# Anonymous pages skip the session lookup; signed-in pages pay for session, user and access checks.
+REDIRECT = (4, 0)
+OWNER_ONLY = {ANON: REDIRECT, USER: REDIRECT}
+
+
+def page(queries: int, size: int, owner: tuple[int, int] | None = None) -> dict[str, tuple[int, int]]:
+    return {ANON: (queries, size), USER: (queries + 4, size + 1_000), OWNER: owner or (queries + 4, size + 1_000)}
+
+
+ROUTES = [
+    Route("home", page(1, 20_000)),
+    Route("auth_login_request", {ANON: (1, 8_000), USER: REDIRECT, OWNER: REDIRECT}),
+    Route("auth_verify_code", page(1, 0)),
+    Route("auth_telegram_request", page(1, 0)),
+    Route("auth_telegram_verify", page(1, 0)),
+    Route("auth_logout", {ANON: REDIRECT, USER: (5, 0), OWNER: (5, 0)}),
+    Route("orders", page(1, 10_000)),
+    Route("articles", page(2, 220_000, owner=(5, 240_000))),
+    Route("article_submit_request", {ANON: REDIRECT, USER: (4, 9_000), OWNER: (4, 9_000)}),
+    Route("article_templates", {**OWNER_ONLY, OWNER: (4, 9_000)}),
+    Route("article_create", {**OWNER_ONLY, OWNER: (4, 10_000)}),
+    Route("article_detail", page(4, 12_000), args=("article",)),
+    Route("owner_dashboard", {**OWNER_ONLY, OWNER: (16, 160_000)}),
+    Route("owner_panel", {**OWNER_ONLY, OWNER: (5, 40_000)}, args=("orders",), partial=True),
+    Route("owner_export", {**OWNER_ONLY, OWNER: (5, 420_000)}, args=("orders",), query="format=csv"),
+    Route("owner_catalog_import", {**OWNER_ONLY, OWNER: REDIRECT}),
+    Route("owner_price_list_edit", {**OWNER_ONLY, OWNER: (8, 80_000)}, args=("santehnika",)),
+    Route(
+        "owner_submissions_bulk_approve",
+        {**OWNER_ONLY, OWNER: (15, 1_000)},
+        method="post",
+        data={"ids": "submission"},
+        partial=True,
+    ),
+    Route(
+        "owner_submission_approve",
+        {**OWNER_ONLY, OWNER: (9, 1_000)},
+        args=("submission",),
+        method="post",
+        partial=True,
+    ),
+    Route(
+        "owner_submission_reject",
+        {**OWNER_ONLY, OWNER: (7, 1_000)},
+        args=("submission",),
+        method="post",
+        partial=True,
+    ),
+    Route("owner_admin_grant", {**OWNER_ONLY, OWNER: REDIRECT}),
+    Route("owner_admin_revoke", {**OWNER_ONLY, OWNER: REDIRECT}, args=("access",)),
+    Route("owner_admin_activate", {**OWNER_ONLY, OWNER: REDIRECT}, args=("access",)),
+    # The 50 selected rows span three days; daily metrics add one INSERT plus one UPDATE per (day, status).
+    Route(
+        "owner_orders_bulk_status",
+        {**OWNER_ONLY, OWNER: (20, 70_000)},
+        method="post",
+        data={"ids": "order_rows", "status": "done"},
+        partial=True,
+    ),
+    Route(
+        "owner_order_status_update",
+        {**OWNER_ONLY, OWNER: (10, 2_000)},
+        args=("order",),
+        method="post",
+        data={"status": "in_progress"},
+        partial=True,
+    ),
+    Route(
+        "owner_preorders_bulk_status",
+        {**OWNER_ONLY, OWNER: (20, 70_000)},
+        method="post",
+        data={"ids": "preorder_rows", "status": "done"},
+        partial=True,
+    ),
+    Route(
+        "owner_preorder_status_update",
+        {**OWNER_ONLY, OWNER: (10, 2_000)},
+        args=("preorder",),
+        method="post",
+        data={"status": "in_progress"},
+        partial=True,
+    ),
+    Route("profile", {ANON: REDIRECT, USER: (8, 9_000), OWNER: (8, 9_000)}),
+    Route("profile_settings", {ANON: REDIRECT, USER: (5, 8_000), OWNER: (5, 8_000)}),
+    Route("metrics", {ANON: (0, 250_000), USER: (0, 250_000), OWNER: (0, 250_000)}),
+    Route("healthz", {ANON: (0, 100), USER: (0, 100), OWNER: (0, 100)}),
+    Route("readyz", {ANON: (0, 1_000), USER: (0, 1_000), OWNER: (0, 1_000)}),
+    Route("shop", page(5, 35_000)),
+    Route("shop_product_autocomplete", {ANON: (1, 3_000), USER: (1, 3_000), OWNER: (1, 3_000)}, query="q=котёл"),
+    Route("service", page(1, 16_000)),
+    Route("fundament", page(1, 16_000)),
+    Route("installation", page(1, 18_000)),
+    Route("contacts", page(1, 7_000)),
+    Route("support", page(1, 7_000)),
+    Route("sistemaotoplenia", page(1, 20_000)),
+]
+
+
+@override_settings(**TEST_SETTINGS)
+class QueryBudgetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.fixture = build_fixture()
+
+    def setUp(self):
+        cache.clear()
+
+    def _resolve(self, value):
+        if value in ("order_rows", "preorder_rows"):
+            return [row.pk for row in self.fixture[value][:50]]
+        target = self.fixture.get(value)
+        if isinstance(target, Article):
+            return target.slug
+        return target.pk if target is not None else value
+
+    def _request(self, route: Route, role: str):
+        if role == USER:
+            self.client.force_login(self.fixture["member"])
+        elif role == OWNER:
+            self.client.force_login(self.fixture["owner"])
+        url = reverse(route.name, args=[self._resolve(arg) for arg in route.args])
+        if route.query:
+            url = f"{url}?{route.query}"
+        data = {key: self._resolve(value) for key, value in route.data.items()}
+        headers = {"HTTP_X_REQUESTED_WITH": "XMLHttpRequest"} if route.partial else {}
+        with CaptureQueriesContext(connection) as queries:
+            response = getattr(self.client, route.method)(url, data, secure=True, **headers)
+            # Streaming exports run their queries while the body is consumed.
+            body = b"".join(response.streaming_content) if response.streaming else response.content
+        return response, len(queries), len(body)
+
+    def test_every_route_has_a_budget(self):
+        named = {pattern.name for pattern in base_urls.urlpatterns}
+        self.assertEqual(named, {route.name for route in ROUTES})
+
+    def test_routes_stay_within_budget(self):
+        for route in ROUTES:
+            for role in ROLES:
+                max_queries, max_bytes = route.budgets[role]
+                with self.subTest(route=route.name, role=role):
+                    self.client.logout()
+                    response, queries, size = self._request(route, role)
+                    self.assertLess(response.status_code, 500)
+                    self.assertLessEqual(queries, max_queries, f"{route.name} as {role}: {queries} queries")
+                    self.assertLessEqual(size, max_bytes, f"{route.name} as {role}: {size} bytes")
+
+    def test_bulk_status_queries_do_not_grow_with_selection(self):
+        # Daily metrics are adjusted once per (day, status), so compare selections from a single day
+        # that cover the same old statuses.
+        rows = self.fixture["order_rows"][100:200]
+        day = timezone.localdate(rows[50].created_at)
+        same_day = [row.pk for row in rows if timezone.localdate(row.created_at) == day]
+        self.client.force_login(self.fixture["owner"])
+        counts = []
+        for ids in (same_day[:3], same_day[3:9], same_day[9:]):
+            with CaptureQueriesContext(connection) as queries:
+                self.client.post(
+                    reverse("owner_orders_bulk_status"),
+                    {"ids": ids, "status": "done"},
+                    secure=True,
+                    HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+                )
+            counts.append(len(queries))
+        self.assertEqual(counts[1], counts[2])
+
+    def test_bulk_status_notifies_telegram_only(self):
+        ids = [row.pk for row in self.fixture["order_rows"][:3]]
+        self.client.force_login(self.fixture["owner"])
+        with (
+            override_settings(TELEGRAM_NOTIFICATIONS_ENABLED=True),
+            mock.patch("base.views.broadcast_admin_message", return_value=(1, [])) as broadcast,
+        ):
+            response = self.client.post(
+                reverse("owner_orders_bulk_status"),
+                {"ids": ids, "status": "done"},
+                secure=True,
+                HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+            )
+        self.assertEqual(response.status_code, 200)
+        broadcast.assert_called_once()
+        self.assertIn("смена статуса", broadcast.call_args.args[0])
+        self.assertEqual(mail.outbox, [])
+
+        # With Telegram off there is no channel left, so no "Notification sent" line either.
+        with self.assertNoLogs("base.views", "INFO"):
+            self.client.post(
+                reverse("owner_orders_bulk_status"),
+                {"ids": ids, "status": "new"},
+                secure=True,
+                HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+            )
+
+    def test_owner_panel_falls_back_to_the_dashboard_without_js(self):
+        self.client.force_login(self.fixture["owner"])
+        xhr = {"secure": True, "HTTP_X_REQUESTED_WITH": "XMLHttpRequest"}
+        first = self.client.get(reverse("owner_panel", args=["orders"]), **xhr)
+        more_url = re.search(r'href="([^"]+)" data-panel-more', first.content.decode()).group(1).replace("&amp;", "&")
+
+        partial = self.client.get(more_url, **xhr)
+        self.assertNotContains(partial, 'id="panel-preorders"')
+
+        page = self.client.get(more_url, secure=True)
+        self.assertTemplateUsed(page, "base/owner_dashboard.html")
+        self.assertContains(page, 'id="panel-preorders"')
+        self.assertContains(page, "data-panel-more")
+        # The orders panel continues after the cursor instead of starting from the newest row.
+        newest = self.fixture["order_rows"][0]
+        self.assertNotContains(page, f'data-row-id="order-{newest.pk}"')
+
+    def test_shop_is_served_from_cache_when_warm(self):
+        url = reverse("shop")
+        self.client.get(url, secure=True)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url, secure=True)
+        self.assertLessEqual(len(queries), 1)
+
+
+@override_settings(**TEST_SETTINGS)
+class LoadTestToolingTests(TestCase):
+    def test_command_help_renders(self):
+        # argparse %-formats help strings; a bare "%" only fails once someone asks for --help.
+        for command in ("generate_fake_data", "run_loadtest", "bench_auth"):
+            with self.subTest(command=command), redirect_stdout(io.StringIO()) as out:
+                with self.assertRaises(SystemExit):
+                    call_command(command, "--help")
+            self.assertIn("usage:", out.getvalue())
+
+    def test_generate_fake_data_refuses_without_debug(self):
+        with self.assertRaises(CommandError):
+            call_command("generate_fake_data", stdout=io.StringIO())
+
+    def test_generate_fake_data_creates_requested_volumes(self):
+        before = OrderRequest.objects.count()
+        call_command(
+            "generate_fake_data",
+            scale=0.01,
+            image_pool=0,
+            tag="t",
+            force=True,
+            stdout=io.StringIO(),
+        )
+        self.assertEqual(OrderRequest.objects.count() - before, 50)
+        self.assertEqual(User.objects.filter(username__startswith="fake_t_").count(), 5)
+        self.assertEqual(Product.objects.filter(slug__startswith="fake-t-product-").count(), 20)
+        self.assertTrue(
+            all(name == Product.normalize_search(name) for name in Product.objects.values_list("search_name", flat=True))
+        )
+
+    def test_percentile_uses_nearest_rank(self):
+        ordered = [float(value) for value in range(1, 101)]
+        self.assertEqual(percentile(ordered, 50), 50.0)
+        self.assertEqual(percentile(ordered, 99), 99.0)
+        self.assertEqual(percentile([], 95), 0.0)
+
+    def test_smtp_stub_hands_auth_codes_to_the_mailbox(self):
+        mailbox = Mailbox()
+        server = SmtpStub(("127.0.0.1", 0), mailbox)
+        start_in_thread(server)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        with override_settings(
+            EMAIL_BACKEND="django.core.mail.backends.smtp.EmailBackend",
+            EMAIL_HOST="127.0.0.1",
+            EMAIL_PORT=server.server_address[1],
+            EMAIL_USE_TLS=False,
+            EMAIL_HOST_USER="",
+        ):
+            EmailMessage("Код", "Ваш код подтверждения: 123456", to=["Load@Example.com"]).send()
+        self.assertEqual(mailbox.wait_for_code("load@example.com", timeout=2), "123456")
+
+
+@override_settings(**TEST_SETTINGS)
+class AuthBenchmarkTests(TestCase):
+    def test_benchmarks_roll_back_their_writes(self):
+        users = User.objects.count()
+        results = run_benchmarks(
+            ["email_issue_code", "get_or_create_user_new"],
+            iterations=2,
+            min_time=0,
+            warmup=0,
+            background_rows=10,
+        )
+        self.assertEqual(set(results), {"email_issue_code", "get_or_create_user_new"})
+        self.assertEqual(results["email_issue_code"].as_dict()["iterations"], 2)
+        self.assertEqual(User.objects.count(), users)
+        self.assertFalse(EmailAuthCode.objects.exists())
+
+    def test_regressions_need_relative_and_absolute_slowdown(self):
+        baseline = {"hash": {"median_ms": 300.0}, "lookup": {"median_ms": 0.4}}
+        current = {"hash": {"median_ms": 390.0}, "lookup": {"median_ms": 0.8}, "new": {"median_ms": 1.0}}
+        flagged = {name for name, _, regressed in compare_to_baseline(current, baseline, 0.25) if regressed}
+        self.assertEqual(flagged, {"hash"})
+
+
+@override_settings(**{**TEST_SETTINGS, "ACCESS_LOG_ENABLED": True})
+class StructuredLogTests(TestCase):
+    def test_access_log_carries_request_id_and_timings(self):
+        with self.assertLogs("base.access", "INFO") as logs:
+            response = self.client.get(reverse("home"), secure=True, HTTP_X_REQUEST_ID="nginx-req-12345")
+        self.assertEqual(response["X-Request-ID"], "nginx-req-12345")
+        record = logs.records[0]
+        self.assertEqual((record.status, record.view, record.user_type), (200, "home", "anonymous"))
+        self.assertGreaterEqual(record.duration_ms, record.db_ms)
+
+        with self.assertLogs("base.access", "INFO"):
+            response = self.client.get(reverse("home"), secure=True, HTTP_X_REQUEST_ID="bad id\n")
+        self.assertRegex(response["X-Request-ID"], r"^[0-9a-f]{32}$")
+
+    def test_json_formatter_includes_context_and_extras(self):
+        logger = logging.getLogger("base.tests")
+        record = logger.makeRecord(logger.name, logging.INFO, __file__, 0, "sent %s", ("ok",), None)
+        record.chat_id = "42"
+        with request_context("abc") as fields:
+            annotate(notification="sent")
+            RequestIdFilter().filter(record)
+        payload = json.loads(JsonFormatter().format(record))
+        self.assertEqual(payload["msg"], "sent ok")
+        self.assertEqual(payload["request_id"], "abc")
+        self.assertEqual(payload["chat_id"], "42")
+        self.assertEqual(fields, {"notification": "sent"})
+
+    def test_logging_config_applies(self):
+        stream = io.StringIO()
+        config = copy.deepcopy(settings.LOGGING)
+        config["handlers"]["queue"]["stream"] = stream
+        self.addCleanup(logging.config.dictConfig, settings.LOGGING)
+        logging.config.dictConfig(config)
+        handler = logging.getLogger().handlers[0]
+        self.assertIsInstance(handler, NonBlockingQueueHandler)
+        with request_context("cfg-1"):
+            logging.getLogger("base.tests").warning("configured")
+        handler.listener.stop()
+        handler.listener = None
+        self.assertIn("cfg-1", stream.getvalue())
+
+
+@override_settings(**{**TEST_SETTINGS, "HEALTH_TOKEN": "probe"})
+class HealthTests(TestCase):
+    def test_readyz_needs_the_token(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("readyz"), secure=True, REMOTE_ADDR="127.0.0.1")
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(len(queries), 0)
+
+    def test_readyz_reports_each_check(self):
+        response = self.client.get(reverse("readyz"), secure=True, HTTP_AUTHORIZATION="Bearer probe")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.json()["checks"]), {"database", "cache", "media", "static_manifest"})
+
+    def test_readyz_fails_without_static_manifest(self):
+        storages = {
+            **TEST_SETTINGS["STORAGES"],
+            "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.ManifestStaticFilesStorage"},
+        }
+        with tempfile.TemporaryDirectory() as static_root, override_settings(STORAGES=storages, STATIC_ROOT=static_root):
+            with self.assertLogs(level="WARNING") as logs:
+                response = self.client.get(reverse("readyz"), secure=True, HTTP_AUTHORIZATION="Bearer probe")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()["status"], "degraded")
+        self.assertFalse(response.json()["checks"]["static_manifest"]["ok"])
+        self.assertIn("base.health", {record.name for record in logs.records})
+
+    def test_warm_up_compiles_served_templates(self):
+        # A renamed template would make warm-up stop at it and leave the rest cold.
+        for name in WARM_TEMPLATES:
+            with self.subTest(template=name):
+                get_template(name)
+        warm_up()
+
+    def test_heartbeat_is_replaced_atomically(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "bot" / "heartbeat"
+            with override_settings(TELEGRAM_BOT_HEARTBEAT_FILE=str(path)):
+                write_heartbeat(offset=5)
+                write_heartbeat(offset=6)
+            self.assertEqual(json.loads(path.read_text())["offset"], 6)
+            self.assertEqual([item.name for item in path.parent.iterdir()], ["heartbeat"])
+
+
+@override_settings(**TEST_SETTINGS)
+class MetricsAccessTests(TestCase):
+    def test_metrics_need_the_token_even_from_loopback(self):
+        url = reverse("metrics")
+        with override_settings(METRICS_TOKEN=""):
+            self.assertEqual(self.client.get(url, secure=True, REMOTE_ADDR="127.0.0.1").status_code, 404)
+        with override_settings(METRICS_TOKEN="s3cret"):
+            self.assertEqual(self.client.get(url, secure=True).status_code, 404)
+            response = self.client.get(url, secure=True, HTTP_AUTHORIZATION="Bearer s3cret")
+            self.assertEqual(response.status_code, 200)
+
+
+@override_settings(**TEST_SETTINGS)
+class ExportTests(TestCase):
+    def test_visitor_text_is_not_exported_as_a_formula(self):
+        OrderRequest.objects.create(
+            name='=HYPERLINK("http://evil.example","x")',
+            phone="+375 29 123-45-67",
+            message="@SUM(A1:A9)",
+        )
+        ShopPreorder.objects.create(phone="+375291234567", desired_item="-2+3", comment="\t=1+1")
+        header, order = list(export_rows("orders", None))
+        self.assertEqual(order[header.index("Имя")], '\'=HYPERLINK("http://evil.example","x")')
+        self.assertEqual(order[header.index("Комментарий")], "'@SUM(A1:A9)")
+        self.assertEqual(order[header.index("Телефон")], "+375 29 123-45-67")
+
+        csv_text = "".join(iter_csv(export_rows("preorders", None)))
+        self.assertIn(",'-2+3,", csv_text)
+        self.assertIn("'\t=1+1", csv_text)
+
+        from openpyxl import load_workbook
+
+        buffer = io.BytesIO()
+        write_xlsx(export_rows("orders", None), buffer, "orders")
+        buffer.seek(0)
+        rows = list(load_workbook(buffer).active.values)
+        self.assertTrue(all(not str(value).startswith("=") for value in rows[1] if value is not None))
+
+
+@override_settings(**TEST_SETTINGS)
+class SitemapCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_cached_response_keeps_headers(self):
+        for url in (reverse("sitemap"), reverse("sitemap_section", args=["articles"])):
+            with self.subTest(url=url):
+                cold = self.client.get(url, secure=True)
+                with CaptureQueriesContext(connection) as queries:
+                    warm = self.client.get(url, secure=True)
+                self.assertEqual(len(queries), 0)
+                self.assertEqual(warm.content, cold.content)
+                self.assertEqual(warm["X-Robots-Tag"], "noindex, noodp, noarchive")
+                # Vary: Cookie comes from the context processors touching the session on the cold render only.
+                per_request = {"X-Request-ID", "Vary"}
+                self.assertEqual(
+                    {name: value for name, value in warm.items() if name not in per_request},
+                    {name: value for name, value in cold.items() if name not in per_request},
+                )
+
+
+def form_data(form) -> dict:
+    # What a browser would submit for an unchanged form.
+    data = {}
+    for bound in form:
+        value = bound.value()
+        if value is None or value is False:
+            continue
+        data[bound.html_name] = "on" if value is True else value
+    return data
+
+
+@override_settings(**TEST_SETTINGS)
+class PriceEditorTests(TestCase):
+    def setUp(self):
+        self.client.force_login(User.objects.create(username="owner", email=settings.OWNER_EMAIL))
+        self.url = reverse("owner_price_list_edit", args=["santehnika"])
+
+    def _submit(self, change):
+        context = self.client.get(self.url, secure=True).context
+        data = form_data(context["form"])
+        for formset in (context["section_formset"], context["item_formset"]):
+            data.update(form_data(formset.management_form))
+            for form in formset:
+                data.update(form_data(form))
+        change(data, context)
+        return self.client.post(self.url, data, secure=True)
+
+    def test_owner_edits_prices_without_a_deploy(self):
+        page = reverse("price_list", args=["santehnika"])
+        self.client.get(page, secure=True)
+        first, second = PriceItem.objects.filter(section__price_list__slug="santehnika").order_by("id")[:2]
+
+        def change(data, context):
+            forms = context["item_formset"].forms
+            index = next(idx for idx, form in enumerate(forms) if form.instance.pk == first.pk)
+            data[f"items-{index}-price_from"] = "123.45"
+            index = next(idx for idx, form in enumerate(forms) if form.instance.pk == second.pk)
+            data[f"items-{index}-DELETE"] = "on"
+
+        response = self._submit(change)
+        self.assertRedirects(response, self.url, fetch_redirect_response=False)
+        first.refresh_from_db()
+        self.assertEqual(first.price_from, Decimal("123.45"))
+        self.assertFalse(PriceItem.objects.filter(pk=second.pk).exists())
+        # The cached table is keyed by updated_at, so the public page shows the new price at once.
+        self.assertContains(self.client.get(page, secure=True), "123,45")
+
+    def test_invalid_range_is_reported_and_nothing_saved(self):
+        item = PriceItem.objects.filter(section__price_list__slug="santehnika").order_by("id").first()
+
+        def change(data, context):
+            forms = context["item_formset"].forms
+            index = next(idx for idx, form in enumerate(forms) if form.instance.pk == item.pk)
+            data[f"items-{index}-price_from"] = "50"
+            data[f"items-{index}-price_to"] = "10"
+            data["list-title"] = "Новый заголовок"
+
+        response = self._submit(change)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Цена «до» меньше цены «от».")
+        self.assertNotEqual(PriceItem.objects.get(pk=item.pk).price_to, Decimal("10"))
+        self.assertFalse(PriceList.objects.filter(title="Новый заголовок").exists())
+
+
+@override_settings(**TEST_SETTINGS)
+class ApprovalTests(TestCase):
+    def test_repeated_ids_approve_once(self):
+        owner = User.objects.create(username="owner", email=settings.OWNER_EMAIL)
+        blob = MediaBlob.objects.create(name="cas/ab/cd/abcd.jpg", sha256="abcd")
+        submission = ArticleSubmission.objects.create(title="Котельная", content="Текст")
+        SubmissionImage.objects.create(submission=submission, image=blob.name)
+        articles = Article.objects.count()
+
+        result = approve_submissions([submission.pk, submission.pk], owner)
+
+        self.assertEqual(result.approved, [submission.pk])
+        self.assertEqual(Article.objects.count(), articles + 1)
+        blob.refresh_from_db()
+        self.assertEqual(blob.ref_count, 2)
+
+
+@override_settings(**TEST_SETTINGS)
+class CatalogImportTests(TestCase):
+    def _import(self, data: bytes):
+        return CatalogImporter().run(io.BytesIO(data), "price.csv")
+
+    def test_cp1251_price_list_is_imported(self):
+        result = self._import("категория;название;цена\nКотлы;Котёл газовый;1 250,50\n".encode("cp1251"))
+        self.assertEqual((result.created, result.errors), (1, []))
+        self.assertEqual(Product.objects.get(name="Котёл газовый").price, Decimal("1250.50"))
+
+    def test_out_of_range_prices_are_reported_per_row(self):
+        result = self._import(
+            "категория;название;цена\nКотлы;Котёл;100\nКотлы;Бойлер;1e11\nКотлы;Насос;-5\n".encode()
+        )
+        self.assertEqual(result.created, 1)
+        self.assertEqual([error.split(":")[0] for error in result.errors], ["строка 3", "строка 4"])
+
+    def test_unreadable_encoding_is_an_import_error(self):
+        with self.assertRaises(CatalogImportError):
+            self._import(b"\x98\xff;\x98\n")
+
+
+@override_settings(**TEST_SETTINGS)
+class DailyMetricsTests(TestCase):
+    def _status_counts(self) -> dict[str, int]:
+        rows = DailyMetrics.objects.filter(metric="preorders", dimension__startswith="status:")
+        return {dimension: value for dimension, value in rows.values_list("dimension", "value") if value}
+
+    def test_status_is_only_read_back_when_it_changes(self):
+        preorder = ShopPreorder.objects.create(phone="+375291112233")
+        preorder = ShopPreorder.objects.get(pk=preorder.pk)
+        preorder.comment = "Перезвонить"
+        with CaptureQueriesContext(connection) as queries:
+            preorder.save()
+        self.assertEqual(len(queries), 1)
+
+        preorder.status = "done"
+        preorder.save()
+        self.assertEqual(self._status_counts(), {"status:done": 1})
+
+    def test_bump_many_creates_missing_rows_in_one_insert(self):
+        ShopPreorder.objects.create(phone="+375291112233")
+        day = timezone.localdate()
+        changes = Counter({(day, "preorders", "status:new"): -1, (day, "preorders", "status:done"): 1})
+        with CaptureQueriesContext(connection) as queries:
+            bump_many(changes)
+        inserts = [query for query in queries if query["sql"].lstrip().upper().startswith("INSERT")]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(self._status_counts(), {"status:done": 1})
+
+
+class MediaStorageTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        storages = {**TEST_SETTINGS["STORAGES"], "default": {"BACKEND": "base.storage.ContentAddressedStorage"}}
+        settings_override = override_settings(**{**TEST_SETTINGS, "STORAGES": storages, "MEDIA_ROOT": media_root.name})
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.media_root = Path(media_root.name)
+        self.article = Article.objects.create(title="Монтаж котла", content="Текст")
+
+    def _files(self) -> list[str]:
+        return sorted(
+            path.relative_to(self.media_root).as_posix()
+            for path in self.media_root.rglob("*")
+            if path.is_file()
+        )
+
+    def test_identical_uploads_share_one_file(self):
+        first = default_storage.save("articles/a.jpg", ContentFile(b"same bytes"))
+        second = default_storage.save("articles/b.jpg", ContentFile(b"same bytes"))
+        other = default_storage.save("articles/c.jpg", ContentFile(b"other bytes"))
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+        self.assertEqual(self._files(), sorted([first, other]))
+        self.assertEqual(MediaBlob.objects.get(name=first).size, len(b"same bytes"))
+
+    def test_references_follow_image_rows(self):
+        name = default_storage.save("articles/a.jpg", ContentFile(b"image"))
+        images = [ArticleImage.objects.create(article=self.article, image=name) for _ in range(2)]
+        self.assertEqual(MediaBlob.objects.get(name=name).ref_count, 2)
+        images[0].delete()
+        self.assertEqual(MediaBlob.objects.get(name=name).ref_count, 1)
+
+    def test_gc_keeps_referenced_and_recent_files(self):
+        kept = default_storage.save("articles/kept.jpg", ContentFile(b"kept"))
+        ArticleImage.objects.create(article=self.article, image=kept)
+        orphan = default_storage.save("articles/orphan.jpg", ContentFile(b"orphan"))
+        recent = default_storage.save("articles/recent.jpg", ContentFile(b"recent"))
+        day_ago = time.time() - 2 * 86400
+        for name in (kept, orphan):
+            os.utime(self.media_root / name, (day_ago, day_ago))
+
+        with CaptureQueriesContext(connection) as queries:
+            call_command("media_gc", stdout=io.StringIO())
+
+        self.assertEqual(self._files(), sorted([kept, recent]))
+        self.assertFalse(MediaBlob.objects.filter(name=orphan).exists())
+        self.assertEqual(MediaBlob.objects.get(name=kept).ref_count, 1)
+        # No per-file lookups while walking MEDIA_ROOT.
+        self.assertFalse([query for query in queries if orphan in query["sql"] or recent in query["sql"]])
@@ -16,6 +16,15 @@ urlpatterns = [
     path("articles/new/", views.article_create, name="article_create"),
     path("articles/<slug:slug>/", views.article_detail, name="article_detail"),
     path("owner/", views.owner_dashboard, name="owner_dashboard"),
+    path("owner/panels/<slug:panel>/", views.owner_panel, name="owner_panel"),
+    path("owner/export/<slug:panel>/", views.owner_export, name="owner_export"),
+    path("owner/catalog/import/", views.owner_catalog_import, name="owner_catalog_import"),
+    path("owner/prices/<slug:slug>/", views.owner_price_list_edit, name="owner_price_list_edit"),
+    path(
+        "owner/submissions/approve/",
+        views.owner_submissions_bulk_approve,
+        name="owner_submissions_bulk_approve",
+    ),
     path(
         "owner/submissions/<int:submission_id>/approve/",
         views.owner_submission_approve,
@@ -37,11 +46,21 @@ urlpatterns = [
         views.owner_admin_activate,
         name="owner_admin_activate",
     ),
+    path(
+        "owner/orders/status/",
+        views.owner_orders_bulk_status,
+        name="owner_orders_bulk_status",
+    ),
     path(
         "owner/orders/<int:order_id>/status/",
         views.owner_order_status_update,
         name="owner_order_status_update",
     ),
+    path(
+        "owner/preorders/status/",
+        views.owner_preorders_bulk_status,
+        name="owner_preorders_bulk_status",
+    ),
     path(
         "owner/preorders/<int:preorder_id>/status/",
         views.owner_preorder_status_update,
@@ -49,7 +68,15 @@ urlpatterns = [
     ),
     path("profile/", views.profile, name="profile"),
     path("profile/settings/", views.profile_settings, name="profile_settings"),
+    path("metrics", views.metrics, name="metrics"),
+    path("healthz", views.healthz, name="healthz"),
+    path("readyz", views.readyz, name="readyz"),
     path("shop/", views.shop, name="shop"),
+    path(
+        "shop/products/autocomplete/",
+        views.shop_product_autocomplete,
+        name="shop_product_autocomplete",
+    ),
     path("service/", views.service, name="service"),
     path("fundament/", views.fundament, name="fundament"),
     path("installation/", views.installation, name="installation"),
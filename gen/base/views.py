@@ -1,20 +1,54 @@
+import logging
+import tempfile
+
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import get_user_model, login, logout
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.core.mail import send_mail
-from django.http import Http404, HttpRequest, HttpResponse
+from django.db import transaction
+from django.db.models import Count
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.shortcuts import get_object_or_404, redirect, render
+from django.template.loader import render_to_string
 from django.utils import timezone
+from django.utils.crypto import constant_time_compare
 from django.utils.http import url_has_allowed_host_and_scheme
 from django.utils.text import slugify
+from django.views.decorators.cache import never_cache
+
+from prices.forms import PriceItemFormSet, PriceListForm, PriceSectionFormSet
+from prices.models import PriceItem, PriceList, Unit
 
 from .access import is_admin_user, normalize_email
+from .approval import approve_submissions
+from .bulk import bulk_set_status
+from .catalog import catalog_page, search_products
+from .catalog_import import CatalogImporter, CatalogImportError
+from .dashboard import PANELS, metrics_charts, panel_page
+from .exports import (
+    CONTENT_TYPES,
+    EXPORT_FORMATS,
+    export_filename,
+    export_rows,
+    iter_csv,
+    write_xlsx,
+)
 from .forms import (
     AdminEmailAccessForm,
     ArticleCreateForm,
     ArticleOrderForm,
     ArticleSubmissionForm,
+    BulkStatusUpdateForm,
+    BulkSubmissionApproveForm,
+    CatalogImportForm,
     ContactForm,
     EmailAuthRequestForm,
     EmailAuthVerifyForm,
@@ -29,6 +63,8 @@ from .forms import (
     TelegramAuthRequestForm,
     TelegramAuthVerifyForm,
 )
+from .health import run_checks
+from .logs import annotate
 from .models import (
     AdminEmailAccess,
     Article,
@@ -36,15 +72,16 @@ from .models import (
     ArticleSubmission,
     EmailAuthCode,
     OrderRequest,
-    Product,
-    ProductCategory,
     Profile,
     ShopPreorder,
     SubmissionImage,
     TelegramAuthCode,
 )
+from .monitoring import metrics_enabled, record_notification, render_latest
+from .slugs import save_unique, unique_value
 from .telegram import broadcast_admin_message, send_telegram_message
 
+logger = logging.getLogger(__name__)
 User = get_user_model()
 ORDER_EMAIL = settings.ORDER_RECIPIENT_EMAIL
 OWNER_EMAIL = settings.OWNER_EMAIL.lower().strip()
@@ -117,32 +154,59 @@ def _owner_or_404(request):
         raise Http404("Страница не найдена")
 
 
-def _notify(subject: str, message: str, from_email: str | None = None) -> None:
+def _notify(subject: str, message: str, from_email: str | None = None, *, email: bool = True) -> None:
+    if not email and not settings.TELEGRAM_NOTIFICATIONS_ENABLED:
+        # No channel to try: nothing was sent, and nothing failed either.
+        annotate(notification="skipped")
+        return
+
     errors: list[str] = []
     email_sent = False
     telegram_sent = False
 
-    try:
-        send_mail(
-            subject=subject,
-            message=message,
-            from_email=from_email or settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[ORDER_EMAIL],
-            fail_silently=False,
-        )
-        email_sent = True
-    except Exception as exc:  # noqa: BLE001
-        errors.append(f"email: {exc}")
+    if email:
+        try:
+            send_mail(
+                subject=subject,
+                message=message,
+                from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+                recipient_list=[ORDER_EMAIL],
+                fail_silently=False,
+            )
+            email_sent = True
+        except Exception as exc:  # noqa: BLE001
+            errors.append(f"email: {exc}")
+        record_notification("email", email_sent)
 
     if settings.TELEGRAM_NOTIFICATIONS_ENABLED:
         sent_count, tg_errors = broadcast_admin_message(f"{subject}\n\n{message}")
         telegram_sent = sent_count > 0
         errors.extend([f"telegram: {err}" for err in tg_errors])
-
+        record_notification("telegram", True, sent_count)
+        record_notification("telegram", False, len(tg_errors))
+
+    outcome = {"email": email_sent, "telegram": telegram_sent}
+    annotate(notification=outcome)
+    if errors:
+        logger.warning(
+            "Notification partly failed: %s",
+            subject,
+            extra={"event": "notification", "notification": outcome, "errors": errors},
+        )
+    else:
+        logger.info("Notification sent: %s", subject, extra={"event": "notification", "notification": outcome})
     if not email_sent and not telegram_sent:
         raise RuntimeError("; ".join(errors) or "Notification delivery failed")
 
 
+def _notify_admins(subject: str, message: str) -> None:
+    # Owner actions go to the Telegram admins only and never fail the request that triggered them.
+    try:
+        _notify(subject=subject, message=message, email=False)
+    except RuntimeError:
+        pass
+
+
 def _send_auth_code_email(target_email: str, code: str) -> None:
     send_mail(
         subject=f"Код входа в {settings.SITE_BRAND}",
@@ -163,16 +227,15 @@ def _get_or_create_user_by_email(email: str):
     if user:
         return user, False
 
-    base = slugify(normalized.split("@")[0]) or "user"
-    candidate = base
-    i = 1
-    while User.objects.filter(username=candidate).exists():
-        i += 1
-        candidate = f"{base}{i}"
+    base = slugify(normalized.split("@")[0])[:140] or "user"
+
+    def create(username: str):
+        user = User(username=username, email=normalized)
+        user.set_unusable_password()
+        user.save()
+        return user
 
-    user = User.objects.create(username=candidate, email=normalized)
-    user.set_unusable_password()
-    user.save(update_fields=["password"])
+    user = save_unique(lambda: unique_value(User.objects.all(), "username", base, "", 2), create)
     return user, True
 
 
@@ -220,6 +283,7 @@ def auth_login_request(request: HttpRequest) -> HttpResponse:
                 messages.success(request, "Код отправлен на вашу почту.")
                 return redirect("auth_verify_code")
             except Exception:  # noqa: BLE001
+                logger.exception("Auth code email failed", extra={"event": "auth_code_email"})
                 messages.error(
                     request,
                     "Не удалось отправить код на email. Попробуйте вход через Telegram или проверьте SMTP-настройки.",
@@ -348,6 +412,7 @@ def auth_telegram_request(request: HttpRequest) -> HttpResponse:
                 messages.success(request, "Код отправлен в Telegram.")
                 return redirect("auth_telegram_verify")
             except Exception:  # noqa: BLE001
+                logger.exception("Telegram auth code failed", extra={"event": "auth_code_telegram"})
                 messages.error(request, "Не удалось отправить код в Telegram. Попробуйте позже.")
     else:
         form = TelegramAuthRequestForm()
@@ -512,15 +577,39 @@ def sistemaotopleniya(request):
     return render(request, "base/sistema-otopleniya.html")
 
 
+def _has_bearer_token(request, token: str) -> bool:
+    # Behind cloudflared and nginx every request comes from 127.0.0.1, so the address proves nothing.
+    if not token:
+        return False
+    return constant_time_compare(request.headers.get("Authorization", ""), f"Bearer {token}")
+
+
+def metrics(request):
+    if not metrics_enabled():
+        raise Http404
+    if not _has_bearer_token(request, settings.METRICS_TOKEN):
+        raise Http404
+    content, content_type = render_latest()
+    return HttpResponse(content, content_type=content_type)
+
+
+@never_cache
+def healthz(request):
+    # Liveness only: no database or cache, so a slow dependency does not get workers restarted.
+    return HttpResponse("ok", content_type="text/plain")
+
+
+@never_cache
+def readyz(request):
+    # Every call hits the database, cache and disk, so it is as private as /metrics.
+    if not _has_bearer_token(request, settings.HEALTH_TOKEN):
+        raise Http404
+    ok, checks = run_checks()
+    return JsonResponse({"status": "ok" if ok else "degraded", "checks": checks}, status=200 if ok else 503)
+
+
 def shop(request):
-    selected_slug = request.GET.get("category", "").strip()
-    categories = ProductCategory.objects.filter(is_active=True).order_by("name")
-    products = Product.objects.filter(is_active=True).select_related("category")
-    selected_category = None
-    if selected_slug:
-        selected_category = ProductCategory.objects.filter(slug=selected_slug, is_active=True).first()
-        if selected_category:
-            products = products.filter(category=selected_category)
+    catalog = catalog_page(request.GET)
 
     if request.method == "POST":
         preorder_form = ShopPreorderForm(request.POST)
@@ -548,11 +637,8 @@ def shop(request):
                 messages.success(request, "Предзаказ отправлен. Мы свяжемся с вами.")
             except Exception:
                 messages.warning(request, "Предзаказ сохранен, но письмо не отправлено.")
-            redirect_url = "shop"
-            if selected_slug:
-                redirect_url = f"{redirect('shop').url}?category={selected_slug}"
-                return redirect(redirect_url)
-            return redirect("shop")
+            query = catalog["query"].url(page=str(catalog["page"])).rstrip("?")
+            return redirect(f"{redirect('shop').url}{query}")
         messages.error(request, "Проверьте корректность полей предзаказа.")
     else:
         initial = {}
@@ -568,24 +654,34 @@ def shop(request):
         request,
         "base/shop_catalog.html",
         {
-            "categories": categories,
-            "products": products,
-            "selected_category": selected_category,
+            **catalog,
             "preorder_form": preorder_form,
         },
     )
 
 
+def shop_product_autocomplete(request):
+    try:
+        category_id = int(request.GET.get("category") or 0)
+    except ValueError:
+        category_id = 0
+    results = search_products(request.GET.get("q", ""), category_id=category_id or None)
+    response = JsonResponse({"results": results})
+    response["Cache-Control"] = "private, max-age=60"
+    return response
+
+
 def articles(request):
-    queryset = Article.objects.filter(is_published=True).prefetch_related("images")
-    if _is_owner(request.user):
-        queryset = Article.objects.all().prefetch_related("images")
+    is_owner = _is_owner(request.user)
+    queryset = Article.objects.all() if is_owner else Article.objects.filter(is_published=True)
+    # The list only shows how many photos an article has, so count them instead of loading them.
+    queryset = queryset.annotate(images_total=Count("images"))
     return render(
         request,
         "base/articles.html",
         {
             "articles": queryset,
-            "can_create_articles": _is_owner(request.user),
+            "can_create_articles": is_owner,
         },
     )
 
@@ -724,7 +820,9 @@ def article_submit_request(request):
 
 @login_required
 def profile(request):
-    Profile.objects.get_or_create(user=request.user)
+    profile_obj, _ = Profile.objects.get_or_create(user=request.user)
+    # Fill the reverse relation cache so the template's user.profile needs no second query.
+    request.user.profile = profile_obj
     user_orders = OrderRequest.objects.filter(user=request.user).order_by("-created_at")[:10]
     user_preorders = ShopPreorder.objects.filter(user=request.user).order_by("-created_at")[:10]
     user_submissions = ArticleSubmission.objects.filter(user=request.user).order_by("-created_at")[:10]
@@ -810,15 +908,16 @@ def order_request(request):
     return render(request, "base/order_request.html", {"form": form, "article": article})
 
 
-@login_required
-@user_passes_test(_is_owner, login_url="auth_login_request")
-def owner_dashboard(request):
-    submissions = ArticleSubmission.objects.select_related("user", "approved_article").prefetch_related("images")
-    users = User.objects.order_by("-date_joined")[:500]
-    orders = OrderRequest.objects.select_related("user", "article").order_by("-created_at")[:200]
-    preorders = ShopPreorder.objects.select_related("user", "category", "product").order_by("-created_at")[:200]
+def _wants_partial(request) -> bool:
+    return request.headers.get("X-Requested-With") == "XMLHttpRequest" or "HX-Request" in request.headers
+
+
+def _render_owner_dashboard(request, current: dict | None = None):
+    # `current` is a panel page already built from the query string; the other panels start from the top.
+    panels = [
+        current if current and current["panel"] is panel else panel_page(panel, {}) for panel in PANELS.values()
+    ]
     admin_accesses = AdminEmailAccess.objects.select_related("granted_by").order_by("email")
-    review_form = SubmissionReviewForm()
     admin_form = AdminEmailAccessForm()
     stats = {
         "users": User.objects.count(),
@@ -831,22 +930,75 @@ def owner_dashboard(request):
         request,
         "base/owner_dashboard.html",
         {
-            "submissions": submissions,
-            "users": users,
-            "orders": orders,
-            "preorders": preorders,
-            "review_form": review_form,
+            "panels": panels,
+            "metrics_charts": metrics_charts(),
+            "metrics_days": settings.OWNER_METRICS_DAYS,
+            "review_form": SubmissionReviewForm(),
             "admin_form": admin_form,
+            "catalog_form": CatalogImportForm(),
+            "price_lists": PriceList.objects.order_by("title"),
             "admin_accesses": admin_accesses,
             "stats": stats,
             "telegram_bot_username": settings.TELEGRAM_BOT_USERNAME,
             "telegram_admin_chat_ids": settings.TELEGRAM_ADMIN_CHAT_IDS,
-            "order_status_choices": OrderRequest.STATUS_CHOICES,
-            "preorder_status_choices": ShopPreorder.STATUS_CHOICES,
         },
     )
 
 
+@login_required
+@user_passes_test(_is_owner, login_url="auth_login_request")
+def owner_dashboard(request):
+    return _render_owner_dashboard(request)
+
+
+@login_required
+@user_passes_test(_is_owner, login_url="auth_login_request")
+def owner_panel(request, panel: str):
+    if panel not in PANELS:
+        raise Http404
+    page = panel_page(PANELS[panel], request.GET)
+    if not _wants_partial(request):
+        # Filter and "Показать еще" without JS (or after a failed fetch): the whole dashboard, this panel paged.
+        return _render_owner_dashboard(request, page)
+    # The first page replaces the whole panel (filters), later pages only append rows.
+    if page["is_first_page"]:
+        template_name = "base/partials/owner_panel.html"
+    else:
+        template_name = page["panel"].rows_template
+    return render(request, template_name, {"page": page, "review_form": SubmissionReviewForm()})
+
+
+@login_required
+@user_passes_test(_is_owner, login_url="auth_login_request")
+def owner_export(request, panel: str):
+    if panel not in PANELS or not PANELS[panel].exportable:
+        raise Http404
+    fmt = request.GET.get("format", "csv")
+    if fmt not in EXPORT_FORMATS:
+        raise Http404
+    filename = export_filename(panel, fmt)
+    rows = export_rows(panel, request.GET)
+    if fmt == "csv":
+        response = StreamingHttpResponse(iter_csv(rows), content_type=CONTENT_TYPES[fmt])
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    # XLSX is a zip archive, so it is spooled to a temp file instead of streamed row by row.
+    fh = tempfile.TemporaryFile()
+    write_xlsx(rows, fh, PANELS[panel].title)
+    fh.seek(0)
+    return FileResponse(fh, as_attachment=True, filename=filename, content_type=CONTENT_TYPES[fmt])
+
+
+def _submission_card(request, submission_id: int) -> HttpResponse:
+    submission = PANELS["submissions"].queryset().get(pk=submission_id)
+    return render(
+        request,
+        "base/partials/owner_submission_card.html",
+        {"submission": submission, "review_form": SubmissionReviewForm()},
+    )
+
+
 @login_required
 @user_passes_test(_is_owner, login_url="auth_login_request")
 def owner_admin_grant(request):
@@ -909,18 +1061,92 @@ def owner_admin_activate(request, access_id: int):
     return redirect("owner_dashboard")
 
 
+@login_required
+@user_passes_test(_is_owner, login_url="auth_login_request")
+def owner_catalog_import(request):
+    if request.method != "POST":
+        return redirect("owner_dashboard")
+
+    form = CatalogImportForm(request.POST, request.FILES)
+    if not form.is_valid():
+        messages.error(request, "Выберите файл прайс-листа (.csv или .xlsx).")
+        return redirect("owner_dashboard")
+
+    upload = form.cleaned_data["price_list"]
+    dry_run = form.cleaned_data["dry_run"]
+    importer = CatalogImporter(deactivate_missing=form.cleaned_data["deactivate_missing"])
+    try:
+        result = importer.run(upload.file, upload.name, dry_run=dry_run)
+    except CatalogImportError as exc:
+        messages.error(request, str(exc))
+        return redirect("owner_dashboard")
+
+    for error in result.errors[:20]:
+        messages.warning(request, error)
+    prefix = "Проверка прайс-листа" if dry_run else "Прайс-лист загружен"
+    messages.success(request, f"{prefix}: {result.summary()}.")
+    return redirect("owner_dashboard")
+
+
+@login_required
+@user_passes_test(_is_owner, login_url="auth_login_request")
+def owner_price_list_edit(request, slug: str):
+    price_list = get_object_or_404(PriceList, slug=slug)
+    sections = list(price_list.sections.all())
+    items = PriceItem.objects.filter(section__price_list=price_list).order_by(
+        "section__sort_order", "section_id", "sort_order", "id"
+    )
+    data = request.POST if request.method == "POST" else None
+    form = PriceListForm(data, instance=price_list, prefix="list")
+    section_formset = PriceSectionFormSet(data, instance=price_list, prefix="sections")
+    item_formset = PriceItemFormSet(
+        data,
+        queryset=items,
+        prefix="items",
+        form_kwargs={"sections": sections, "units": list(Unit.objects.all())},
+    )
+    if data is not None:
+        if all([form.is_valid(), section_formset.is_valid(), item_formset.is_valid()]):
+            with transaction.atomic():
+                form.save()
+                # Items first: deleting a section removes its items, which must not be saved afterwards.
+                item_formset.save()
+                section_formset.save()
+            messages.success(request, f"Прайс-лист «{price_list.title}» сохранен.")
+            return redirect("owner_price_list_edit", slug=price_list.slug)
+        messages.error(request, "Прайс-лист не сохранен: исправьте ошибки в форме.")
+    return render(
+        request,
+        "base/owner_price_list.html",
+        {
+            "price_list": price_list,
+            "form": form,
+            "section_formset": section_formset,
+            "item_formset": item_formset,
+        },
+    )
+
+
 @login_required
 @user_passes_test(_is_owner, login_url="auth_login_request")
 def owner_order_status_update(request, order_id: int):
     if request.method != "POST":
         return redirect("owner_dashboard")
-    order = get_object_or_404(OrderRequest, pk=order_id)
+    order = get_object_or_404(OrderRequest.objects.select_related("article"), pk=order_id)
     form = OrderStatusUpdateForm(request.POST)
     if not form.is_valid():
+        if _wants_partial(request):
+            return HttpResponse("Некорректный статус заказа.", status=400)
         messages.error(request, "Некорректный статус заказа.")
         return redirect("owner_dashboard")
     order.status = form.cleaned_data["status"]
     order.save(update_fields=["status", "updated_at"])
+    if _wants_partial(request):
+        return render(
+            request,
+            "base/partials/owner_order_row.html",
+            {"order": order, "status_choices": OrderRequest.STATUS_CHOICES},
+        )
     messages.success(request, f"Статус заказа #{order.id} обновлен.")
     return redirect("owner_dashboard")
 
@@ -930,17 +1156,73 @@ def owner_order_status_update(request, order_id: int):
 def owner_preorder_status_update(request, preorder_id: int):
     if request.method != "POST":
         return redirect("owner_dashboard")
-    preorder = get_object_or_404(ShopPreorder, pk=preorder_id)
+    preorder = get_object_or_404(ShopPreorder.objects.select_related("user", "category", "product"), pk=preorder_id)
     form = PreorderStatusUpdateForm(request.POST)
     if not form.is_valid():
+        if _wants_partial(request):
+            return HttpResponse("Некорректный статус предзаказа.", status=400)
         messages.error(request, "Некорректный статус предзаказа.")
         return redirect("owner_dashboard")
     preorder.status = form.cleaned_data["status"]
     preorder.save(update_fields=["status", "updated_at"])
+    if _wants_partial(request):
+        return render(
+            request,
+            "base/partials/owner_preorder_row.html",
+            {"preorder": preorder, "status_choices": ShopPreorder.STATUS_CHOICES},
+        )
     messages.success(request, f"Статус предзаказа #{preorder.id} обновлен.")
     return redirect("owner_dashboard")
 
 
+def _bulk_status_update(request, model, label: str, row_template: str, row_name: str) -> HttpResponse:
+    if request.method != "POST":
+        return redirect("owner_dashboard")
+    form = BulkStatusUpdateForm(request.POST, status_choices=model.STATUS_CHOICES)
+    if not form.is_valid():
+        error = " ".join(str(item) for errors in form.errors.values() for item in errors)
+        if _wants_partial(request):
+            return HttpResponse(error, status=400)
+        messages.error(request, error)
+        return redirect("owner_dashboard")
+
+    status = form.cleaned_data["status"]
+    result = bulk_set_status(model, form.cleaned_data["ids"], status)
+    summary = result.summary(label, dict(model.STATUS_CHOICES)[status])
+    if result.updated:
+        _notify_admins(f"{label}: смена статуса", f"{summary}\nИзменил: {request.user.email or request.user.username}")
+
+    if _wants_partial(request):
+        queryset = PANELS[f"{row_name}s"].queryset().filter(pk__in=result.updated)
+        rows = [
+            render_to_string(
+                row_template,
+                {row_name: obj, "status_choices": model.STATUS_CHOICES},
+                request=request,
+            )
+            for obj in queryset
+        ]
+        return HttpResponse("".join(rows))
+    messages.success(request, summary)
+    return redirect("owner_dashboard")
+
+
+@login_required
+@user_passes_test(_is_owner, login_url="auth_login_request")
+def owner_orders_bulk_status(request):
+    return _bulk_status_update(
+        request, OrderRequest, "Заявки", "base/partials/owner_order_row.html", "order"
+    )
+
+
+@login_required
+@user_passes_test(_is_owner, login_url="auth_login_request")
+def owner_preorders_bulk_status(request):
+    return _bulk_status_update(
+        request, ShopPreorder, "Предзаказы", "base/partials/owner_preorder_row.html", "preorder"
+    )
+
+
 @login_required
 @user_passes_test(_is_owner, login_url="auth_login_request")
 def owner_submission_approve(request, submission_id: int):
@@ -953,40 +1235,48 @@ def owner_submission_approve(request, submission_id: int):
     if form.is_valid():
         comment = form.cleaned_data.get("review_comment", "")
 
-    if submission.status == ArticleSubmission.STATUS_APPROVED and submission.approved_article:
+    result = approve_submissions([submission.pk], request.user, comment)
+    if _wants_partial(request):
+        return _submission_card(request, submission.id)
+    if result.skipped:
         messages.info(request, "Эта заявка уже одобрена.")
+    else:
+        messages.success(request, "Заявка одобрена и опубликована как статья.")
+    return redirect("owner_dashboard")
+
+
+@login_required
+@user_passes_test(_is_owner, login_url="auth_login_request")
+def owner_submissions_bulk_approve(request):
+    if request.method != "POST":
+        return redirect("owner_dashboard")
+    form = BulkSubmissionApproveForm(request.POST)
+    if not form.is_valid():
+        error = " ".join(str(item) for errors in form.errors.values() for item in errors)
+        if _wants_partial(request):
+            return HttpResponse(error, status=400)
+        messages.error(request, error)
         return redirect("owner_dashboard")
 
-    article = Article.objects.create(
-        template_key="custom",
-        title=submission.title,
-        summary=submission.summary,
-        content=submission.content,
-        is_published=True,
-        author=request.user,
+    result = approve_submissions(
+        form.cleaned_data["ids"], request.user, form.cleaned_data.get("review_comment", "")
     )
-    for idx, submission_image in enumerate(submission.images.all()):
-        ArticleImage.objects.create(
-            article=article,
-            image=submission_image.image.name,
-            sort_order=idx,
-        )
-
-    submission.status = ArticleSubmission.STATUS_APPROVED
-    submission.reviewer = request.user
-    submission.review_comment = comment
-    submission.approved_article = article
-    submission.save(
-        update_fields=[
-            "status",
-            "reviewer",
-            "review_comment",
-            "approved_article",
-            "updated_at",
+    summary = result.summary()
+    if result.approved:
+        _notify_admins("Статьи одобрены", f"{summary}\nОдобрил: {request.user.email or request.user.username}")
+
+    if _wants_partial(request):
+        queryset = PANELS["submissions"].queryset().filter(pk__in=result.approved + result.skipped)
+        cards = [
+            render_to_string(
+                "base/partials/owner_submission_card.html",
+                {"submission": submission, "review_form": SubmissionReviewForm()},
+                request=request,
+            )
+            for submission in queryset
         ]
-    )
-
-    messages.success(request, "Заявка одобрена и опубликована как статья.")
+        return HttpResponse("".join(cards))
+    messages.success(request, summary)
     return redirect("owner_dashboard")
 
 
@@ -1006,5 +1296,7 @@ def owner_submission_reject(request, submission_id: int):
     submission.reviewer = request.user
     submission.review_comment = comment
     submission.save(update_fields=["status", "reviewer", "review_comment", "updated_at"])
+    if _wants_partial(request):
+        return _submission_card(request, submission.id)
     messages.success(request, "Заявка отклонена.")
     return redirect("owner_dashboard")
@@ -68,6 +68,7 @@ DEFAULT_FROM_EMAIL = os.getenv(
 
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "").strip()
 TELEGRAM_BOT_USERNAME = os.getenv("TELEGRAM_BOT_USERNAME", "").strip()
+TELEGRAM_API_URL = os.getenv("TELEGRAM_API_URL", "https://api.telegram.org").strip().rstrip("/")
 TELEGRAM_ADMIN_CHAT_IDS = _split_csv(os.getenv("TELEGRAM_ADMIN_CHAT_IDS"), [])
 TELEGRAM_NOTIFICATIONS_ENABLED = _env_bool("TELEGRAM_NOTIFICATIONS_ENABLED", True)
 TELEGRAM_AUTH_CODE_TTL_MINUTES = int(
@@ -77,8 +78,12 @@ TELEGRAM_AUTH_CODE_MAX_ATTEMPTS = int(
     os.getenv("TELEGRAM_AUTH_CODE_MAX_ATTEMPTS", str(AUTH_CODE_MAX_ATTEMPTS))
 )
 TELEGRAM_AUTH_RESEND_SECONDS = int(os.getenv("TELEGRAM_AUTH_RESEND_SECONDS", "45"))
+TELEGRAM_BOT_HEARTBEAT_FILE = os.getenv("TELEGRAM_BOT_HEARTBEAT_FILE", str(BASE_DIR / "telegram_bot.heartbeat"))
 
 STATIC_ROOT = BASE_DIR / "staticfiles"
+STATIC_IMAGE_WIDTHS = [
+    int(item) for item in _split_csv(os.getenv("STATIC_IMAGE_WIDTHS"), ["480", "960", "1600"])
+]
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
@@ -96,6 +101,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "base.middleware.RequestLogMiddleware",
+    "base.middleware.MetricsMiddleware",
+    "base.middleware.QueryProfilingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -109,7 +117,7 @@ ROOT_URLCONF = "gen.urls"
 
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "BACKEND": "base.monitoring.TimedDjangoTemplates",
         "DIRS": [BASE_DIR / "base/templates"],
         "APP_DIRS": True,
         "OPTIONS": {
@@ -176,13 +184,57 @@ STATIC_URL = "/static/"
 
 STORAGES = {
     "default": {
-        "BACKEND": "django.core.files.storage.FileSystemStorage",
+        "BACKEND": "base.storage.ContentAddressedStorage",
     },
     "staticfiles": {
-        "BACKEND": "django.contrib.staticfiles.storage.ManifestStaticFilesStorage",
+        "BACKEND": "base.storage.PrecompressedManifestStaticFilesStorage",
     },
 }
 
+CSS_BUNDLES = {
+    "site": [
+        "base/css/fonts.css",
+        "base/css/styles.css",
+        "base/css/app.css",
+        "base/css/desktop.css",
+        "base/css/mobile.css",
+    ],
+}
+CSS_BUNDLES_ENABLED = _env_bool("CSS_BUNDLES_ENABLED", not DEBUG)
+CRITICAL_CSS_BASE_TEMPLATE = "base/base.html"
+CRITICAL_CSS_FOLD_CHARS = int(os.getenv("CRITICAL_CSS_FOLD_CHARS", "6000"))
+CRITICAL_CSS_PAGES = {
+    "home": {"template": "base/index.html", "bundle": "site", "url_names": ["home"]},
+    "service": {"template": "base/service.html", "bundle": "site", "url_names": ["service"]},
+}
+
+# Gunicorn runs several workers, so production uses a cache they all share.
+# Shop pages are cached per category x price bucket x ordering x page next to facets, sitemaps and price
+# tables. The backend's default of 300 entries would be reached within hours, and past it every write culls a
+# random third of the files, version keys included, so the cap is sized well above the working set.
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "DJANGO_CACHE_BACKEND",
+            "django.core.cache.backends.locmem.LocMemCache"
+            if DEBUG
+            else "django.core.cache.backends.filebased.FileBasedCache",
+        ),
+        "LOCATION": os.getenv("DJANGO_CACHE_LOCATION", str(BASE_DIR / "cache")),
+        "OPTIONS": {
+            "MAX_ENTRIES": int(os.getenv("DJANGO_CACHE_MAX_ENTRIES", "20000")),
+            "CULL_FREQUENCY": int(os.getenv("DJANGO_CACHE_CULL_FREQUENCY", "3")),
+        },
+    }
+}
+ADMIN_ESTIMATED_COUNT_THRESHOLD = int(os.getenv("ADMIN_ESTIMATED_COUNT_THRESHOLD", "10000"))
+SHOP_PAGE_SIZE = int(os.getenv("SHOP_PAGE_SIZE", "24"))
+SHOP_CACHE_TIMEOUT = int(os.getenv("SHOP_CACHE_TIMEOUT", "3600"))
+SITEMAP_CACHE_TIMEOUT = int(os.getenv("SITEMAP_CACHE_TIMEOUT", "86400"))
+SHOP_AUTOCOMPLETE_LIMIT = int(os.getenv("SHOP_AUTOCOMPLETE_LIMIT", "10"))
+SHOP_AUTOCOMPLETE_MIN_CHARS = int(os.getenv("SHOP_AUTOCOMPLETE_MIN_CHARS", "2"))
+SHOP_PRICE_BUCKETS = [int(item) for item in _split_csv(os.getenv("SHOP_PRICE_BUCKETS"), ["100", "500", "2000"])]
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 SITE_ID = int(os.getenv("DJANGO_SITE_ID", "1"))
 
@@ -192,11 +244,55 @@ LOGIN_URL = "auth_login_request"
 LOGIN_REDIRECT_URL = "profile"
 LOGOUT_REDIRECT_URL = "home"
 
+OWNER_DASHBOARD_PAGE_SIZE = int(os.getenv("OWNER_DASHBOARD_PAGE_SIZE", "25"))
+QUERY_PROFILING_ENABLED = _env_bool("QUERY_PROFILING_ENABLED", DEBUG)
+QUERY_BUDGET_COUNT = int(os.getenv("QUERY_BUDGET_COUNT", "30"))
+QUERY_BUDGET_MS = float(os.getenv("QUERY_BUDGET_MS", "200"))
+QUERY_DUPLICATE_THRESHOLD = int(os.getenv("QUERY_DUPLICATE_THRESHOLD", "3"))
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "").strip()
+OWNER_METRICS_DAYS = int(os.getenv("OWNER_METRICS_DAYS", "30"))
+PRICES_CACHE_TIMEOUT = int(os.getenv("PRICES_CACHE_TIMEOUT", str(60 * 60 * 24)))
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "2000"))
+HEALTH_TOKEN = os.getenv("HEALTH_TOKEN", METRICS_TOKEN).strip()
+HEALTH_MEDIA_MIN_FREE_MB = int(os.getenv("HEALTH_MEDIA_MIN_FREE_MB", "200"))
+
+LOG_LEVEL = os.getenv("DJANGO_LOG_LEVEL", "INFO").strip().upper()
+LOG_FORMAT = os.getenv("DJANGO_LOG_FORMAT", "text" if DEBUG else "json").strip().lower()
+LOG_QUEUE_SIZE = int(os.getenv("DJANGO_LOG_QUEUE_SIZE", "10000"))
+ACCESS_LOG_ENABLED = _env_bool("ACCESS_LOG_ENABLED", True)
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "filters": {"request_id": {"()": "base.logs.RequestIdFilter"}},
+    "formatters": {
+        "json": {"()": "base.logs.JsonFormatter"},
+        "text": {"format": "%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s"},
+    },
+    "handlers": {
+        "queue": {
+            # "()" rather than "class": on Python 3.12+ dictConfig treats any QueueHandler subclass
+            # given as "class" as a listener setup and requires a "handlers" list.
+            "()": "base.logs.NonBlockingQueueHandler",
+            "stream": "ext://sys.stdout",
+            "maxsize": LOG_QUEUE_SIZE,
+            "formatter": LOG_FORMAT if LOG_FORMAT in {"json", "text"} else "json",
+            "filters": ["request_id"],
+        },
+    },
+    "root": {"handlers": ["queue"], "level": LOG_LEVEL},
+    "loggers": {
+        # Replaces Django's console/mail_admins handlers; everything goes through the root queue.
+        "django": {"handlers": [], "level": LOG_LEVEL, "propagate": True},
+    },
+}
+
 if not DEBUG:
     SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
     SESSION_COOKIE_SECURE = True
     CSRF_COOKIE_SECURE = True
     SECURE_SSL_REDIRECT = True
+    # Probed over plain HTTP on the gunicorn bind by the watchdog.
+    SECURE_REDIRECT_EXEMPT = [r"^metrics/?$", r"^healthz/?$", r"^readyz/?$"]
     SECURE_HSTS_SECONDS = 31536000
     SECURE_HSTS_INCLUDE_SUBDOMAINS = True
     SECURE_HSTS_PRELOAD = True
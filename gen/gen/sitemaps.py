@@ -1,5 +1,9 @@
 from django.contrib.sitemaps import Sitemap
 from django.shortcuts import reverse
+from django.utils.http import urlencode
+
+from base.models import Article, ProductCategory
+from prices.models import PriceList
 
 
 class StaticViewSitemap(Sitemap):
@@ -22,3 +26,45 @@ class StaticViewSitemap(Sitemap):
 
     def location(self, item):
         return reverse(item)
+
+
+class ArticleSitemap(Sitemap):
+    changefreq = "weekly"
+    priority = 0.6
+
+    def items(self):
+        return Article.objects.filter(is_published=True).only("slug", "updated_at").order_by("-created_at")
+
+    def location(self, item):
+        return reverse("article_detail", args=[item.slug])
+
+    def lastmod(self, item):
+        return item.updated_at
+
+
+class ProductCategorySitemap(Sitemap):
+    changefreq = "weekly"
+    priority = 0.5
+
+    def items(self):
+        return ProductCategory.objects.filter(is_active=True).only("slug", "updated_at").order_by("name")
+
+    def location(self, item):
+        return f"{reverse('shop')}?{urlencode({'category': item.slug})}"
+
+    def lastmod(self, item):
+        return item.updated_at
+
+
+class PriceListSitemap(Sitemap):
+    changefreq = "monthly"
+    priority = 0.7
+
+    def items(self):
+        return PriceList.objects.filter(is_published=True).only("slug", "updated_at").order_by("title")
+
+    def location(self, item):
+        return reverse("price_list", args=[item.slug])
+
+    def lastmod(self, item):
+        return item.updated_at
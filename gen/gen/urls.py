@@ -1,18 +1,33 @@
 from django.conf import settings
 from django.conf.urls.static import static
-from django.contrib.sitemaps.views import sitemap
+from django.contrib.sitemaps.views import index, sitemap
 from django.urls import include, path
 
-from gen.sitemaps import StaticViewSitemap
+from base.sitemap_cache import cached_sitemap
+from gen.sitemaps import ArticleSitemap, PriceListSitemap, ProductCategorySitemap, StaticViewSitemap
 
 sitemaps = {
     "static": StaticViewSitemap,
+    "articles": ArticleSitemap,
+    "categories": ProductCategorySitemap,
+    "prices": PriceListSitemap,
 }
 
 urlpatterns = [
     path("", include("base.urls")),
     path("prices/", include("prices.urls")),
-    path("sitemap.xml", sitemap, {"sitemaps": sitemaps}, name="sitemap"),
+    path(
+        "sitemap.xml",
+        cached_sitemap(index),
+        {"sitemaps": sitemaps, "sitemap_url_name": "sitemap_section"},
+        name="sitemap",
+    ),
+    path(
+        "sitemap-<section>.xml",
+        cached_sitemap(sitemap),
+        {"sitemaps": sitemaps},
+        name="sitemap_section",
+    ),
 ]
 
 if settings.DEBUG:
@@ -0,0 +1,27 @@
+import os
+import shutil
+
+
+def on_starting(server):
+    # Worker metric files from a previous run would be merged into the new totals.
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if path:
+        shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker):
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
+
+
+def post_worker_init(worker):
+    from base.health import warm_up
+
+    # A failed warm-up must not keep the worker from serving; the first request just pays for it.
+    try:
+        warm_up()
+    except Exception:
+        worker.log.exception("Worker warm-up failed")
@@ -1,3 +1,36 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import PriceItem, PriceList, PriceSection, Unit
+
+
+class PriceSectionInline(admin.TabularInline):
+    model = PriceSection
+    extra = 0
+    show_change_link = True
+
+
+class PriceItemInline(admin.TabularInline):
+    model = PriceItem
+    extra = 0
+    fields = ("name", "price_from", "price_to", "unit", "note", "is_active", "sort_order")
+
+
+@admin.register(PriceList)
+class PriceListAdmin(admin.ModelAdmin):
+    list_display = ("title", "slug", "is_published", "updated_at")
+    list_filter = ("is_published",)
+    search_fields = ("title", "heading")
+    prepopulated_fields = {"slug": ("title",)}
+    inlines = [PriceSectionInline]
+
+
+@admin.register(PriceSection)
+class PriceSectionAdmin(admin.ModelAdmin):
+    list_display = ("__str__", "price_list", "sort_order")
+    list_filter = ("price_list",)
+    inlines = [PriceItemInline]
+
+
+@admin.register(Unit)
+class UnitAdmin(admin.ModelAdmin):
+    list_display = ("name", "short_name")
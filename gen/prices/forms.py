@@ -0,0 +1,82 @@
+from django import forms
+from django.forms import inlineformset_factory, modelformset_factory
+
+from .models import PriceItem, PriceList, PriceSection, Unit
+
+
+class PriceListForm(forms.ModelForm):
+    class Meta:
+        model = PriceList
+        fields = (
+            "title",
+            "heading",
+            "intro",
+            "footer_heading",
+            "footer",
+            "item_column",
+            "currency",
+            "currency_short",
+            "is_published",
+        )
+        widgets = {
+            "title": forms.TextInput(attrs={"class": "inputf1"}),
+            "heading": forms.TextInput(attrs={"class": "inputf1"}),
+            "intro": forms.Textarea(attrs={"class": "inputf1", "rows": 3}),
+            "footer_heading": forms.TextInput(attrs={"class": "inputf1"}),
+            "footer": forms.Textarea(attrs={"class": "inputf1", "rows": 3}),
+            "item_column": forms.TextInput(attrs={"class": "inputf1"}),
+            "currency": forms.TextInput(attrs={"class": "inputf1"}),
+            "currency_short": forms.TextInput(attrs={"class": "inputf1"}),
+            "is_published": forms.CheckboxInput(attrs={"class": "checkf1"}),
+        }
+
+
+PriceSectionFormSet = inlineformset_factory(
+    PriceList,
+    PriceSection,
+    fields=("title", "sort_order"),
+    widgets={
+        "title": forms.TextInput(attrs={"class": "inputf1"}),
+        "sort_order": forms.NumberInput(attrs={"class": "inputf1"}),
+    },
+    extra=1,
+    can_delete=True,
+)
+
+
+class PriceItemForm(forms.ModelForm):
+    class Meta:
+        model = PriceItem
+        fields = ("section", "name", "price_from", "price_to", "unit", "note", "is_active", "sort_order")
+        widgets = {
+            "section": forms.Select(attrs={"class": "inputf1"}),
+            "name": forms.TextInput(attrs={"class": "inputf1"}),
+            "price_from": forms.NumberInput(attrs={"class": "inputf1", "step": "0.01", "min": "0"}),
+            "price_to": forms.NumberInput(attrs={"class": "inputf1", "step": "0.01", "min": "0"}),
+            "unit": forms.Select(attrs={"class": "inputf1"}),
+            "note": forms.TextInput(attrs={"class": "inputf1"}),
+            "is_active": forms.CheckboxInput(attrs={"class": "checkf1"}),
+            "sort_order": forms.NumberInput(attrs={"class": "inputf1"}),
+        }
+        labels = {"section": "Раздел", "is_active": "Показывать", "sort_order": "Порядок"}
+
+    def __init__(self, *args, sections=(), units=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        # Choices come from lists loaded once by the view; otherwise every row queries sections and units.
+        self._limit_choices("section", PriceSection, sections)
+        self._limit_choices("unit", Unit, units)
+
+    def _limit_choices(self, name: str, model, objects) -> None:
+        field = self.fields[name]
+        field.queryset = model.objects.filter(pk__in=[obj.pk for obj in objects])
+        field.choices = [("", field.empty_label), *[(obj.pk, str(obj)) for obj in objects]]
+
+    def clean(self):
+        cleaned = super().clean()
+        price_from, price_to = cleaned.get("price_from"), cleaned.get("price_to")
+        if price_from is not None and price_to is not None and price_from > price_to:
+            self.add_error("price_to", "Цена «до» меньше цены «от».")
+        return cleaned
+
+
+PriceItemFormSet = modelformset_factory(PriceItem, form=PriceItemForm, extra=3, can_delete=True)
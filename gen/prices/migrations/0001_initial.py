@@ -0,0 +1,83 @@
+# Generated by Django 5.1.3 on 2026-10-19 06:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PriceList',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('slug', models.SlugField(max_length=100, unique=True, verbose_name='Slug')),
+                ('title', models.CharField(max_length=200, verbose_name='Заголовок страницы')),
+                ('heading', models.CharField(max_length=200, verbose_name='Заголовок прайса')),
+                ('intro', models.TextField(blank=True, verbose_name='Текст перед таблицей')),
+                ('footer_heading', models.CharField(blank=True, max_length=200, verbose_name='Заголовок после таблицы')),
+                ('footer', models.TextField(blank=True, verbose_name='Текст после таблицы')),
+                ('item_column', models.CharField(default='Услуга', max_length=60, verbose_name='Колонка услуги')),
+                ('currency', models.CharField(default='BYN', max_length=10, verbose_name='Валюта')),
+                ('currency_short', models.CharField(default='р', max_length=10, verbose_name='Валюта (кратко)')),
+                ('is_published', models.BooleanField(default=True, verbose_name='Опубликован')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Прайс-лист',
+                'verbose_name_plural': 'Прайс-листы',
+                'ordering': ('title',),
+            },
+        ),
+        migrations.CreateModel(
+            name='Unit',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=60, unique=True, verbose_name='Название')),
+                ('short_name', models.CharField(max_length=20, verbose_name='Сокращение')),
+            ],
+            options={
+                'verbose_name': 'Единица измерения',
+                'verbose_name_plural': 'Единицы измерения',
+                'ordering': ('name',),
+            },
+        ),
+        migrations.CreateModel(
+            name='PriceSection',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(blank=True, max_length=200, verbose_name='Название раздела')),
+                ('sort_order', models.PositiveSmallIntegerField(default=0)),
+                ('price_list', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sections', to='prices.pricelist')),
+            ],
+            options={
+                'verbose_name': 'Раздел прайса',
+                'verbose_name_plural': 'Разделы прайса',
+                'ordering': ('sort_order', 'id'),
+            },
+        ),
+        migrations.CreateModel(
+            name='PriceItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, verbose_name='Услуга')),
+                ('price_from', models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True, verbose_name='Цена от')),
+                ('price_to', models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True, verbose_name='Цена до')),
+                ('note', models.CharField(blank=True, default='Договорная', max_length=60, verbose_name='Текст вместо цены')),
+                ('is_active', models.BooleanField(default=True)),
+                ('sort_order', models.PositiveSmallIntegerField(default=0)),
+                ('section', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='items', to='prices.pricesection')),
+                ('unit', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='items', to='prices.unit', verbose_name='Единица')),
+            ],
+            options={
+                'verbose_name': 'Позиция прайса',
+                'verbose_name_plural': 'Позиции прайса',
+                'ordering': ('sort_order', 'id'),
+            },
+        ),
+    ]
@@ -0,0 +1,92 @@
+from decimal import Decimal
+
+from django.db import migrations
+
+ITEMS = [
+    ("Монтажные работы по установке газового котла", 200, None),
+    ("Монтажные работы по установке твердотопливного котла", 300, None),
+    ("Монтаж настенного электрического котла до 24 кВт", 200, None),
+    ("Монтаж и гидравлическая обвязка бойлера (водонагревателя) до 100 л", 80, None),
+    ("Монтаж и гидравлическая обвязка бойлера (водонагревателя) 100-1000 л", None, None),
+    ("Монтаж расширительного бака", 50, None),
+    ("Монтаж или замена одиночного циркуляционного насоса", 50, None),
+    ("Монтаж насосно-смесительного узла", 50, None),
+    ("Монтаж гидроразделителя или коллектора системы отопления", 200, None),
+    ("Монтаж утепленного дымохода", 60, None),
+    ("Монтаж радиатора отопления однотрубная система (ленинградка)", 150, None),
+    ("Монтаж радиатора отопления двухтрубная или трехтрубная система (тихельмана)", 180, None),
+    ("Монтаж радиатора отопления (квартира биметалл)", 150, None),
+    ("Монтаж термостата", 50, None),
+    ("Монтаж коллетора теплого пола", 100, None),
+    ("Монтаж теплого пола", 10, "m2"),
+    ("Монтаж пеноплекса под теплый пол", 4, "m2"),
+    ("Монтаж стиральной машины", 60, None),
+    ("Монтажные работы по установке газовой колонки", 180, None),
+    ("Установка фильтра для питьевой воды", 60, None),
+    ("Установка кухонной мойки", 90, None),
+    ("Установка раковины и смесителя", 120, None),
+    ("Установка смесителя", 40, None),
+    ("Установка ванны", 100, None),
+    ("Заправка теплоносителя и опрессовка системы", 100, None),
+    ("Установка душевой кабины", 200, None),
+    ("Установка унитаза", 80, None),
+    ("Промывка системы отопления", 200, None),
+    ("Промывка теплообменника котла кислотой", 80, None),
+    ("Установка насосной станции", 100, None),
+]
+
+
+def seed_santehnika(apps, schema_editor):
+    Unit = apps.get_model("prices", "Unit")
+    PriceList = apps.get_model("prices", "PriceList")
+    PriceSection = apps.get_model("prices", "PriceSection")
+    PriceItem = apps.get_model("prices", "PriceItem")
+
+    square_meter, _ = Unit.objects.get_or_create(name="Квадратный метр", defaults={"short_name": "м²"})
+    price_list, _ = PriceList.objects.update_or_create(
+        slug="santehnika",
+        defaults={
+            "title": "Цены на сантехнику",
+            "heading": "Цены на услуги сантехники",
+            "intro": (
+                "Мы оказываем услуги в сфере монтажа отопительных, водопроводных и канализационных систем, "
+                "а так же продаже сопутствующих материалов. Осуществляем выезд на районы и область. "
+                "Мы готовы поддержать вас и взять решение многих сложных инжиниринговых вопросов на себя."
+            ),
+            "footer_heading": "Монтаж систем отопления под ключ в Витебске",
+            "footer": (
+                "Наш профиль - монтаж систем отопления под ключ. Мы с 2007 года устанавливаем тепловое "
+                "оборудование в частных домах и коттеджах жителей Витебска, а также обслуживаем теплосистемы "
+                "с котлами индивидуального обогрева разных брендов, типов и ценовых категорий. "
+                "Воспользовавшись нашей услугой монтажа \"под ключ\" вы получите гарантированно высокий "
+                "результат и долгосрочную работу вашего оборудования."
+            ),
+            "currency": "BYN",
+            "currency_short": "р",
+        },
+    )
+    section, _ = PriceSection.objects.get_or_create(price_list=price_list, sort_order=0)
+    if section.items.exists():
+        return
+    PriceItem.objects.bulk_create(
+        [
+            PriceItem(
+                section=section,
+                name=name,
+                price_from=Decimal(price) if price is not None else None,
+                unit=square_meter if unit == "m2" else None,
+                sort_order=idx,
+            )
+            for idx, (name, price, unit) in enumerate(ITEMS)
+        ]
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("prices", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_santehnika, migrations.RunPython.noop),
+    ]
@@ -1,3 +1,116 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
 
-# Create your models here.
+from base.sitemap_cache import bump_sitemap_version
+
+
+class Unit(models.Model):
+    name = models.CharField("Название", max_length=60, unique=True)
+    short_name = models.CharField("Сокращение", max_length=20)
+
+    class Meta:
+        verbose_name = "Единица измерения"
+        verbose_name_plural = "Единицы измерения"
+        ordering = ("name",)
+
+    def __str__(self) -> str:
+        return self.short_name
+
+
+class PriceList(models.Model):
+    slug = models.SlugField("Slug", max_length=100, unique=True)
+    title = models.CharField("Заголовок страницы", max_length=200)
+    heading = models.CharField("Заголовок прайса", max_length=200)
+    intro = models.TextField("Текст перед таблицей", blank=True)
+    footer_heading = models.CharField("Заголовок после таблицы", max_length=200, blank=True)
+    footer = models.TextField("Текст после таблицы", blank=True)
+    item_column = models.CharField("Колонка услуги", max_length=60, default="Услуга")
+    currency = models.CharField("Валюта", max_length=10, default="BYN")
+    currency_short = models.CharField("Валюта (кратко)", max_length=10, default="р")
+    is_published = models.BooleanField("Опубликован", default=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Прайс-лист"
+        verbose_name_plural = "Прайс-листы"
+        ordering = ("title",)
+
+    def __str__(self) -> str:
+        return self.title
+
+    @property
+    def cache_version(self) -> str:
+        return self.updated_at.strftime("%Y%m%d%H%M%S%f")
+
+
+class PriceSection(models.Model):
+    price_list = models.ForeignKey(PriceList, on_delete=models.CASCADE, related_name="sections")
+    title = models.CharField("Название раздела", max_length=200, blank=True)
+    sort_order = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Раздел прайса"
+        verbose_name_plural = "Разделы прайса"
+        ordering = ("sort_order", "id")
+
+    def __str__(self) -> str:
+        return self.title or f"{self.price_list} #{self.sort_order}"
+
+
+class PriceItem(models.Model):
+    section = models.ForeignKey(PriceSection, on_delete=models.CASCADE, related_name="items")
+    name = models.CharField("Услуга", max_length=255)
+    price_from = models.DecimalField("Цена от", max_digits=12, decimal_places=2, null=True, blank=True)
+    price_to = models.DecimalField("Цена до", max_digits=12, decimal_places=2, null=True, blank=True)
+    unit = models.ForeignKey(
+        Unit,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="items",
+        verbose_name="Единица",
+    )
+    note = models.CharField("Текст вместо цены", max_length=60, blank=True, default="Договорная")
+    is_active = models.BooleanField(default=True)
+    sort_order = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Позиция прайса"
+        verbose_name_plural = "Позиции прайса"
+        ordering = ("sort_order", "id")
+
+    def __str__(self) -> str:
+        return self.name
+
+
+def touch_price_lists(queryset) -> None:
+    # Bumping updated_at changes cache_version, so rendered pages are rebuilt on next request.
+    if queryset.update(updated_at=timezone.now()):
+        bump_sitemap_version()
+
+
+@receiver(post_save, sender=PriceList)
+@receiver(post_delete, sender=PriceList)
+def invalidate_price_list_sitemap(sender, **kwargs):
+    bump_sitemap_version()
+
+
+@receiver(post_save, sender=PriceSection)
+@receiver(post_delete, sender=PriceSection)
+def touch_section_price_list(sender, instance, **kwargs):
+    touch_price_lists(PriceList.objects.filter(pk=instance.price_list_id))
+
+
+@receiver(post_save, sender=PriceItem)
+@receiver(post_delete, sender=PriceItem)
+def touch_item_price_list(sender, instance, **kwargs):
+    touch_price_lists(PriceList.objects.filter(sections__pk=instance.section_id))
+
+
+@receiver(post_save, sender=Unit)
+@receiver(pre_delete, sender=Unit)
+def touch_unit_price_lists(sender, instance, **kwargs):
+    # pre_delete: once the unit is gone its items no longer point at it.
+    touch_price_lists(PriceList.objects.filter(sections__items__unit_id=instance.pk))
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+
+from .models import PriceItem, PriceList, PriceSection
+
+
+def _amount(value: Decimal) -> str:
+    text = f"{value:.2f}".rstrip("0").rstrip(".")
+    return text.replace(".", ",")
+
+
+def format_price(item: PriceItem, currency: str) -> str:
+    if item.price_from is not None and item.price_to is not None:
+        label = f"{_amount(item.price_from)}–{_amount(item.price_to)} {currency}"
+    elif item.price_from is not None:
+        label = f"от {_amount(item.price_from)} {currency}"
+    elif item.price_to is not None:
+        label = f"до {_amount(item.price_to)} {currency}"
+    else:
+        return item.note
+    if item.unit:
+        label = f"{label} за {item.unit.short_name}"
+    return label
+
+
+def cache_key(price_list: PriceList) -> str:
+    return f"prices:list:{price_list.slug}:{price_list.cache_version}"
+
+
+def render_price_list(price_list: PriceList) -> str:
+    key = cache_key(price_list)
+    html = cache.get(key)
+    if html is None:
+        items = PriceItem.objects.filter(is_active=True).select_related("unit")
+        sections = PriceSection.objects.filter(price_list=price_list).prefetch_related(
+            Prefetch("items", queryset=items)
+        )
+        context = {
+            "price_list": price_list,
+            "sections": [
+                {
+                    "title": section.title,
+                    "rows": [
+                        (item.name, format_price(item, price_list.currency_short))
+                        for item in section.items.all()
+                    ],
+                }
+                for section in sections
+            ],
+        }
+        html = render_to_string("prices/partials/price_list_body.html", context)
+        cache.set(key, html, settings.PRICES_CACHE_TIMEOUT)
+    return mark_safe(html)
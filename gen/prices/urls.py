@@ -2,5 +2,5 @@ from django.urls import path
 from . import views
 
 urlpatterns = [
-    path('santehnika/', views.santehnika, name='santehnika-prices'),
+    path('<slug:slug>/', views.price_list, name='price_list'),
 ]
@@ -1,4 +1,14 @@
-from django.shortcuts import render, redirect
+from django.shortcuts import get_object_or_404, render
 
-def santehnika(request):
-    return render (request, "prices/santehnika.html")
\ No newline at end of file
+from .models import PriceList
+from .rendering import render_price_list
+
+
+def price_list(request, slug: str):
+    # Only the version lookup hits the database; the table itself comes from cache.
+    price_list = get_object_or_404(PriceList, slug=slug, is_published=True)
+    return render(
+        request,
+        "prices/price_list.html",
+        {"price_list": price_list, "body": render_price_list(price_list)},
+    )
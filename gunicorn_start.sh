@@ -4,8 +4,10 @@ set -euo pipefail
 
 cd /Users/server/projects/ilyin_stroy/gen
 source ../venv/bin/activate
+export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/ilyin_stroy_prometheus}"
 
 exec gunicorn gen.wsgi:application \
+  --config gunicorn.conf.py \
   --bind 127.0.0.1:8000 \
   --workers 2 \
   --timeout 120
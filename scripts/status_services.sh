@@ -19,7 +19,7 @@ for label in "${LABELS[@]}"; do
 done
 
 echo "HTTP checks:"
-for url in "http://127.0.0.1:8081/" "https://mastersvarki.com/"; do
+for url in "http://127.0.0.1:8000/healthz" "http://127.0.0.1:8081/" "https://mastersvarki.com/"; do
   code="$(curl -k -s -o /dev/null -w '%{http_code}' "$url" || true)"
   echo "${code} ${url}"
 done
@@ -47,6 +47,7 @@ fi
 "$VENV_DIR/bin/pip" install -r "$PROJECT_DIR/requirements.txt"
 "$VENV_DIR/bin/python" "$PROJECT_DIR/manage.py" migrate --noinput
 "$VENV_DIR/bin/python" "$PROJECT_DIR/manage.py" collectstatic --noinput
+"$VENV_DIR/bin/python" "$PROJECT_DIR/manage.py" optimize_static_images
 "$VENV_DIR/bin/python" "$PROJECT_DIR/manage.py" check
 mkdir -p "$PROJECT_DIR/media"
 
@@ -21,41 +21,73 @@ if [ -f "$ENV_FILE" ]; then
   set +a
 fi
 
+HEALTH_TIMEOUT="${WATCHDOG_HEALTH_TIMEOUT:-5}"
+BOT_HEARTBEAT_FILE="${TELEGRAM_BOT_HEARTBEAT_FILE:-${PROJECT_ROOT}/gen/telegram_bot.heartbeat}"
+BOT_HEARTBEAT_MAX_AGE="${TELEGRAM_BOT_HEARTBEAT_MAX_AGE:-180}"
+
+log() {
+  echo "$(date '+%Y-%m-%d %H:%M:%S') watchdog: $*" >&2
+}
+
+restart_job() {
+  local label="$1"
+  local plist="$2"
+  local uid
+  uid="$(id -u)"
+
+  if launchctl print "gui/${uid}/${label}" >/dev/null 2>&1; then
+    launchctl kickstart -k "gui/${uid}/${label}" >/dev/null 2>&1 || true
+  elif [ -f "$plist" ]; then
+    launchctl bootstrap "gui/${uid}" "$plist" >/dev/null 2>&1 || true
+    launchctl kickstart -k "gui/${uid}/${label}" >/dev/null 2>&1 || true
+  fi
+}
+
 is_port_listening() {
   local port="$1"
   lsof -nP -iTCP:"$port" -sTCP:LISTEN >/dev/null 2>&1
 }
 
-ensure_gunicorn() {
-  local uid
-  uid="$(id -u)"
+# Prints the HTTP status, or 000 when nothing answered within HEALTH_TIMEOUT.
+http_status() {
+  curl -s -o /dev/null -m "$HEALTH_TIMEOUT" -w '%{http_code}' "$1" 2>/dev/null || true
+}
+
+is_gunicorn_alive() {
+  local url="http://127.0.0.1:${GUNICORN_PORT}/healthz"
+  # One retry: a single slow answer under load is not worth dropping in-flight requests.
+  [ "$(http_status "$url")" = "200" ] && return 0
+  sleep 3
+  [ "$(http_status "$url")" = "200" ]
+}
 
-  if is_port_listening "$GUNICORN_PORT"; then
+ensure_gunicorn() {
+  local body
+
+  if is_port_listening "$GUNICORN_PORT" && is_gunicorn_alive; then
+    # Readiness failures (database, cache, disk, static manifest) are not fixed by a restart; report them.
+    local token="${HEALTH_TOKEN:-${METRICS_TOKEN:-}}"
+    if [ -n "$token" ] && ! body="$(curl -sS -m "$HEALTH_TIMEOUT" -H "Authorization: Bearer ${token}" \
+      -w ' HTTP %{http_code}' "http://127.0.0.1:${GUNICORN_PORT}/readyz" 2>&1)"; then
+      log "gunicorn readiness probe failed: ${body}"
+    elif [ -n "$token" ] && [ "${body##* HTTP }" != "200" ]; then
+      log "gunicorn is up but not ready: ${body}"
+    fi
     return 0
   fi
 
-  if launchctl print "gui/${uid}/${GUNICORN_LABEL}" >/dev/null 2>&1; then
-    launchctl kickstart -k "gui/${uid}/${GUNICORN_LABEL}" >/dev/null 2>&1 || true
-  elif [ -f "$GUNICORN_PLIST" ]; then
-    launchctl bootstrap "gui/${uid}" "$GUNICORN_PLIST" >/dev/null 2>&1 || true
-    launchctl kickstart -k "gui/${uid}/${GUNICORN_LABEL}" >/dev/null 2>&1 || true
-  fi
+  log "gunicorn is not answering /healthz; restarting"
+  restart_job "$GUNICORN_LABEL" "$GUNICORN_PLIST"
 }
 
 ensure_nginx() {
-  local uid
-  uid="$(id -u)"
-
-  if is_port_listening "$NGINX_PORT"; then
+  # Any HTTP answer means nginx itself works; a 502 here is gunicorn's problem.
+  if is_port_listening "$NGINX_PORT" && [ "$(http_status "http://127.0.0.1:${NGINX_PORT}/healthz")" != "000" ]; then
     return 0
   fi
 
-  if launchctl print "gui/${uid}/${NGINX_LABEL}" >/dev/null 2>&1; then
-    launchctl kickstart -k "gui/${uid}/${NGINX_LABEL}" >/dev/null 2>&1 || true
-  elif [ -f "$NGINX_PLIST" ]; then
-    launchctl bootstrap "gui/${uid}" "$NGINX_PLIST" >/dev/null 2>&1 || true
-    launchctl kickstart -k "gui/${uid}/${NGINX_LABEL}" >/dev/null 2>&1 || true
-  fi
+  log "nginx is not answering; restarting"
+  restart_job "$NGINX_LABEL" "$NGINX_PLIST"
 }
 
 is_launchd_job_running() {
@@ -73,40 +105,39 @@ is_telegram_bot_running() {
   is_launchd_job_running "$TELEGRAM_LABEL"
 }
 
-ensure_cloudflared() {
-  local uid
-  uid="$(id -u)"
+# Seconds since run_telegram_bot last completed a getUpdates cycle; empty if it never did.
+telegram_heartbeat_age() {
+  local mtime
+  [ -f "$BOT_HEARTBEAT_FILE" ] || return 0
+  # GNU stat first: on Linux `stat -f` also succeeds but prints filesystem info.
+  mtime="$(stat -c %Y "$BOT_HEARTBEAT_FILE" 2>/dev/null || stat -f %m "$BOT_HEARTBEAT_FILE" 2>/dev/null)" || return 0
+  echo $(( $(date +%s) - mtime ))
+}
 
+ensure_cloudflared() {
   if is_cloudflared_running; then
     return 0
   fi
 
-  if launchctl print "gui/${uid}/${CLOUDFLARED_LABEL}" >/dev/null 2>&1; then
-    launchctl kickstart -k "gui/${uid}/${CLOUDFLARED_LABEL}" >/dev/null 2>&1 || true
-  elif [ -f "$CLOUDFLARED_PLIST" ]; then
-    launchctl bootstrap "gui/${uid}" "$CLOUDFLARED_PLIST" >/dev/null 2>&1 || true
-    launchctl kickstart -k "gui/${uid}/${CLOUDFLARED_LABEL}" >/dev/null 2>&1 || true
-  fi
+  restart_job "$CLOUDFLARED_LABEL" "$CLOUDFLARED_PLIST"
 }
 
 ensure_telegram_bot() {
-  local uid
-  uid="$(id -u)"
+  local age
 
   if [ -z "${TELEGRAM_BOT_TOKEN:-}" ]; then
     return 0
   fi
 
   if is_telegram_bot_running; then
-    return 0
+    age="$(telegram_heartbeat_age)"
+    if [ -n "$age" ] && [ "$age" -le "$BOT_HEARTBEAT_MAX_AGE" ]; then
+      return 0
+    fi
+    log "telegram bot heartbeat is stale (${age:-missing}s); restarting"
   fi
 
-  if launchctl print "gui/${uid}/${TELEGRAM_LABEL}" >/dev/null 2>&1; then
-    launchctl kickstart -k "gui/${uid}/${TELEGRAM_LABEL}" >/dev/null 2>&1 || true
-  elif [ -f "$TELEGRAM_PLIST" ]; then
-    launchctl bootstrap "gui/${uid}" "$TELEGRAM_PLIST" >/dev/null 2>&1 || true
-    launchctl kickstart -k "gui/${uid}/${TELEGRAM_LABEL}" >/dev/null 2>&1 || true
-  fi
+  restart_job "$TELEGRAM_LABEL" "$TELEGRAM_PLIST"
 }
 
 cd "$PROJECT_ROOT"